@@ -22,12 +22,20 @@ def create_app():
     app.jinja_env.add_extension('jinja2.ext.do')
     
     # Importa e inicializa os módulos da aplicação
-    from . import game_state
+    from . import game_state, metrics, startup, static_assets, timings
     cache.init_app(app) 
+    timings.init_app(app)
+    metrics.init_app(app)
+    static_assets.init_app(app)
+    startup.init_app(app)
 
     # Roda a inicialização do estado do jogo uma única vez
     game_state.initialize_game_state()
 
+    # Manifesto dos personagens animados, em vez de um scan das pastas a cada pedido
+    from .services import animation_service
+    animation_service.build_manifest(app.static_folder)
+
     # Este processador de contexto injeta variáveis em todos os templates
     @app.context_processor
     def inject_global_vars():
@@ -40,6 +48,7 @@ def create_app():
             'current_chapter_fish': game_state.GAME_STATE.get('current_chapter_fish'),
             'current_ticket_icon_path': game_state.GAME_STATE.get('current_ticket_icon_path'),
             'current_start_date_gain_ticket': game_state.GAME_STATE.get('current_start_date_gain_ticket'),
+            'animated_characters_version': animation_service.get_manifest().version,
         }
 
     from . import routes
@@ -1,4 +1,5 @@
 # app/analysis.py
+import functools
 import logging
 from collections import defaultdict
 from datetime import timedelta
@@ -451,30 +452,38 @@ def process_npc_gifts(main_farm_data: dict):
 # ---> FIM DA FUNÇÃO PARA ANÁLISE DE PRESENTES DE NPCS ---
 
 # ---> FUNÇÃO PARA CRIAÇÃO DE CAMINHOS DINAMICOS DE IMAGENS ---
-def get_item_image_path(item_name: str) -> str:
-    """
-    Determina o caminho da imagem para um item consultando o mapa mestre de itens.
-    Esta abordagem é performática e robusta, pois o mapa é construído uma única vez.
-    """
-    if not item_name:
-        return "images/resources/unknown.webp"
-
-    # 1. Casos especiais que não se encaixam no mapeamento padrão
-    if item_name == "SFL":
-        return "images/resources/flower.webp"
-    if item_name == "Coins":
-        return "images/resources/coins.webp"
-    if item_name == "Gem":
-        return "images/resources/gem.webp"
-    if item_name == "Yield Fertiliser":
-        return "images/misc/increase_arrow.webp"
-    if item_name == "Time Fertiliser":
-        return "images/misc/stopwatch.webp"
-    if item_name == "Bee Swarm":
-        return "images/misc/bee.webp"
-    
-    if item_name == "Parsnip":
-        return "images/crops/parsnip.webp"
+_UNKNOWN_IMAGE_PATH = "images/resources/unknown.webp"
+
+# Casos especiais que não se encaixam no mapeamento padrão
+_SPECIAL_IMAGE_PATHS = {
+    "SFL": "images/resources/flower.webp",
+    "Coins": "images/resources/coins.webp",
+    "Gem": "images/resources/gem.webp",
+    "Yield Fertiliser": "images/misc/increase_arrow.webp",
+    "Time Fertiliser": "images/misc/stopwatch.webp",
+    "Bee Swarm": "images/misc/bee.webp",
+    "Parsnip": "images/crops/parsnip.webp",
+}
+
+# Mapeamento centralizado de categoria para a pasta de imagens correspondente
+_CATEGORY_TO_FOLDER = {
+    "Resource": "resources", "Crop": "crops", "Nodes": "nodes",
+    "Fish": "fish", "Flower": "flowers", "Seed": "seeds", "Fruit": "fruits",
+    "Tool": "tools", "Treasure": "treasure", "Building": "buildings",
+    "Food": "food", "Cake": "food/cakes", "Animal Product": "animal",
+    "Mushroom": "resources", "CompostWorm": "composters",
+    "AnimalFood": "animal_food", "AnimalMedicine": "animal_food",
+    "Fertiliser": "fertilisers", "GreenhouseCrop": "crops", "ExoticCrop": "crops",
+    "Misc": "misc",
+    "Collectibles": "collectables",
+}
+
+
+def _resolve_item_image_path(item_name: str):
+    """Caminho da imagem de um item conhecido, ou None se não houver regra para ele."""
+    special_path = _SPECIAL_IMAGE_PATHS.get(item_name)
+    if special_path is not None:
+        return special_path
 
     path_name = item_name.lower().replace(" ", "_")
 
@@ -482,35 +491,54 @@ def get_item_image_path(item_name: str) -> str:
     if item_id is not None:
         return f"images/wearables/{item_id}.webp"
 
-    # 2. Mapeamento centralizado de categoria para a pasta de imagens correspondente
-    CATEGORY_TO_FOLDER = {
-        "Resource": "resources", "Crop": "crops", "Nodes": "nodes",
-        "Fish": "fish", "Flower": "flowers", "Seed": "seeds", "Fruit": "fruits",
-        "Tool": "tools", "Treasure": "treasure", "Building": "buildings",
-        "Food": "food", "Cake": "food/cakes", "Animal Product": "animal",
-        "Mushroom": "resources", "CompostWorm": "composters",
-        "AnimalFood": "animal_food", "AnimalMedicine": "animal_food",
-        "Fertiliser": "fertilisers", "GreenhouseCrop": "crops", "ExoticCrop": "crops",
-        "Misc": "misc",
-        "Collectibles": "collectables",
-    }
-
-    # 3. Consulta ao mapa mestre para encontrar a categoria do item
+    # Consulta ao mapa mestre para encontrar a categoria do item
     category = item_map.MASTER_ITEM_MAP.get(item_name)
 
     if category:
         if category == "Food" and ("Cake" in item_name or foods_domain.CONSUMABLES_DATA.get(item_name, {}).get("building") == "Bakery"):
-            folder = CATEGORY_TO_FOLDER["Cake"]
+            folder = _CATEGORY_TO_FOLDER["Cake"]
         else:
-            folder = CATEGORY_TO_FOLDER.get(category, "resources")
-        
+            folder = _CATEGORY_TO_FOLDER.get(category, "resources")
         return f"images/{folder}/{path_name}.webp"
 
-    # 4. Fallbacks para itens não encontrados no mapa
-    if "Key" in item_name: return f"images/{CATEGORY_TO_FOLDER['Misc']}/{path_name}.webp"
-    if "Seed" in item_name: return f"images/{CATEGORY_TO_FOLDER['Seed']}/{path_name}.webp"
+    # Fallbacks para itens não encontrados no mapa
+    if "Key" in item_name: return f"images/{_CATEGORY_TO_FOLDER['Misc']}/{path_name}.webp"
+    if "Seed" in item_name: return f"images/{_CATEGORY_TO_FOLDER['Seed']}/{path_name}.webp"
+    return None
+
+
+# Tabela completa nome -> caminho, construída uma vez no arranque a partir dos
+# mesmos dados de domínio que `_resolve_item_image_path` consulta.
+_ITEM_IMAGE_PATHS = {
+    name: _resolve_item_image_path(name)
+    for name in (*item_map.MASTER_ITEM_MAP, *bumpkin_domain.ITEM_IDS, *_SPECIAL_IMAGE_PATHS)
+}
 
-    # 5. Default final para itens completamente desconhecidos
-    log.warning(f"Não foi possível determinar o caminho da imagem para o item '{item_name}'. Usando fallback para 'resources'.")
-    return f"images/resources/{path_name}.webp"
+
+@functools.lru_cache(maxsize=1024)
+def _unmapped_item_image_path(item_name: str) -> str:
+    """
+    Caminho para nomes fora da tabela. A memória limitada evita repetir o cálculo
+    (e o aviso no log) a cada chamada para o mesmo item desconhecido.
+    """
+    path = _resolve_item_image_path(item_name)
+    if path is None:
+        # Default final para itens completamente desconhecidos
+        log.warning(f"Não foi possível determinar o caminho da imagem para o item '{item_name}'. Usando fallback para 'resources'.")
+        path = f"images/resources/{item_name.lower().replace(' ', '_')}.webp"
+    return path
+
+
+def get_item_image_path(item_name: str) -> str:
+    """
+    Determina o caminho da imagem para um item consultando o mapa mestre de itens.
+    Os itens conhecidos são resolvidos com uma única consulta a uma tabela
+    pré-calculada; os restantes passam por uma cache limitada.
+    """
+    if not item_name:
+        return _UNKNOWN_IMAGE_PATH
+    path = _ITEM_IMAGE_PATHS.get(item_name)
+    if path is not None:
+        return path
+    return _unmapped_item_image_path(item_name)
 # ---> FIM FUNÇÃO PARA CRIAÇÃO DE CAMINHOS DINAMICOS DE IMAGENS ---
\ No newline at end of file
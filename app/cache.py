@@ -1,10 +1,169 @@
+import functools
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
 from flask_caching import Cache
+from flask_caching.backends.filesystemcache import FileSystemCache
+
+import config
+
+from . import metrics
+
+try:
+    import fcntl  # Disponível apenas em sistemas POSIX (onde o gunicorn corre).
+except ImportError:
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+
+# ==============================================================================
+# CACHE EM DOIS NÍVEIS: LRU EM MEMÓRIA À FRENTE DO FILESYSTEMCACHE
+# ==============================================================================
+
+class TwoTierCache(FileSystemCache):
+    """
+    FileSystemCache com um LRU em memória (por worker) à frente.
+
+    - Cada entrada em memória guarda o objeto já desserializado, a mesma expiração
+      do ficheiro e a "assinatura" do ficheiro (inode, mtime, tamanho).
+    - Num acerto em memória faz-se apenas um `stat` do ficheiro: se outro worker o
+      substituiu ou apagou, a entrada em memória é descartada. Assim, `delete` e
+      `clear` (em qualquer worker) invalidam os dois níveis.
+    - O limite é o total de bytes, usando o tamanho serializado do ficheiro como custo.
+
+    Os valores em memória são partilhados entre pedidos: quem os lê não os deve alterar.
+    """
+
+    def __init__(self, cache_dir: str, memory_max_bytes: int = 64 * 1024 * 1024, **kwargs):
+        # O nível em memória tem de existir antes: o construtor base já chama `set`.
+        self._memory_max_bytes = memory_max_bytes
+        self._memory = OrderedDict()  # chave -> (valor, expira_em, assinatura, bytes)
+        self._memory_bytes = 0
+        self._memory_lock = threading.Lock()
+        super().__init__(cache_dir, **kwargs)
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        kwargs["memory_max_bytes"] = config.get("CACHE_MEMORY_MAX_BYTES", 64 * 1024 * 1024)
+        return super().factory(app, config, args, kwargs)
+
+    # --- Nível em memória ---
+
+    @staticmethod
+    def _file_signature(filename: str):
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _memory_get(self, key: str):
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            self._memory.move_to_end(key)
+        value, expires, signature, _ = entry
+        if (expires == 0 or expires >= time.time()) and self._file_signature(self._get_filename(key)) == signature:
+            return value
+        self._memory_discard(key)
+        return None
+
+    def _memory_put(self, key: str, value, expires: int, signature):
+        if signature is None or signature[2] > self._memory_max_bytes:
+            self._memory_discard(key)
+            return
+        with self._memory_lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old[3]
+            self._memory[key] = (value, expires, signature, signature[2])
+            self._memory_bytes += signature[2]
+            while self._memory_bytes > self._memory_max_bytes:
+                evicted_key, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted[3]
+                metrics.inc("cache_evictions_total", prefix=metrics.cache_key_prefix(evicted_key))
+
+    def _memory_discard(self, key: str):
+        with self._memory_lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old[3]
+
+    def memory_stats(self) -> dict:
+        """Número de entradas e bytes ocupados pelo nível em memória deste worker."""
+        with self._memory_lock:
+            return {"entries": len(self._memory), "bytes": self._memory_bytes, "max_bytes": self._memory_max_bytes}
+
+    # --- API do cache ---
+
+    def get(self, key: str):
+        if key == self._fs_count_file:
+            return super().get(key)
+        value = self._memory_get(key)
+        if value is not None:
+            self._count_lookup(key, "hit_memory")
+            return value
+
+        filename = self._get_filename(key)
+        try:
+            with self._safe_stream_open(filename, "rb") as f:
+                signature = self._file_signature(filename)
+                expires = struct.unpack("I", f.read(4))[0]
+                if expires != 0 and expires < time.time():
+                    self._count_lookup(key, "miss")
+                    return None
+                value = self.serializer.load(f)
+        except FileNotFoundError:
+            self._count_lookup(key, "miss")
+            return None
+        except (OSError, EOFError, struct.error):
+            log.warning(f"Erro ao ler o ficheiro de cache '{filename}'.", exc_info=True)
+            self._count_lookup(key, "miss")
+            return None
+
+        # Se o ficheiro mudou durante a leitura, a assinatura não vai coincidir no
+        # próximo acesso e a entrada é lida de novo do disco.
+        self._memory_put(key, value, expires, signature)
+        self._count_lookup(key, "hit_disk")
+        return value
+
+    @staticmethod
+    def _count_lookup(key: str, result: str):
+        metrics.inc("cache_requests_total", prefix=metrics.cache_key_prefix(key), result=result)
+
+    def set(self, key: str, value, timeout=None, mgmt_element: bool = False) -> bool:
+        self._memory_discard(key)
+        stored = super().set(key, value, timeout, mgmt_element=mgmt_element)
+        if stored and not mgmt_element:
+            expires = self._normalize_timeout(timeout)
+            self._memory_put(key, value, expires, self._file_signature(self._get_filename(key)))
+        return stored
+
+    def delete(self, key: str, mgmt_element: bool = False) -> bool:
+        self._memory_discard(key)
+        return super().delete(key, mgmt_element=mgmt_element)
+
+    def clear(self) -> bool:
+        with self._memory_lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        return super().clear()
+
 
 # 1. Cria a instância do Cache, mas sem associá-la a uma aplicação ainda.
 cache = Cache(config={
-    "CACHE_TYPE": "FileSystemCache",
+    "CACHE_TYPE": "app.cache.TwoTierCache",
     "CACHE_DIR": "cache_dir",
-    "CACHE_DEFAULT_TIMEOUT": 300  # Tempo padrão de 5 minutos (em segundos)
+    "CACHE_DEFAULT_TIMEOUT": 300,  # Tempo padrão de 5 minutos (em segundos)
+    "CACHE_MEMORY_MAX_BYTES": config.CACHE_MEMORY_MAX_BYTES,
 })
 
 # 2. Cria uma função que será chamada para associar o cache à aplicação Flask.
@@ -14,3 +173,206 @@ def init_app(app):
     Isto é chamado a partir da factory da aplicação em __init__.py.
     """
     cache.init_app(app)
+
+
+# ==============================================================================
+# SINGLE-FLIGHT: UMA ÚNICA BUSCA NA ORIGEM POR CHAVE
+# ==============================================================================
+
+# Tempo máximo (segundos) que um worker espera pelo lock de outro worker antes
+# de seguir sozinho. Cobre o timeout das APIs mais as novas tentativas.
+SINGLE_FLIGHT_LOCK_TIMEOUT = 30
+_LOCK_POLL_INTERVAL = 0.05
+
+# Os locks usam um conjunto fixo de ficheiros, fora do diretório do cache (o
+# FileSystemCache trataria qualquer outro ficheiro como uma entrada). Cada chave
+# usa o ficheiro `MD5(chave) % SINGLE_FLIGHT_LOCK_FILES`: chaves diferentes podem
+# partilhar um lock, o que só as serializa.
+SINGLE_FLIGHT_LOCK_DIR = config.SINGLE_FLIGHT_LOCK_DIR
+SINGLE_FLIGHT_LOCK_FILES = config.SINGLE_FLIGHT_LOCK_FILES
+
+
+class _Flight:
+    """Uma busca em curso: os seguidores esperam no evento pelo resultado do líder."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+@contextmanager
+def _cross_worker_lock(key: str):
+    """
+    Lock exclusivo partilhado entre os workers através de um dos ficheiros de `SINGLE_FLIGHT_LOCK_DIR`.
+    Sem `fcntl` (ex: Windows) ou após `SINGLE_FLIGHT_LOCK_TIMEOUT`, segue sem lock.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    # O `hash()` do Python muda entre processos; o MD5 dá o mesmo ficheiro em todos os workers.
+    slot = int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big") % SINGLE_FLIGHT_LOCK_FILES
+    os.makedirs(SINGLE_FLIGHT_LOCK_DIR, exist_ok=True)
+    lock_file = open(os.path.join(SINGLE_FLIGHT_LOCK_DIR, f"{slot}.lock"), "a")
+    acquired = False
+    try:
+        deadline = time.monotonic() + SINGLE_FLIGHT_LOCK_TIMEOUT
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                acquired = True
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    log.warning(f"Timeout ao aguardar o lock entre workers para '{key}'. Seguindo sem lock.")
+                    break
+                time.sleep(_LOCK_POLL_INTERVAL)
+        yield
+    finally:
+        if acquired:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        lock_file.close()
+
+
+def single_flight(make_cache_key, lookup=None):
+    """
+    Decorador que garante uma única execução em curso por chave de cache.
+
+    Deve ficar por baixo do decorador de cache, para que só atue em falhas:
+        @cache.cached(make_cache_key=_key)
+        @single_flight(_key)
+        def fetch(...): ...
+
+    Dentro do worker, chamadas simultâneas com a mesma chave esperam pelo resultado
+    do primeiro chamador (líder). Entre workers, o líder obtém um lock de ficheiro e,
+    ao consegui-lo, volta a consultar o cache: se outro worker já o preencheu, usa
+    esse valor em vez de ir à origem.
+
+    Args:
+        make_cache_key (callable): Recebe os mesmos argumentos da função decorada e
+                                   devolve a mesma chave usada pelo decorador de cache.
+        lookup (callable, opcional): Recebe a chave e devolve o valor em cache ou None.
+                                     Por padrão, `cache.get`.
+    """
+    lookup = lookup or cache.get
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_cache_key(*args, **kwargs)
+
+            with _flights_lock:
+                flight = _flights.get(key)
+                is_leader = flight is None
+                if is_leader:
+                    flight = _Flight()
+                    _flights[key] = flight
+
+            if not is_leader:
+                log.debug(f"Aguardando busca já em curso para a chave '{key}'.")
+                flight.event.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+
+            try:
+                with _cross_worker_lock(key):
+                    cached_value = lookup(key)
+                    if cached_value is not None:
+                        log.debug(f"Chave '{key}' preenchida por outro worker durante a espera.")
+                        flight.result = cached_value
+                    else:
+                        flight.result = func(*args, **kwargs)
+            except Exception as e:
+                flight.error = e
+                raise
+            finally:
+                with _flights_lock:
+                    _flights.pop(key, None)
+                flight.event.set()
+            return flight.result
+        return wrapper
+    return decorator
+
+
+# ==============================================================================
+# STALE-WHILE-REVALIDATE: SERVE O ÚLTIMO VALOR BOM E ATUALIZA EM SEGUNDO PLANO
+# ==============================================================================
+
+_refreshing_keys = set()
+_refreshing_lock = threading.Lock()
+
+
+def _start_background_refresh(key: str, refresh):
+    """Dispara `refresh()` numa thread daemon, no máximo uma por chave neste worker."""
+    with _refreshing_lock:
+        if key in _refreshing_keys:
+            return
+        _refreshing_keys.add(key)
+
+    def run():
+        try:
+            refresh()
+        except Exception:
+            log.error(f"Falha na atualização em segundo plano da chave '{key}'.", exc_info=True)
+        finally:
+            with _refreshing_lock:
+                _refreshing_keys.discard(key)
+
+    threading.Thread(target=run, name=f"swr-{key}", daemon=True).start()
+
+
+def stale_while_revalidate(key: str, fresh_for: int, max_stale: int, is_valid=None):
+    """
+    Decorador de cache para funções sem argumentos que buscam dados de uma API.
+
+    - Até `fresh_for` segundos após a última atualização, devolve o valor em cache.
+    - Entre `fresh_for` e `max_stale`, devolve o valor antigo de imediato e
+      atualiza-o numa thread em segundo plano.
+    - Depois de `max_stale` (limite rígido), a entrada expira e a próxima chamada
+      espera pela busca, tal como numa falha de cache normal.
+
+    Apenas resultados aceites por `is_valid` são guardados, para que uma falha da
+    API nunca substitua o último valor bom. As buscas passam pelo `single_flight`.
+    A função decorada ganha o atributo `last_refreshed()`, que devolve o timestamp
+    (epoch, segundos) da última atualização bem-sucedida ou None.
+    """
+    def decorator(func):
+        def fresh_lookup(lookup_key):
+            envelope = cache.get(lookup_key)
+            if envelope is not None and time.time() - envelope["refreshed_at"] < fresh_for:
+                return envelope["value"]
+            return None
+
+        @single_flight(lambda: key, lookup=fresh_lookup)
+        def refresh():
+            value = func()
+            if is_valid is None or is_valid(value):
+                cache.set(key, {"value": value, "refreshed_at": time.time()}, timeout=max_stale)
+            return value
+
+        @functools.wraps(func)
+        def wrapper():
+            envelope = cache.get(key)
+            if envelope is not None:
+                age = time.time() - envelope["refreshed_at"]
+                if age < fresh_for:
+                    return envelope["value"]
+                if age < max_stale:
+                    log.debug(f"Servindo '{key}' com {age:.0f}s de idade; atualizando em segundo plano.")
+                    _start_background_refresh(key, refresh)
+                    return envelope["value"]
+            return refresh()
+
+        def last_refreshed():
+            envelope = cache.get(key)
+            return envelope["refreshed_at"] if envelope is not None else None
+
+        wrapper.last_refreshed = last_refreshed
+        return wrapper
+    return decorator
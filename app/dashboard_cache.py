@@ -0,0 +1,226 @@
+# app/dashboard_cache.py
+"""
+Cache do resultado das análises do painel (`routes.farm_dashboard`) e do HTML
+de cada painel pedido em separado (`routes.farm_dashboard_panel`).
+
+A chave combina:
+- o ID da fazenda;
+- um hash do conteúdo dos dados principal e secundário da fazenda;
+- a versão dos dados de domínio (hash dos ficheiros de domínio, serviços e configuração);
+- um intervalo de tempo (`ANALYSIS_CACHE_BUCKET_SECONDS`).
+
+Os campos que dependem da hora atual são tratados de duas formas:
+- Os mais baratos (VIP ativo, conclusão da expansão) continuam a ser calculados em
+  cada pedido, fora do cache.
+- Para os estados dos recursos ("Pronta", "Crescendo", ...), cada entrada guarda o
+  instante da próxima transição conhecida. A partir desse momento, a entrada deixa
+  de ser usada e as análises são refeitas.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+
+import config
+
+from . import timings
+from .cache import cache
+from .game_state import GAME_STATE
+
+log = logging.getLogger(__name__)
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Ficheiros cujo conteúdo altera o resultado das análises.
+_VERSIONED_PATHS = (
+    os.path.join(_APP_DIR, "domain"),
+    os.path.join(_APP_DIR, "services"),
+    os.path.join(_APP_DIR, "analysis.py"),
+    os.path.join(_APP_DIR, "routes.py"),
+    os.path.join(os.path.dirname(_APP_DIR), "config.py"),
+)
+
+# Chaves do contexto preenchidas antes das análises e passadas como entrada.
+_INPUT_KEYS = ("current_land_level", "current_land_type", "expansion_construction_info")
+
+# Campos de dados da fazenda que marcam uma mudança de estado ao longo do tempo.
+_TRANSITION_KEYS = ("ready_at_timestamp_ms", "readyAt")
+
+_domain_version = None
+
+
+def get_domain_version() -> str:
+    """Hash (calculado uma vez por processo) do código e dados que alimentam as análises."""
+    global _domain_version
+    if _domain_version is None:
+        digest = hashlib.blake2b(digest_size=8)
+        for base in _VERSIONED_PATHS:
+            if os.path.isdir(base):
+                files = sorted(
+                    os.path.join(root, name)
+                    for root, _, names in os.walk(base)
+                    for name in names if name.endswith(".py")
+                )
+            else:
+                files = [base]
+            for path in files:
+                with open(path, "rb") as f:
+                    digest.update(os.path.relpath(path, _APP_DIR).encode("utf-8"))
+                    digest.update(f.read())
+        _domain_version = digest.hexdigest()
+    return _domain_version
+
+
+def _payload_hash(main_farm_data: dict, secondary_farm_data: dict) -> str:
+    payload = json.dumps([main_farm_data, secondary_farm_data], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _key_suffix(farm_id, main_farm_data: dict, secondary_farm_data: dict, now: float) -> str:
+    time_bucket = int(now // config.ANALYSIS_CACHE_BUCKET_SECONDS)
+    return (
+        f"{farm_id}_{_payload_hash(main_farm_data, secondary_farm_data)}"
+        f"_{get_domain_version()}_{GAME_STATE.get('current_season_name')}_{time_bucket}"
+    )
+
+
+def _analysis_cache_key(farm_id, main_farm_data: dict, secondary_farm_data: dict, now: float) -> str:
+    return f"analysis_{_key_suffix(farm_id, main_farm_data, secondary_farm_data, now)}"
+
+
+def _panel_cache_key(panel: str, farm_id, main_farm_data: dict, secondary_farm_data: dict, now: float) -> str:
+    return f"panel_{panel}_{_key_suffix(farm_id, main_farm_data, secondary_farm_data, now)}"
+
+
+def _next_transition_ms(value, now_ms: int, earliest=None):
+    """Procura, recursivamente, o menor timestamp de transição ainda no futuro."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in _TRANSITION_KEYS and isinstance(item, (int, float)) and item > now_ms:
+                earliest = item if earliest is None else min(earliest, item)
+            elif isinstance(item, (dict, list, tuple)):
+                earliest = _next_transition_ms(item, now_ms, earliest)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            earliest = _next_transition_ms(item, now_ms, earliest)
+    return earliest
+
+
+def _valid_until_ms(analysis_context: dict, main_farm_data: dict, now_ms: int):
+    """Instante (ms) a partir do qual um resultado calculado agora deixa de ser válido, ou None."""
+    valid_until_ms = _next_transition_ms([analysis_context, main_farm_data.get("expansionConstruction")], now_ms)
+    # O fim da VIP também altera as análises (ex: recompensas das tarefas e entregas).
+    vip_expires_at = (main_farm_data.get("vip") or {}).get("expiresAt")
+    if isinstance(vip_expires_at, (int, float)) and vip_expires_at > now_ms:
+        valid_until_ms = vip_expires_at if valid_until_ms is None else min(valid_until_ms, vip_expires_at)
+    return valid_until_ms
+
+
+def _get_or_build(key: str, farm_id, main_farm_data: dict, now: float, build, description: str):
+    """
+    Devolve o valor guardado em `key` enquanto for válido; caso contrário chama
+    `build()`, que devolve `(valor, contexto_das_análises)`, e guarda o valor até à
+    próxima transição encontrada no contexto das análises.
+    """
+    now_ms = int(now * 1000)
+    with timings.measure("cache.analysis"):
+        entry = cache.get(key)
+    if entry is not None and (entry["valid_until_ms"] is None or now_ms < entry["valid_until_ms"]):
+        log.info(f"{description} da fazenda #{farm_id}: resultado servido do cache.")
+        return entry["value"]
+
+    start_time = time.time()
+    value, analysis_context = build()
+    # Os recursos já prontos têm como transição o instante em que foram analisados,
+    # posterior a `now`; só as transições depois do fim do cálculo contam.
+    valid_until_ms = _valid_until_ms(analysis_context, main_farm_data, int(time.time() * 1000))
+
+    try:
+        cache.set(
+            key, {"value": value, "valid_until_ms": valid_until_ms},
+            timeout=config.ANALYSIS_CACHE_BUCKET_SECONDS
+        )
+    except Exception as e:
+        # Um resultado que não possa ser serializado não impede a página de ser gerada.
+        log.warning(f"{description} da fazenda #{farm_id}: não foi possível guardar o resultado no cache: {e}")
+    log.info(f"{description} da fazenda #{farm_id}: resultado calculado em {time.time() - start_time:.3f}s.")
+    return value
+
+
+def _run_compute(farm_id, main_farm_data: dict, secondary_farm_data: dict, context: dict, compute) -> dict:
+    """Executa `compute` sobre uma cópia das entradas e devolve só as chaves que as análises escreveram."""
+    analysis_context = {key: context.get(key) for key in _INPUT_KEYS}
+    compute(farm_id, main_farm_data, secondary_farm_data, analysis_context)
+    for key in _INPUT_KEYS:
+        analysis_context.pop(key, None)
+    return analysis_context
+
+
+def get_dashboard_analysis(farm_id, main_farm_data: dict, secondary_farm_data: dict, context: dict, compute) -> dict:
+    """
+    Devolve as entradas de contexto produzidas pelas análises do painel, do cache
+    quando possível.
+
+    Args:
+        farm_id (int): ID da fazenda.
+        main_farm_data (dict): Dados da API principal.
+        secondary_farm_data (dict): Dados da API da sfl.world.
+        context (dict): Contexto do painel com os dados gerais já processados.
+        compute (callable): `compute(farm_id, main, secondary, analysis_context)`, que
+                            escreve os resultados das análises em `analysis_context`.
+
+    Retorna:
+        dict: Entradas a juntar ao contexto do template. Não devem ser alteradas,
+              pois podem ser partilhadas com outros pedidos.
+    """
+    def build():
+        analysis_context = _run_compute(farm_id, main_farm_data, secondary_farm_data, context, compute)
+        return analysis_context, analysis_context
+
+    if not config.ANALYSIS_CACHE_ENABLED:
+        return build()[0]
+
+    now = time.time()
+    try:
+        key = _analysis_cache_key(farm_id, main_farm_data, secondary_farm_data, now)
+    except Exception as e:
+        log.warning(f"Não foi possível calcular a chave do cache de análises da fazenda #{farm_id}: {e}")
+        return build()[0]
+
+    return _get_or_build(key, farm_id, main_farm_data, now, build, "Análises")
+
+
+def get_panel_fragment(farm_id, panel: str, main_farm_data: dict, secondary_farm_data: dict,
+                       context: dict, compute, render) -> dict:
+    """
+    Devolve o HTML de um painel e o seu ETag, do cache quando possível.
+
+    Cada painel tem a sua entrada, com a mesma chave e validade das análises
+    completas, mas calculada só com os passos de que o painel precisa.
+
+    Args:
+        panel (str): Nome do painel (ver `routes.DASHBOARD_PANELS`).
+        compute (callable): Como em `get_dashboard_analysis`, limitado aos passos do painel.
+        render (callable): `render(analysis_context)`, que devolve o HTML do painel.
+
+    Retorna:
+        dict: {"html": str, "etag": str}
+    """
+    def build():
+        analysis_context = _run_compute(farm_id, main_farm_data, secondary_farm_data, context, compute)
+        html = render(analysis_context)
+        etag = hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()
+        return {"html": html, "etag": etag}, analysis_context
+
+    if not config.ANALYSIS_CACHE_ENABLED:
+        return build()[0]
+
+    now = time.time()
+    try:
+        key = _panel_cache_key(panel, farm_id, main_farm_data, secondary_farm_data, now)
+    except Exception as e:
+        log.warning(f"Não foi possível calcular a chave do cache do painel '{panel}' da fazenda #{farm_id}: {e}")
+        return build()[0]
+
+    return _get_or_build(key, farm_id, main_farm_data, now, build, f"Painel '{panel}'")
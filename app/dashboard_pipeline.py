@@ -0,0 +1,280 @@
+# app/dashboard_pipeline.py
+"""
+Executor dos passos de análise do painel como um grafo de dependências.
+
+Cada passo (`Step`) declara de que outros passos depende. Os passos prontos são
+executados num pool de threads limitado (`DASHBOARD_MAX_WORKERS`), cada um com o
+seu tempo máximo (`DASHBOARD_STEP_TIMEOUT`, contado desde que começa a correr), de
+modo que a latência do painel acompanha o caminho crítico em vez da soma de todos
+os passos.
+
+Regras de isolamento:
+- Um passo nunca escreve diretamente no contexto partilhado. Recebe um dicionário
+  próprio (`out`) e o executor junta-os no contexto, pela ordem de declaração,
+  depois de todos terminarem. Assim, um passo que exceda o tempo limite (e que
+  continua a correr na sua thread) não altera o resultado já devolvido.
+- Uma exceção ou um tempo limite excedido num passo é registado e o seu valor
+  passa a `None`; os passos dependentes correm na mesma, como acontecia com os
+  blocos try/except sequenciais.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, NamedTuple
+
+from flask import current_app, has_app_context
+
+import config
+
+from . import metrics
+from . import timings as request_timings
+
+log = logging.getLogger(__name__)
+
+
+class Step(NamedTuple):
+    """Um passo do painel: `run(out, deps)` preenche `out` e devolve o valor do passo."""
+    name: str
+    run: Callable[[dict, dict], Any]
+    depends_on: tuple = ()
+    timeout: float | None = None  # Segundos; None usa DASHBOARD_STEP_TIMEOUT
+
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Pool do processo atual, criado na primeira utilização (um por worker do gunicorn)."""
+    global _executor, _executor_pid
+    pid = os.getpid()
+    if _executor is None or _executor_pid != pid:
+        with _executor_lock:
+            if _executor is None or _executor_pid != pid:
+                _executor = ThreadPoolExecutor(
+                    max_workers=config.DASHBOARD_MAX_WORKERS, thread_name_prefix="dashboard-step"
+                )
+                _executor_pid = pid
+    return _executor
+
+
+def _validate(steps: list) -> None:
+    names = set()
+    for step in steps:
+        if step.name in names:
+            raise ValueError(f"Passo do painel duplicado: '{step.name}'.")
+        missing = [dep for dep in step.depends_on if dep not in names]
+        if missing:
+            # Exigir a declaração das dependências antes do passo garante que não há ciclos.
+            raise ValueError(f"O passo '{step.name}' depende de passos não declarados antes dele: {missing}.")
+        names.add(step.name)
+
+
+def select_steps(steps: list, names) -> list:
+    """
+    Subconjunto dos passos com os nomes dados e todas as suas dependências
+    (diretas e indiretas), pela ordem de declaração original.
+    """
+    by_name = {step.name: step for step in steps}
+    selected = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name in selected:
+            continue
+        if name not in by_name:
+            raise ValueError(f"Passo do painel desconhecido: '{name}'.")
+        selected.add(name)
+        pending.extend(by_name[name].depends_on)
+    return [step for step in steps if step.name in selected]
+
+
+def _call_step(step: Step, out: dict, deps: dict, app, started: list):
+    """
+    Executa o passo e devolve `(valor, tempo de CPU da thread)`. O instante em que
+    começa a correr (o pool é partilhado pelos pedidos do worker) fica em `started`.
+    """
+    started.append(time.perf_counter())
+    start_cpu = time.thread_time()
+    if app is None:
+        value = step.run(out, deps)
+    else:
+        with app.app_context():
+            value = step.run(out, deps)
+    return value, time.thread_time() - start_cpu
+
+
+def run_steps(steps: list, context: dict, label: str = "painel", on_step_done=None) -> dict:
+    """
+    Executa os passos respeitando as dependências e junta as saídas em `context`.
+
+    Args:
+        steps (list[Step]): Passos pela ordem de declaração (as dependências primeiro).
+        context (dict): Contexto onde as saídas (`out`) dos passos são escritas no fim.
+        label (str): Identificação usada nos logs.
+        on_step_done (callable, opcional): `on_step_done(nome, out)`, chamado na thread
+            que chamou `run_steps` assim que cada passo termina (com `out` vazio se falhou ou
+            excedeu o tempo). Usado pela renderização em streaming (ver `StepProgress`).
+
+    O tempo real e de CPU de cada passo é registado nas medições do pedido atual
+    (ver app/timings.py) como `step.<nome>`.
+
+    Retorna:
+        dict: O valor devolvido por cada passo (None se falhou ou excedeu o tempo).
+    """
+    _validate(steps)
+    values = {}
+    outputs = {}
+    timings = {}  # nome -> (wall, cpu); cpu é None se o passo excedeu o tempo
+
+    if config.DASHBOARD_MAX_WORKERS <= 1:
+        # Modo sequencial: mesma semântica, sem pool (útil para depuração).
+        for step in steps:
+            out = {}
+            start, start_cpu = time.perf_counter(), time.thread_time()
+            try:
+                values[step.name] = step.run(out, {dep: values.get(dep) for dep in step.depends_on})
+                outputs[step.name] = out
+            except Exception as e:
+                log.error(f"Falha no passo '{step.name}' do {label}: {e}", exc_info=True)
+                values[step.name] = None
+            timings[step.name] = (time.perf_counter() - start, time.thread_time() - start_cpu)
+            if on_step_done is not None:
+                on_step_done(step.name, outputs.get(step.name, {}))
+    else:
+        _run_parallel(steps, values, outputs, timings, label, on_step_done)
+
+    for step in steps:
+        context.update(outputs.get(step.name, {}))
+
+    recorder = request_timings.current()
+    for name, (wall, cpu) in timings.items():
+        metrics.observe("dashboard_step_duration_seconds", wall, step=name)
+        if recorder is not None:
+            recorder.record(f"step.{name}", wall, cpu)
+
+    if log.isEnabledFor(logging.DEBUG):
+        slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:5]
+        log.debug(f"Passos mais lentos do {label}: " + ", ".join(f"{name}={wall:.3f}s" for name, (wall, _) in slowest))
+    return values
+
+
+def _run_parallel(steps: list, values: dict, outputs: dict, timings: dict, label: str, on_step_done=None) -> None:
+    executor = _get_executor()
+    app = current_app._get_current_object() if has_app_context() else None
+
+    pending = list(steps)
+    finished = set()
+    running = {}      # future -> (step, out, [início], tempo limite); o início só existe quando o passo começa
+    abandoned = set()  # futures que excederam o tempo e ainda ocupam uma thread
+
+    while pending or running:
+        abandoned = {future for future in abandoned if not future.done()}
+        free_slots = config.DASHBOARD_MAX_WORKERS - len(running) - len(abandoned)
+
+        # Submete os passos cujas dependências já terminaram, pela ordem de declaração.
+        for step in list(pending):
+            if free_slots <= 0:
+                break
+            if all(dep in finished for dep in step.depends_on):
+                pending.remove(step)
+                out = {}
+                deps = {dep: values.get(dep) for dep in step.depends_on}
+                timeout = step.timeout if step.timeout is not None else config.DASHBOARD_STEP_TIMEOUT
+                started = []
+                future = executor.submit(_call_step, step, out, deps, app, started)
+                running[future] = (step, out, started, timeout)
+                free_slots -= 1
+
+        if not running:
+            # Só acontece se todas as threads estiverem presas em passos abandonados. Se
+            # nenhuma se libertar dentro do tempo limite, os passos restantes são ignorados.
+            done, _ = wait(abandoned, timeout=config.DASHBOARD_STEP_TIMEOUT, return_when=FIRST_COMPLETED)
+            if not done:
+                for step in pending:
+                    log.error(f"O passo '{step.name}' do {label} não chegou a correr (threads ocupadas por passos que excederam o tempo) e foi ignorado.")
+                    values[step.name] = None
+                    finished.add(step.name)
+                    if on_step_done is not None:
+                        on_step_done(step.name, {})
+                pending.clear()
+            continue
+
+        # O prazo de cada passo conta a partir do momento em que começa a correr. Para um
+        # passo ainda na fila, o prazo mais cedo possível é agora + tempo limite.
+        now = time.perf_counter()
+        next_deadline = min(
+            (started[0] if started else now) + timeout for _, _, started, timeout in running.values()
+        )
+        done, _ = wait(list(running), timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED)
+
+        now = time.perf_counter()
+        for future in list(running):
+            step, out, started, timeout = running[future]
+            start = started[0] if started else now
+            deadline = start + timeout
+            if future in done:
+                del running[future]
+                try:
+                    values[step.name], cpu = future.result()
+                    outputs[step.name] = out
+                except Exception as e:
+                    log.error(f"Falha no passo '{step.name}' do {label}: {e}", exc_info=True)
+                    values[step.name], cpu = None, None
+                timings[step.name] = (now - start, cpu)
+                finished.add(step.name)
+                if on_step_done is not None:
+                    on_step_done(step.name, outputs.get(step.name, {}))
+            elif now >= deadline:
+                del running[future]
+                abandoned.add(future)
+                timings[step.name] = (now - start, None)
+                log.error(f"O passo '{step.name}' do {label} excedeu o tempo limite de {timeout:.1f}s e foi ignorado.")
+                values[step.name] = None
+                finished.add(step.name)
+                if on_step_done is not None:
+                    on_step_done(step.name, {})
+
+
+class StepProgress:
+    """
+    Estado partilhado entre a thread que executa os passos e quem espera por eles
+    (ex: a renderização em streaming, que escreve cada painel assim que os seus
+    passos terminam).
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._outputs = {}
+        self._result = None  # Contexto completo, quando todos os passos terminaram
+
+    def step_done(self, name: str, out: dict) -> None:
+        with self._condition:
+            self._outputs[name] = out
+            self._condition.notify_all()
+
+    def finish(self, result: dict) -> None:
+        """Marca a execução como terminada; `result` é o contexto completo das análises."""
+        with self._condition:
+            self._result = result
+            self._condition.notify_all()
+
+    def wait_for(self, names) -> dict:
+        """
+        Espera que os passos indicados terminem e devolve as saídas deles. Se a
+        execução terminar antes (ex: resultado vindo do cache), devolve o contexto
+        completo. Quem executa os passos tem de chamar sempre `finish`.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._result is not None or all(name in self._outputs for name in names)
+            )
+            if self._result is not None:
+                return self._result
+            merged = {}
+            for name in names:
+                merged.update(self._outputs[name])
+            return merged
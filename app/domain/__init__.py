@@ -0,0 +1,4 @@
+# Os módulos de dados deste pacote são carregados do snapshot compilado, quando existe (ver snapshot.py).
+from . import snapshot as _snapshot
+
+_snapshot.install()
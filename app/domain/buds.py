@@ -1,35007 +1,155 @@
 # app/domain/buds.py
 
-# Este arquivo é o catálogo mestre que mapeia cada Bud ID para suas características (traits).
-# Fonte: /lib/buds/buds.ts do jogo, gerado automaticamente por convert_buds.py.
+# Este arquivo expõe o catálogo mestre que mapeia cada Bud ID para suas características (traits).
+# Fonte: /lib/buds/buds.ts do jogo.
+#
+# Os dados ficam em buds.bin, em formato de colunas: um vetor com os IDs e, para cada
+# característica, um byte por Bud com o índice do valor no vocabulário da coluna.
+# O ficheiro só é lido no primeiro acesso a BUDS_DATA, que se comporta como um
+# dicionário somente leitura {bud_id: {"type", "colour", "ears", "stem", "aura"}}.
+#
+# Para regenerar o ficheiro a partir de um JSON {bud_id: traits}:
+#     python -m app.domain.buds buds.json
 
-BUDS_DATA = {
-    1: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    5: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    6: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    7: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    8: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    9: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    10: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    11: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    12: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    13: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    14: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    15: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    16: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    17: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    18: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    19: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    20: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Mythical"
-},
-    21: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    22: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    23: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    24: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    25: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    26: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    27: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    28: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    29: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    30: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    31: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    32: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    33: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    34: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    35: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    36: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    37: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    38: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Mythical"
-},
-    39: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    40: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    41: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    42: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    43: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    44: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    45: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    46: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    47: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    48: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    49: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    50: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    51: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    52: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    53: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    54: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    55: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    56: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    57: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    58: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    59: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    60: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    61: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    62: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    63: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    64: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    65: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    66: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    67: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Mythical"
-},
-    68: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    69: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    70: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    71: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    72: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    73: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    74: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    75: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    76: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    77: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    78: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    79: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    80: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    81: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    82: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    83: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    84: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    85: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    86: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    87: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    88: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    89: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    90: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    91: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    92: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    93: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    94: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    95: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    96: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    97: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    98: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    99: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    100: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    101: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    102: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    103: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    104: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    105: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    106: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    107: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    108: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    109: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    110: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    111: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    112: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    113: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    114: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    115: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    116: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    117: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    118: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    119: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    120: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    121: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    122: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    123: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    124: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    125: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    126: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    127: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    128: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    129: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    130: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    131: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    132: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    133: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    134: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    135: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    136: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    137: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    138: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    139: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    140: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    141: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    142: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    143: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    144: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    145: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    146: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    147: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    148: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    149: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    150: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    151: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    152: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    153: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Mythical"
-},
-    154: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    155: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    156: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    157: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    158: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    159: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    160: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    161: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    162: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Green"
-},
-    163: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    164: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    165: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    166: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    167: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    168: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    169: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    170: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    171: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    172: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    173: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    174: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    175: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    176: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    177: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    178: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    179: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    180: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    181: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    182: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    183: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    184: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    185: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    186: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Mythical"
-},
-    187: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    188: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    189: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    190: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    191: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    192: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Green"
-},
-    193: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    194: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    195: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    196: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    197: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Mythical"
-},
-    198: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    199: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    200: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    201: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    202: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    203: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    204: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    205: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    206: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    207: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    208: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    209: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    210: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    211: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    212: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    213: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    214: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    215: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    216: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    217: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    218: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    219: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    220: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    221: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    222: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    223: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    224: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    225: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    226: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    227: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    228: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    229: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    230: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    231: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    232: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    233: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    234: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    235: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    236: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    237: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    238: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    239: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    240: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    241: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    242: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    243: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    244: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    245: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    246: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    247: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    248: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    249: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    250: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    251: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    252: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Green"
-},
-    253: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    254: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    255: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    256: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    257: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    258: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    259: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    260: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    261: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    262: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    263: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    264: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    265: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    266: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    267: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    268: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    269: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    270: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    271: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    272: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    273: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    274: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    275: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Rare"
-},
-    276: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    277: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    278: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    279: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    280: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    281: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    282: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    283: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    284: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    285: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    286: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    287: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    288: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    289: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    290: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    291: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    292: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    293: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    294: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    295: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    296: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    297: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    298: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    299: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    300: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    301: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    302: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    303: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    304: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    305: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    306: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    307: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    308: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    309: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    310: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    311: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    312: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    313: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    314: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    315: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    316: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    317: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    318: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    319: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    320: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    321: {
-    "type": "Cave",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    322: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    323: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    324: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    325: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    326: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    327: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    328: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    329: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    330: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    331: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    332: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    333: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    334: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    335: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    336: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    337: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    338: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    339: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    340: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    341: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    342: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    343: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    344: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    345: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    346: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    347: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    348: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    349: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    350: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    351: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    352: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    353: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    354: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    355: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    356: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    357: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    358: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    359: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    360: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    361: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    362: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    363: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    364: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    365: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Rare"
-},
-    366: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    367: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    368: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    369: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    370: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    371: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    372: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    373: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    374: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    375: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    376: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "Green"
-},
-    377: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    378: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    379: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    380: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    381: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    382: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    383: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    384: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    385: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    386: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    387: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    388: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    389: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    390: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    391: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    392: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    393: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    394: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    395: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    396: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    397: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    398: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    399: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    400: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    401: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    402: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    403: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    404: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    405: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    406: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    407: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    408: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    409: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    410: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    411: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    412: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    413: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    414: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    415: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    416: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    417: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    418: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    419: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    420: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    421: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    422: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    423: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    424: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    425: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    426: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    427: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    428: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    429: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    430: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    431: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Mythical"
-},
-    432: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    433: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    434: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    435: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    436: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    437: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    438: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    439: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    440: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    441: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    442: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    443: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    444: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    445: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    446: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    447: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    448: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    449: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    450: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    451: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    452: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    453: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    454: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    455: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    456: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    457: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    458: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    459: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    460: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    461: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    462: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    463: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    464: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    465: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    466: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    467: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    468: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    469: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    470: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    471: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    472: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    473: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    474: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    475: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    476: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    477: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    478: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    479: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    480: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    481: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    482: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    483: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    484: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    485: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    486: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    487: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    488: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    489: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    490: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    491: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    492: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    493: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    494: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    495: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    496: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    497: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    498: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    499: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    500: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Green"
-},
-    501: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    502: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    503: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    504: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    505: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    506: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    507: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    508: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    509: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    510: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    511: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    512: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    513: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    514: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    515: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    516: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    517: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    518: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    519: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    520: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    521: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    522: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    523: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    524: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    525: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    526: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    527: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    528: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    529: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    530: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    531: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    532: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    533: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    534: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    535: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    536: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    537: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    538: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    539: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    540: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    541: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    542: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    543: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    544: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    545: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    546: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    547: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    548: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    549: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    550: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    551: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    552: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    553: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    554: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    555: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    556: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    557: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    558: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    559: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    560: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    561: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    562: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    563: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    564: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    565: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    566: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    567: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    568: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    569: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    570: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    571: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    572: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    573: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    574: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    575: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    576: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    577: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    578: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    579: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    580: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    581: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    582: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    583: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    584: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    585: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    586: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    587: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    588: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    589: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    590: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    591: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    592: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    593: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    594: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    595: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    596: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    597: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    598: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    599: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    600: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    601: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    602: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    603: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    604: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    605: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    606: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    607: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    608: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    609: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    610: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    611: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    612: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    613: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    614: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    615: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    616: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    617: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    618: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    619: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    620: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    621: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    622: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    623: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    624: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    625: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    626: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Mythical"
-},
-    627: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    628: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    629: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    630: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    631: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    632: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    633: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    634: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    635: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    636: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    637: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    638: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    639: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    640: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    641: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    642: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    643: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    644: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    645: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    646: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    647: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    648: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    649: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    650: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    651: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    652: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    653: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    654: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    655: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    656: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    657: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    658: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    659: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    660: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    661: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    662: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    663: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    664: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    665: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    666: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    667: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    668: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    669: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    670: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    671: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    672: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    673: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    674: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    675: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    676: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    677: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    678: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Green"
-},
-    679: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    680: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    681: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    682: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    683: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    684: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    685: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    686: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    687: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    688: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    689: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    690: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    691: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    692: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    693: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    694: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    695: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    696: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    697: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    698: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    699: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Mythical"
-},
-    700: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    701: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    702: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    703: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    704: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    705: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    706: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    707: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    708: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    709: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    710: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    711: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    712: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    713: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    714: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    715: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    716: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    717: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    718: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    719: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    720: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    721: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    722: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    723: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    724: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    725: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    726: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    727: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    728: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    729: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Green"
-},
-    730: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    731: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    732: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    733: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    734: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    735: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    736: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    737: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    738: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Rare"
-},
-    739: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Green"
-},
-    740: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    741: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    742: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    743: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    744: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    745: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    746: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    747: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    748: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    749: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    750: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    751: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    752: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    753: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    754: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    755: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    756: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    757: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    758: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    759: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    760: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    761: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    762: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    763: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    764: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    765: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    766: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    767: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    768: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    769: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    770: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    771: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    772: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    773: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    774: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    775: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    776: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    777: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    778: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    779: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    780: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    781: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    782: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    783: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    784: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    785: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    786: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    787: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    788: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    789: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    790: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    791: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    792: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    793: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    794: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    795: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    796: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    797: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    798: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    799: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    800: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    801: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    802: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    803: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    804: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    805: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    806: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    807: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    808: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    809: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    810: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    811: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    812: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    813: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    814: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    815: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    816: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    817: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    818: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    819: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    820: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    821: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    822: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    823: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    824: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    825: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    826: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    827: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    828: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    829: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    830: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    831: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    832: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    833: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    834: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    835: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    836: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    837: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    838: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    839: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    840: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    841: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    842: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    843: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Rare"
-},
-    844: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    845: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    846: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    847: {
-    "type": "Woodlands",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    848: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    849: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    850: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    851: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    852: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    853: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    854: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    855: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    856: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    857: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    858: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    859: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    860: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    861: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    862: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    863: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    864: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    865: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    866: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    867: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    868: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    869: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    870: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    871: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    872: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    873: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    874: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Mythical"
-},
-    875: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    876: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    877: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    878: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    879: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    880: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    881: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    882: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    883: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    884: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    885: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    886: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    887: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    888: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    889: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    890: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    891: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    892: {
-    "type": "Saphiro",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    893: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    894: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    895: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    896: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    897: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    898: {
-    "type": "Beach",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    899: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    900: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    901: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    902: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    903: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    904: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    905: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    906: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    907: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    908: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    909: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    910: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    911: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Rare"
-},
-    912: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    913: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    914: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    915: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    916: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    917: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Mythical"
-},
-    918: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    919: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    920: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    921: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    922: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    923: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    924: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    925: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    926: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    927: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    928: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    929: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    930: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    931: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    932: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    933: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    934: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    935: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    936: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    937: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    938: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    939: {
-    "type": "Cave",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    940: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    941: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    942: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    943: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    944: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    945: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    946: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    947: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    948: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    949: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    950: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    951: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    952: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    953: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    954: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    955: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    956: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    957: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    958: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    959: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    960: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    961: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    962: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    963: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    964: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    965: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    966: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    967: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    968: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    969: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    970: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    971: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    972: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    973: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    974: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    975: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    976: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    977: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    978: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    979: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    980: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    981: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    982: {
-    "type": "Sea",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    983: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    984: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    985: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    986: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    987: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    988: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    989: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    990: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    991: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    992: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    993: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    994: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    995: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    996: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    997: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    998: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    999: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1000: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1001: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1002: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    1003: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1004: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1005: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    1006: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1007: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1008: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1009: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1010: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1011: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1012: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1013: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1014: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1015: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1016: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    1017: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1018: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1019: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1020: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1021: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1022: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1023: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    1024: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1025: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1026: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1027: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1028: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1029: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1030: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    1031: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1032: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1033: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1034: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1035: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1036: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1037: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1038: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    1039: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1040: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1041: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1042: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1043: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1044: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Rare"
-},
-    1045: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Mythical"
-},
-    1046: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    1047: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1048: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1049: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1050: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1051: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1052: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1053: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1054: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1055: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1056: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    1057: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1058: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1059: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1060: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1061: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1062: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1063: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1064: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1065: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1066: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1067: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    1068: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    1069: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    1070: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1071: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1072: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    1073: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1074: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1075: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1076: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1077: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1078: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1079: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1080: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1081: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1082: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1083: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1084: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1085: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1086: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1087: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1088: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1089: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1090: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1091: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1092: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    1093: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1094: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1095: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1096: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    1097: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1098: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1099: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1100: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    1101: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1102: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1103: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1104: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1105: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1106: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1107: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1108: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1109: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    1110: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1111: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1112: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1113: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1114: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1115: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1116: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1117: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1118: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1119: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1120: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1121: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1122: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1123: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1124: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    1125: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1126: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1127: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1128: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    1129: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1130: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1131: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1132: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1133: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1134: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1135: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1136: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1137: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1138: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1139: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1140: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    1141: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1142: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1143: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1144: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1145: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1146: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1147: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Mythical"
-},
-    1148: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1149: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1150: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1151: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Mythical"
-},
-    1152: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1153: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1154: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1155: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1156: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    1157: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1158: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1159: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1160: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1161: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1162: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1163: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1164: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    1165: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1166: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1167: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1168: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1169: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1170: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1171: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1172: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1173: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1174: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1175: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1176: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1177: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1178: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1179: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1180: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1181: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    1182: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1183: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1184: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1185: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1186: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    1187: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1188: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    1189: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1190: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1191: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1192: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1193: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1194: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1195: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1196: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1197: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1198: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1199: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1200: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1201: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1202: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1203: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1204: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1205: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Mythical"
-},
-    1206: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1207: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1208: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1209: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1210: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1211: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1212: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1213: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    1214: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Green"
-},
-    1215: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1216: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1217: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1218: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1219: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1220: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1221: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1222: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1223: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1224: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    1225: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1226: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1227: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1228: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1229: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1230: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1231: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1232: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1233: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1234: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    1235: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1236: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1237: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1238: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1239: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1240: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1241: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    1242: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1243: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1244: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    1245: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1246: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1247: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1248: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1249: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1250: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    1251: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    1252: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1253: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1254: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1255: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1256: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1257: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1258: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1259: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    1260: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1261: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1262: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1263: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1264: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1265: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1266: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1267: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1268: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1269: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1270: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1271: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    1272: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1273: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1274: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    1275: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1276: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1277: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1278: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1279: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    1280: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1281: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1282: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1283: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1284: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1285: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    1286: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Rare"
-},
-    1287: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1288: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1289: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1290: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1291: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    1292: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1293: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1294: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1295: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1296: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1297: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1298: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1299: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    1300: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1301: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1302: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    1303: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    1304: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1305: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1306: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1307: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1308: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1309: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1310: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1311: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    1312: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1313: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1314: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1315: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1316: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    1317: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1318: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1319: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1320: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1321: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1322: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    1323: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1324: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1325: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1326: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1327: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1328: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1329: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1330: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1331: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1332: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1333: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1334: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1335: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1336: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1337: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1338: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1339: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    1340: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1341: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1342: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1343: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    1344: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    1345: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1346: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1347: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1348: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1349: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1350: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1351: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1352: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1353: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1354: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    1355: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1356: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1357: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    1358: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1359: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1360: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1361: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1362: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    1363: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1364: {
-    "type": "Castle",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1365: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1366: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1367: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1368: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1369: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1370: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1371: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1372: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Green"
-},
-    1373: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    1374: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1375: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    1376: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1377: {
-    "type": "Snow",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1378: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1379: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1380: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1381: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1382: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1383: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    1384: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1385: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    1386: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1387: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1388: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1389: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1390: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1391: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    1392: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1393: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    1394: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1395: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1396: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1397: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1398: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1399: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1400: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1401: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1402: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1403: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    1404: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1405: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    1406: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1407: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    1408: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1409: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1410: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1411: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1412: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1413: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1414: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1415: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    1416: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1417: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1418: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1419: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1420: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1421: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1422: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    1423: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1424: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1425: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1426: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1427: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1428: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1429: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1430: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1431: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    1432: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1433: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1434: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1435: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1436: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1437: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1438: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1439: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1440: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1441: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1442: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1443: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1444: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1445: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1446: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Green"
-},
-    1447: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1448: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1449: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1450: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1451: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1452: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1453: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1454: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1455: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    1456: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    1457: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    1458: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1459: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1460: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1461: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1462: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1463: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1464: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1465: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1466: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1467: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1468: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1469: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    1470: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1471: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1472: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1473: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1474: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1475: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1476: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1477: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1478: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1479: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1480: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1481: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1482: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1483: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1484: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1485: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1486: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1487: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1488: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1489: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1490: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    1491: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1492: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    1493: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1494: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1495: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1496: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1497: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1498: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1499: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1500: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1501: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1502: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1503: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1504: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1505: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Green"
-},
-    1506: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1507: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1508: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1509: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1510: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1511: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1512: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1513: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1514: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1515: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    1516: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1517: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1518: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    1519: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    1520: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Green"
-},
-    1521: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    1522: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1523: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    1524: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1525: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1526: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1527: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1528: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1529: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1530: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    1531: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1532: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1533: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1534: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1535: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1536: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1537: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1538: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1539: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1540: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1541: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1542: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1543: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1544: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1545: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1546: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1547: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1548: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1549: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1550: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    1551: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1552: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1553: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1554: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    1555: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1556: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1557: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1558: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1559: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1560: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1561: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1562: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    1563: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    1564: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1565: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Rare"
-},
-    1566: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1567: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1568: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1569: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1570: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    1571: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    1572: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1573: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1574: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1575: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1576: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1577: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1578: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1579: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1580: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1581: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1582: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1583: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1584: {
-    "type": "Castle",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1585: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1586: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1587: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1588: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    1589: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1590: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1591: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1592: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1593: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    1594: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1595: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1596: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1597: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1598: {
-    "type": "Woodlands",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1599: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1600: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1601: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    1602: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    1603: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1604: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1605: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Mythical"
-},
-    1606: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1607: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1608: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1609: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1610: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    1611: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1612: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1613: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1614: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1615: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1616: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1617: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1618: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    1619: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1620: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1621: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1622: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1623: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1624: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1625: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1626: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1627: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1628: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1629: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1630: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1631: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1632: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1633: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1634: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1635: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1636: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1637: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1638: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1639: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1640: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1641: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1642: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1643: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1644: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1645: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    1646: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1647: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1648: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1649: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1650: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1651: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1652: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1653: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1654: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1655: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1656: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    1657: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1658: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1659: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    1660: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    1661: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1662: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1663: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1664: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1665: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1666: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1667: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1668: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1669: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1670: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1671: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1672: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1673: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1674: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1675: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1676: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1677: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1678: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1679: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1680: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1681: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1682: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1683: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    1684: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1685: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1686: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1687: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1688: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1689: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1690: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    1691: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1692: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1693: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    1694: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1695: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1696: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1697: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    1698: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1699: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1700: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1701: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1702: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1703: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1704: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1705: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1706: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1707: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Mythical"
-},
-    1708: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1709: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    1710: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    1711: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1712: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1713: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1714: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1715: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1716: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1717: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1718: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1719: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1720: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1721: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1722: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1723: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1724: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1725: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1726: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1727: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1728: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1729: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1730: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1731: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1732: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1733: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Mythical"
-},
-    1734: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1735: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1736: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1737: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    1738: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1739: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1740: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1741: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1742: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1743: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1744: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1745: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    1746: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1747: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    1748: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1749: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1750: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1751: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1752: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    1753: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1754: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1755: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1756: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1757: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1758: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    1759: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1760: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    1761: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1762: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1763: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1764: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Mythical"
-},
-    1765: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1766: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1767: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    1768: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1769: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1770: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1771: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    1772: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1773: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1774: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1775: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1776: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1777: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1778: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1779: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1780: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1781: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1782: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1783: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1784: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1785: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1786: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1787: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1788: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1789: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1790: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1791: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1792: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1793: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1794: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1795: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1796: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1797: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1798: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    1799: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1800: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1801: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1802: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1803: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1804: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1805: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1806: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1807: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1808: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Mythical"
-},
-    1809: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1810: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1811: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1812: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1813: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1814: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1815: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1816: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1817: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1818: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1819: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1820: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1821: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Green"
-},
-    1822: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1823: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1824: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1825: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1826: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1827: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1828: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    1829: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1830: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    1831: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    1832: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1833: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1834: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1835: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    1836: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1837: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1838: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1839: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    1840: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1841: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    1842: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1843: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1844: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1845: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1846: {
-    "type": "Retreat",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1847: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1848: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1849: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1850: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1851: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1852: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1853: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1854: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Mythical"
-},
-    1855: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1856: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1857: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    1858: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1859: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    1860: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1861: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1862: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1863: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1864: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    1865: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1866: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1867: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1868: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    1869: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1870: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1871: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1872: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1873: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    1874: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1875: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    1876: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    1877: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    1878: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    1879: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    1880: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1881: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1882: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1883: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    1884: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1885: {
-    "type": "Sea",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1886: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1887: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1888: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1889: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1890: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1891: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1892: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1893: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1894: {
-    "type": "Retreat",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1895: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    1896: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1897: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1898: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    1899: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1900: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1901: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1902: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    1903: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1904: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1905: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1906: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    1907: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    1908: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1909: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1910: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1911: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    1912: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1913: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1914: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    1915: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1916: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1917: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1918: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1919: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    1920: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1921: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    1922: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    1923: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1924: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    1925: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    1926: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1927: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1928: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1929: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    1930: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1931: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    1932: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    1933: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    1934: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    1935: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1936: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1937: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1938: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1939: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1940: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1941: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1942: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1943: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1944: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    1945: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    1946: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1947: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Green"
-},
-    1948: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    1949: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    1950: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1951: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    1952: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    1953: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1954: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1955: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1956: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    1957: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    1958: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    1959: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    1960: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1961: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1962: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    1963: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1964: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    1965: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1966: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1967: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1968: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    1969: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    1970: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1971: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    1972: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1973: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    1974: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1975: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    1976: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1977: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    1978: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1979: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    1980: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    1981: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    1982: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    1983: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    1984: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    1985: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    1986: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    1987: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    1988: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    1989: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    1990: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    1991: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    1992: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1993: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    1994: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    1995: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    1996: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    1997: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    1998: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    1999: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2000: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2001: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2002: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2003: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2004: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2005: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2006: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Rare"
-},
-    2007: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2008: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2009: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2010: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2011: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2012: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2013: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2014: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2015: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2016: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2017: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2018: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Mythical"
-},
-    2019: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2020: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2021: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    2022: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2023: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Green"
-},
-    2024: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2025: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    2026: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Mythical"
-},
-    2027: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2028: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2029: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2030: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2031: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2032: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2033: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2034: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2035: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2036: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2037: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2038: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2039: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2040: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2041: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2042: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2043: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2044: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2045: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2046: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2047: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2048: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2049: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2050: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    2051: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2052: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2053: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2054: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    2055: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2056: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Mythical"
-},
-    2057: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    2058: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2059: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2060: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2061: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2062: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2063: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    2064: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2065: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2066: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    2067: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    2068: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    2069: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2070: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    2071: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2072: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2073: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2074: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2075: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2076: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2077: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2078: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    2079: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2080: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2081: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2082: {
-    "type": "Port",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    2083: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2084: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2085: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2086: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2087: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2088: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2089: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2090: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2091: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2092: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2093: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2094: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2095: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2096: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2097: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2098: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2099: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Green"
-},
-    2100: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2101: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2102: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2103: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Green"
-},
-    2104: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2105: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2106: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2107: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2108: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    2109: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    2110: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2111: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2112: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Green"
-},
-    2113: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2114: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2115: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Rare"
-},
-    2116: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2117: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2118: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2119: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    2120: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2121: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2122: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2123: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2124: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "Green"
-},
-    2125: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Green"
-},
-    2126: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2127: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2128: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2129: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2130: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2131: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2132: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    2133: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2134: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2135: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2136: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2137: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    2138: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2139: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2140: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2141: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2142: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2143: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2144: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2145: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2146: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    2147: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2148: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2149: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2150: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2151: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2152: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2153: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2154: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2155: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2156: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2157: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2158: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    2159: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2160: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2161: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2162: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2163: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2164: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    2165: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2166: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2167: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2168: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2169: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2170: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2171: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Mythical"
-},
-    2172: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2173: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    2174: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    2175: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2176: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2177: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Green"
-},
-    2178: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2179: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2180: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2181: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2182: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    2183: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2184: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2185: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2186: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2187: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2188: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2189: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2190: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2191: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2192: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2193: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2194: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2195: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2196: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2197: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2198: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    2199: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2200: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2201: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2202: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2203: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2204: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2205: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2206: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2207: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2208: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Rare"
-},
-    2209: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2210: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2211: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    2212: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2213: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2214: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2215: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2216: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2217: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2218: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2219: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2220: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2221: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2222: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2223: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Mythical"
-},
-    2224: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Mythical"
-},
-    2225: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2226: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    2227: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2228: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2229: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2230: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    2231: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    2232: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2233: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2234: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2235: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2236: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    2237: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    2238: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2239: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2240: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2241: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2242: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    2243: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2244: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2245: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2246: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    2247: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2248: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2249: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    2250: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    2251: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2252: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2253: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2254: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2255: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2256: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2257: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2258: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2259: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2260: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2261: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2262: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2263: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2264: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2265: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2266: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2267: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2268: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2269: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    2270: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2271: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2272: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    2273: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2274: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2275: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2276: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2277: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2278: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2279: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2280: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2281: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2282: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2283: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2284: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    2285: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2286: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2287: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2288: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2289: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2290: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2291: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Mythical"
-},
-    2292: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2293: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2294: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2295: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2296: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2297: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2298: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2299: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    2300: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2301: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2302: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2303: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2304: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    2305: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2306: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2307: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2308: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2309: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2310: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2311: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2312: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2313: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2314: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2315: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2316: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2317: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2318: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2319: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    2320: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2321: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2322: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2323: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2324: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    2325: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2326: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Mythical"
-},
-    2327: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2328: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2329: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2330: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    2331: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2332: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2333: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2334: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2335: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2336: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    2337: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2338: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    2339: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2340: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Mythical"
-},
-    2341: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2342: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    2343: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2344: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2345: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    2346: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2347: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2348: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2349: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2350: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2351: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2352: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2353: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2354: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2355: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2356: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2357: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2358: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2359: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2360: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2361: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2362: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2363: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    2364: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2365: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2366: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2367: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2368: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2369: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2370: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2371: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2372: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2373: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2374: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2375: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2376: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2377: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2378: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2379: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2380: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2381: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2382: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2383: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2384: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2385: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2386: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2387: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2388: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2389: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2390: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2391: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2392: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2393: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2394: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2395: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2396: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2397: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2398: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2399: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2400: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2401: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2402: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2403: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2404: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2405: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2406: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2407: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2408: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2409: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2410: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    2411: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2412: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2413: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2414: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2415: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2416: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2417: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2418: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2419: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2420: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Rare"
-},
-    2421: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2422: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2423: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2424: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2425: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2426: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2427: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2428: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2429: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2430: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2431: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2432: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2433: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2434: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2435: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2436: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2437: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    2438: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2439: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2440: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2441: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2442: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2443: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2444: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2445: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2446: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2447: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2448: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2449: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2450: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2451: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2452: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2453: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2454: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2455: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2456: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Rare"
-},
-    2457: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2458: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2459: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2460: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    2461: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2462: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2463: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2464: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2465: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    2466: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2467: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Mythical"
-},
-    2468: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2469: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    2470: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2471: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    2472: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2473: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2474: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2475: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2476: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2477: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2478: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2479: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2480: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2481: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2482: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    2483: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2484: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2485: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    2486: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2487: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    2488: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2489: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    2490: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    2491: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2492: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2493: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2494: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2495: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2496: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2497: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2498: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2499: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2500: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2501: {
-    "type": "Snow",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2502: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2503: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2504: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2505: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2506: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2507: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2508: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2509: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2510: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2511: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2512: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2513: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    2514: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2515: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2516: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2517: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2518: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    2519: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2520: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2521: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2522: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2523: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2524: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2525: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    2526: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2527: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2528: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2529: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2530: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2531: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2532: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    2533: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2534: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2535: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2536: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    2537: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2538: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2539: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2540: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2541: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2542: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2543: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2544: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2545: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2546: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    2547: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2548: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    2549: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2550: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2551: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2552: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2553: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2554: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2555: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2556: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2557: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2558: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2559: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2560: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2561: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2562: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2563: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2564: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2565: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2566: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2567: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2568: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2569: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Mythical"
-},
-    2570: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2571: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2572: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2573: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2574: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Mythical"
-},
-    2575: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2576: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2577: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2578: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Green"
-},
-    2579: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2580: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2581: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2582: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2583: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2584: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2585: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2586: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2587: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2588: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2589: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2590: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2591: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2592: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2593: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2594: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2595: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2596: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2597: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2598: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2599: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2600: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2601: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2602: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2603: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2604: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2605: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2606: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2607: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2608: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2609: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2610: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2611: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2612: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    2613: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2614: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    2615: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2616: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2617: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2618: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2619: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2620: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2621: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2622: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2623: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2624: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2625: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2626: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2627: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2628: {
-    "type": "Port",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2629: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2630: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2631: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2632: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2633: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    2634: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2635: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2636: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2637: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2638: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2639: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2640: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2641: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2642: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2643: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2644: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2645: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2646: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2647: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2648: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2649: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2650: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    2651: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2652: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2653: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Mythical"
-},
-    2654: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    2655: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2656: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2657: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2658: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2659: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2660: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2661: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    2662: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2663: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2664: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2665: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2666: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2667: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2668: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2669: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Green"
-},
-    2670: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    2671: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2672: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2673: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2674: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2675: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2676: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2677: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Mythical"
-},
-    2678: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2679: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2680: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2681: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2682: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2683: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2684: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2685: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    2686: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2687: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    2688: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2689: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2690: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2691: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    2692: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2693: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2694: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2695: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2696: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    2697: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2698: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2699: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    2700: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    2701: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2702: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2703: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2704: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2705: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2706: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2707: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2708: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2709: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2710: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2711: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2712: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2713: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2714: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2715: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2716: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    2717: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2718: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2719: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2720: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2721: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2722: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2723: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2724: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2725: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2726: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2727: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2728: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2729: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2730: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2731: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2732: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2733: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2734: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    2735: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2736: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2737: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2738: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2739: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    2740: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2741: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2742: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2743: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2744: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2745: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2746: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2747: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    2748: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Green"
-},
-    2749: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2750: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2751: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2752: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2753: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2754: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2755: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2756: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2757: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Green"
-},
-    2758: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2759: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    2760: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    2761: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2762: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2763: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2764: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    2765: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2766: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2767: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2768: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2769: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    2770: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2771: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2772: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    2773: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2774: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2775: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2776: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    2777: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2778: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2779: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    2780: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2781: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2782: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2783: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2784: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2785: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2786: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Green"
-},
-    2787: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2788: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2789: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2790: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2791: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2792: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2793: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2794: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2795: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2796: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2797: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2798: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2799: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    2800: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2801: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2802: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2803: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2804: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2805: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2806: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2807: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2808: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2809: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2810: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2811: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2812: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    2813: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2814: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2815: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2816: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2817: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2818: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2819: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2820: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2821: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2822: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2823: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2824: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2825: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2826: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2827: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Mythical"
-},
-    2828: {
-    "type": "Woodlands",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2829: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2830: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    2831: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    2832: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    2833: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2834: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2835: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2836: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2837: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    2838: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2839: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2840: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    2841: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    2842: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2843: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2844: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2845: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    2846: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Green"
-},
-    2847: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2848: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2849: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2850: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Mythical"
-},
-    2851: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2852: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2853: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2854: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2855: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2856: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2857: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2858: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    2859: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2860: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2861: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2862: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2863: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2864: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2865: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2866: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2867: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2868: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    2869: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2870: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2871: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2872: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2873: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    2874: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2875: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2876: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2877: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2878: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2879: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2880: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2881: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2882: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2883: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2884: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2885: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    2886: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    2887: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2888: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    2889: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    2890: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2891: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2892: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2893: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2894: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2895: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2896: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    2897: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    2898: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    2899: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    2900: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2901: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2902: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2903: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    2904: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2905: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2906: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2907: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2908: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2909: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2910: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2911: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2912: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2913: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Mythical"
-},
-    2914: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2915: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2916: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2917: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2918: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    2919: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    2920: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2921: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    2922: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2923: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2924: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2925: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2926: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    2927: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2928: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2929: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    2930: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    2931: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2932: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2933: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    2934: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2935: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2936: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2937: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2938: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2939: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2940: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2941: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    2942: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    2943: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Rare"
-},
-    2944: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    2945: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    2946: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2947: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    2948: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    2949: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    2950: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    2951: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2952: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2953: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    2954: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2955: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    2956: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2957: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2958: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2959: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    2960: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2961: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Green"
-},
-    2962: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    2963: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2964: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    2965: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2966: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2967: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2968: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    2969: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    2970: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2971: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2972: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    2973: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    2974: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    2975: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    2976: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2977: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    2978: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    2979: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    2980: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Green"
-},
-    2981: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    2982: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    2983: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    2984: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    2985: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    2986: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2987: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2988: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    2989: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    2990: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    2991: {
-    "type": "Sea",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    2992: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    2993: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    2994: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    2995: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    2996: {
-    "type": "Plaza",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2997: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    2998: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    2999: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3000: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3001: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3002: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3003: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3004: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3005: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3006: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3007: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3008: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3009: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3010: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    3011: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3012: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3013: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3014: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    3015: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3016: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3017: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3018: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3019: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3020: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3021: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3022: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3023: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    3024: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3025: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3026: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3027: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3028: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3029: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3030: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3031: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Mythical"
-},
-    3032: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3033: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3034: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3035: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3036: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    3037: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3038: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3039: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    3040: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3041: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3042: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3043: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3044: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3045: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3046: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3047: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3048: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3049: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3050: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    3051: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3052: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3053: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3054: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3055: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3056: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3057: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3058: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3059: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3060: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3061: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3062: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3063: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3064: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3065: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3066: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3067: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3068: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3069: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3070: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3071: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3072: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3073: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3074: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3075: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3076: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Mythical"
-},
-    3077: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3078: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3079: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3080: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3081: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3082: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3083: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3084: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3085: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3086: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3087: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3088: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3089: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3090: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3091: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3092: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3093: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3094: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3095: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3096: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3097: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3098: {
-    "type": "Port",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3099: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3100: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3101: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    3102: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3103: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    3104: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3105: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3106: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3107: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3108: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3109: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3110: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3111: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3112: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3113: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3114: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3115: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3116: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3117: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3118: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3119: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3120: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    3121: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3122: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3123: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3124: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3125: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3126: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3127: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3128: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3129: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3130: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3131: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3132: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3133: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3134: {
-    "type": "Beach",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3135: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3136: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3137: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3138: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3139: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3140: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3141: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3142: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3143: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3144: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3145: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3146: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3147: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3148: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3149: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3150: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3151: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3152: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3153: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3154: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3155: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3156: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3157: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3158: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3159: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3160: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3161: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3162: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3163: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3164: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3165: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    3166: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3167: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    3168: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3169: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3170: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3171: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3172: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3173: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3174: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3175: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3176: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3177: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3178: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3179: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3180: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    3181: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3182: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3183: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3184: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3185: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3186: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3187: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    3188: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3189: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3190: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3191: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3192: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3193: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3194: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3195: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3196: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3197: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3198: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3199: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    3200: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3201: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3202: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3203: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    3204: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3205: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3206: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3207: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Rare"
-},
-    3208: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3209: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3210: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3211: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3212: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3213: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3214: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3215: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3216: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3217: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    3218: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3219: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3220: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3221: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3222: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3223: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3224: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    3225: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    3226: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3227: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3228: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3229: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3230: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3231: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3232: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    3233: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3234: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3235: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3236: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3237: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3238: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3239: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3240: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3241: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3242: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3243: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    3244: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3245: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    3246: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    3247: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3248: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3249: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3250: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3251: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3252: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3253: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3254: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    3255: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3256: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3257: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3258: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3259: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3260: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3261: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3262: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    3263: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3264: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3265: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3266: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3267: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    3268: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3269: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3270: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3271: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3272: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3273: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3274: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    3275: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3276: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3277: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3278: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3279: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3280: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3281: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3282: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3283: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    3284: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3285: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3286: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3287: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3288: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3289: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3290: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3291: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3292: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3293: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3294: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3295: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3296: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3297: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Rare"
-},
-    3298: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3299: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3300: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3301: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3302: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3303: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3304: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3305: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3306: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3307: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Rare"
-},
-    3308: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3309: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3310: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3311: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3312: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3313: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Green"
-},
-    3314: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3315: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3316: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3317: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3318: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3319: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3320: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3321: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3322: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3323: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3324: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3325: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3326: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3327: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3328: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3329: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    3330: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3331: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3332: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    3333: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3334: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3335: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3336: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3337: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3338: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3339: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3340: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3341: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3342: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    3343: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    3344: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3345: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3346: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3347: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3348: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3349: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    3350: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3351: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3352: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3353: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3354: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3355: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Mythical"
-},
-    3356: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3357: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3358: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3359: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3360: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3361: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3362: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    3363: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3364: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3365: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3366: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3367: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3368: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3369: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3370: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3371: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3372: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3373: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3374: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3375: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    3376: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    3377: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3378: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3379: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3380: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3381: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3382: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3383: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3384: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3385: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    3386: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Rare"
-},
-    3387: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3388: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    3389: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Rare"
-},
-    3390: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3391: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3392: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3393: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3394: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3395: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3396: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3397: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Mythical"
-},
-    3398: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3399: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3400: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3401: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    3402: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3403: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3404: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3405: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3406: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3407: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3408: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3409: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Rare"
-},
-    3410: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3411: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3412: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3413: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3414: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3415: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3416: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    3417: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3418: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3419: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3420: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    3421: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3422: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3423: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3424: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3425: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3426: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3427: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    3428: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3429: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3430: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3431: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3432: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3433: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3434: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3435: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3436: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3437: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3438: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3439: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3440: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3441: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3442: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3443: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3444: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3445: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3446: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3447: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3448: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3449: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3450: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3451: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3452: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3453: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3454: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3455: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3456: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3457: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3458: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3459: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3460: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3461: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3462: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3463: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3464: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3465: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3466: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3467: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3468: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3469: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3470: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3471: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3472: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3473: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3474: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3475: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3476: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3477: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3478: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3479: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3480: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3481: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3482: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3483: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3484: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3485: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3486: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3487: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3488: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Green"
-},
-    3489: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3490: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    3491: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3492: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3493: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3494: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3495: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    3496: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3497: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3498: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3499: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3500: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3501: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3502: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3503: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3504: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3505: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3506: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3507: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3508: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3509: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3510: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3511: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3512: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3513: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    3514: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3515: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    3516: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    3517: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3518: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3519: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3520: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3521: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3522: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3523: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3524: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3525: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3526: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3527: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3528: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3529: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    3530: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3531: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    3532: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Green"
-},
-    3533: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3534: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3535: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3536: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3537: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3538: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3539: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    3540: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3541: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3542: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3543: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3544: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3545: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3546: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3547: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3548: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3549: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3550: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    3551: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3552: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3553: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3554: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3555: {
-    "type": "Saphiro",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3556: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    3557: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3558: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3559: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    3560: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    3561: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3562: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3563: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3564: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3565: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3566: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3567: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3568: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3569: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3570: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3571: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3572: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3573: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3574: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3575: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3576: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3577: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3578: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3579: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3580: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3581: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3582: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3583: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3584: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3585: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3586: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3587: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    3588: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3589: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3590: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3591: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Green"
-},
-    3592: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3593: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3594: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3595: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    3596: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    3597: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3598: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3599: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3600: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3601: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3602: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3603: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3604: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3605: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3606: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3607: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    3608: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3609: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3610: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3611: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3612: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    3613: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3614: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3615: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3616: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    3617: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    3618: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3619: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3620: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3621: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3622: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    3623: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3624: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3625: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3626: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3627: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3628: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3629: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3630: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3631: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3632: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3633: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3634: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3635: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3636: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3637: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3638: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3639: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3640: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3641: {
-    "type": "Castle",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3642: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3643: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3644: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3645: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3646: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3647: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3648: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3649: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3650: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3651: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3652: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3653: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3654: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3655: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3656: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3657: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3658: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3659: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3660: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    3661: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3662: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3663: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3664: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Rare"
-},
-    3665: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3666: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3667: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3668: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3669: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3670: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3671: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Mythical"
-},
-    3672: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3673: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3674: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3675: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3676: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3677: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3678: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    3679: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3680: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3681: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3682: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3683: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3684: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3685: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3686: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3687: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3688: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3689: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3690: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3691: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3692: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3693: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3694: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3695: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3696: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3697: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    3698: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3699: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3700: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3701: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3702: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3703: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3704: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3705: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    3706: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3707: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3708: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3709: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3710: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3711: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3712: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3713: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3714: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3715: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3716: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3717: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    3718: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3719: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3720: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3721: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3722: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3723: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3724: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3725: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3726: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3727: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3728: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Rare"
-},
-    3729: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3730: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3731: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3732: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3733: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3734: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3735: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3736: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3737: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3738: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3739: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3740: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3741: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    3742: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3743: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3744: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3745: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3746: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3747: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3748: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3749: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3750: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3751: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    3752: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3753: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3754: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3755: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3756: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3757: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3758: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3759: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3760: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3761: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3762: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    3763: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3764: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3765: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3766: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3767: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3768: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3769: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3770: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3771: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3772: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Mythical"
-},
-    3773: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3774: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3775: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3776: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3777: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3778: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    3779: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3780: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3781: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3782: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3783: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3784: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    3785: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3786: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3787: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3788: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3789: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3790: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3791: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3792: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3793: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3794: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3795: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3796: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3797: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3798: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3799: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3800: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3801: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3802: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    3803: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3804: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3805: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3806: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3807: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3808: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3809: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3810: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    3811: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3812: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3813: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3814: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    3815: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3816: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    3817: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3818: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    3819: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3820: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3821: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3822: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3823: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3824: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3825: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3826: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3827: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3828: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3829: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Green"
-},
-    3830: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3831: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3832: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3833: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3834: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    3835: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3836: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3837: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3838: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3839: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    3840: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3841: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    3842: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3843: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3844: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    3845: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3846: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3847: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    3848: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3849: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3850: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3851: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3852: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3853: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3854: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3855: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3856: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3857: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3858: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3859: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3860: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3861: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3862: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3863: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3864: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    3865: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3866: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    3867: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3868: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3869: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3870: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3871: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3872: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3873: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3874: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3875: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3876: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    3877: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3878: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3879: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    3880: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3881: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3882: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3883: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3884: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    3885: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3886: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3887: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3888: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3889: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    3890: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3891: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Rare"
-},
-    3892: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3893: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    3894: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    3895: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3896: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3897: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3898: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3899: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3900: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3901: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3902: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    3903: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3904: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3905: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3906: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3907: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3908: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3909: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3910: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3911: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3912: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3913: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3914: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    3915: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    3916: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    3917: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3918: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3919: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    3920: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3921: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3922: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3923: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    3924: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3925: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3926: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Green"
-},
-    3927: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3928: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    3929: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3930: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    3931: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    3932: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3933: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3934: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3935: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    3936: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3937: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    3938: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3939: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Rare"
-},
-    3940: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3941: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3942: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    3943: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3944: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3945: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    3946: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    3947: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3948: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3949: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3950: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3951: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3952: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3953: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3954: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3955: {
-    "type": "Beach",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3956: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3957: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3958: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    3959: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    3960: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3961: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3962: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3963: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3964: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    3965: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    3966: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    3967: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    3968: {
-    "type": "Saphiro",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3969: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3970: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    3971: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3972: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3973: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3974: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    3975: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3976: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    3977: {
-    "type": "Plaza",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    3978: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3979: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    3980: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    3981: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    3982: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    3983: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    3984: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3985: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    3986: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    3987: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3988: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3989: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    3990: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    3991: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    3992: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3993: {
-    "type": "Plaza",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    3994: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    3995: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    3996: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    3997: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    3998: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    3999: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4000: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4001: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4002: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4003: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4004: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4005: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4006: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4007: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4008: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4009: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Rare"
-},
-    4010: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4011: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4012: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4013: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4014: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4015: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4016: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4017: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4018: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4019: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4020: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4021: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4022: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4023: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4024: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4025: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    4026: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4027: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4028: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4029: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    4030: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4031: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4032: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4033: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4034: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4035: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4036: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4037: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4038: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4039: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4040: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4041: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4042: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4043: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4044: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4045: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4046: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4047: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4048: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4049: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4050: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    4051: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4052: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4053: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4054: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4055: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    4056: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4057: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4058: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    4059: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4060: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4061: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4062: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4063: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4064: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4065: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4066: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4067: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4068: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4069: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4070: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4071: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4072: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4073: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Green"
-},
-    4074: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4075: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4076: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4077: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4078: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4079: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4080: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4081: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4082: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4083: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4084: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4085: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4086: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4087: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4088: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4089: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4090: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4091: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4092: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4093: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    4094: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    4095: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4096: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4097: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4098: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    4099: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    4100: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4101: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4102: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4103: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4104: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4105: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4106: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4107: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4108: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4109: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4110: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Mythical"
-},
-    4111: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4112: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    4113: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4114: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4115: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    4116: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4117: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4118: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4119: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    4120: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4121: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4122: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4123: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4124: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4125: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4126: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4127: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4128: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4129: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4130: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    4131: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4132: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4133: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4134: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4135: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4136: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    4137: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4138: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4139: {
-    "type": "Snow",
-    "colour": "Rainbow",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4140: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4141: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4142: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4143: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4144: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4145: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4146: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4147: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    4148: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4149: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4150: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4151: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4152: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4153: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    4154: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4155: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4156: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4157: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4158: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4159: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4160: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4161: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4162: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4163: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4164: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4165: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4166: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4167: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4168: {
-    "type": "Retreat",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4169: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4170: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4171: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4172: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4173: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4174: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4175: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4176: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4177: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4178: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Fish Hat",
-    "aura": "Basic"
-},
-    4179: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4180: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    4181: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4182: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4183: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4184: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4185: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4186: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4187: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    4188: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4189: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4190: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4191: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4192: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4193: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4194: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4195: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4196: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4197: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4198: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4199: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    4200: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4201: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4202: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    4203: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4204: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4205: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4206: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    4207: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4208: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4209: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4210: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4211: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4212: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4213: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4214: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4215: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4216: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    4217: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    4218: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4219: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4220: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Green"
-},
-    4221: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4222: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4223: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4224: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4225: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4226: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4227: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4228: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4229: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4230: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4231: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4232: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4233: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4234: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4235: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4236: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4237: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    4238: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4239: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4240: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4241: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4242: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4243: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4244: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4245: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4246: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4247: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4248: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4249: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4250: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4251: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    4252: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Green"
-},
-    4253: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4254: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4255: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    4256: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4257: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4258: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4259: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4260: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4261: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4262: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4263: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    4264: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4265: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4266: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4267: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4268: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4269: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4270: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4271: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    4272: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4273: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4274: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4275: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4276: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4277: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    4278: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4279: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4280: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    4281: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4282: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4283: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4284: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4285: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4286: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4287: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4288: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4289: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4290: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4291: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4292: {
-    "type": "Saphiro",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4293: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4294: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4295: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Green"
-},
-    4296: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4297: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4298: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4299: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4300: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4301: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    4302: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Rare"
-},
-    4303: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4304: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4305: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4306: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4307: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4308: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4309: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4310: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4311: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4312: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4313: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4314: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4315: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4316: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4317: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4318: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4319: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    4320: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4321: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4322: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4323: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4324: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4325: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4326: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4327: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4328: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4329: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Green"
-},
-    4330: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4331: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4332: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4333: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4334: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4335: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4336: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4337: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4338: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4339: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4340: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4341: {
-    "type": "Cave",
-    "colour": "Rainbow",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4342: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4343: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4344: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4345: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4346: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4347: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4348: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4349: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4350: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4351: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4352: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4353: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4354: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Rare"
-},
-    4355: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4356: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4357: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4358: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    4359: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4360: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4361: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4362: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4363: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4364: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4365: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4366: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4367: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4368: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Green"
-},
-    4369: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4370: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4371: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4372: {
-    "type": "Snow",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4373: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4374: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4375: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4376: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4377: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4378: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4379: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4380: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4381: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4382: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4383: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4384: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4385: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    4386: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4387: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4388: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4389: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4390: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    4391: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4392: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4393: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4394: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4395: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4396: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4397: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4398: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4399: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4400: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4401: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4402: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4403: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4404: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4405: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4406: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4407: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4408: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4409: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4410: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4411: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4412: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4413: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4414: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4415: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4416: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4417: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4418: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4419: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4420: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4421: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4422: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4423: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4424: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4425: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4426: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4427: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4428: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4429: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4430: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4431: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4432: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Mythical"
-},
-    4433: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4434: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4435: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4436: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4437: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4438: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4439: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4440: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4441: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4442: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4443: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4444: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4445: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4446: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4447: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4448: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4449: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4450: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4451: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    4452: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4453: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4454: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4455: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4456: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4457: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4458: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    4459: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4460: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4461: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4462: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4463: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4464: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4465: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    4466: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4467: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4468: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4469: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    4470: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4471: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4472: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4473: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4474: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    4475: {
-    "type": "Sea",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4476: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4477: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4478: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4479: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4480: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4481: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4482: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4483: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4484: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4485: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4486: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4487: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4488: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4489: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4490: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4491: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    4492: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4493: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4494: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4495: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4496: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4497: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4498: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4499: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4500: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4501: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4502: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4503: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    4504: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4505: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4506: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4507: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4508: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4509: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4510: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4511: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4512: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4513: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4514: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4515: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    4516: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4517: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4518: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4519: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    4520: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4521: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4522: {
-    "type": "Cave",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4523: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4524: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4525: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4526: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4527: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4528: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4529: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4530: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4531: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4532: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4533: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4534: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4535: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    4536: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4537: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4538: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4539: {
-    "type": "Port",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4540: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4541: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4542: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4543: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4544: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4545: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    4546: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4547: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    4548: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4549: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4550: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4551: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4552: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4553: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4554: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4555: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4556: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    4557: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4558: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4559: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    4560: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4561: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4562: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4563: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4564: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4565: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    4566: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4567: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4568: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4569: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4570: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4571: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4572: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4573: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4574: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4575: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4576: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4577: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4578: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4579: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4580: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4581: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4582: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4583: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4584: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4585: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4586: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4587: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4588: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4589: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    4590: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    4591: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4592: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4593: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4594: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4595: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4596: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4597: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4598: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4599: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4600: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4601: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4602: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4603: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4604: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4605: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4606: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4607: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    4608: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4609: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4610: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    4611: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4612: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4613: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4614: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4615: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4616: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4617: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4618: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4619: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4620: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4621: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4622: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4623: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4624: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4625: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4626: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4627: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4628: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4629: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4630: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4631: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4632: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4633: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    4634: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4635: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Green"
-},
-    4636: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4637: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4638: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    4639: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    4640: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4641: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4642: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4643: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4644: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4645: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4646: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4647: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4648: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4649: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4650: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4651: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    4652: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    4653: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4654: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4655: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4656: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4657: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4658: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4659: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    4660: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4661: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4662: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Green"
-},
-    4663: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4664: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4665: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    4666: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4667: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4668: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4669: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4670: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4671: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Green"
-},
-    4672: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4673: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4674: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4675: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4676: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    4677: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4678: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4679: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4680: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4681: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4682: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4683: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4684: {
-    "type": "Castle",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    4685: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4686: {
-    "type": "Retreat",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4687: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4688: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4689: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4690: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4691: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    4692: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4693: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    4694: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4695: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4696: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4697: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4698: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4699: {
-    "type": "Plaza",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Mythical"
-},
-    4700: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4701: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4702: {
-    "type": "Beach",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4703: {
-    "type": "Cave",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4704: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4705: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4706: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4707: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4708: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4709: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4710: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4711: {
-    "type": "Woodlands",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4712: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4713: {
-    "type": "Plaza",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    4714: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4715: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4716: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4717: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    4718: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4719: {
-    "type": "Saphiro",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4720: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4721: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4722: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    4723: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4724: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4725: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4726: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4727: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4728: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4729: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    4730: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4731: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4732: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    4733: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4734: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4735: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4736: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4737: {
-    "type": "Sea",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4738: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Green"
-},
-    4739: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4740: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4741: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4742: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4743: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4744: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "Basic"
-},
-    4745: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4746: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4747: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    4748: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4749: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4750: {
-    "type": "Saphiro",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4751: {
-    "type": "Saphiro",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    4752: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4753: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4754: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    4755: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4756: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4757: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    4758: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4759: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4760: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4761: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    4762: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4763: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4764: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    4765: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4766: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4767: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4768: {
-    "type": "Plaza",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4769: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4770: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4771: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4772: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4773: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4774: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4775: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4776: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4777: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    4778: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4779: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4780: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4781: {
-    "type": "Sea",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4782: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    4783: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4784: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4785: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4786: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4787: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4788: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4789: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4790: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4791: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4792: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4793: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4794: {
-    "type": "Cave",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4795: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4796: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Green"
-},
-    4797: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4798: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4799: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4800: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4801: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4802: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4803: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4804: {
-    "type": "Castle",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Mythical"
-},
-    4805: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4806: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4807: {
-    "type": "Snow",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4808: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4809: {
-    "type": "Retreat",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4810: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4811: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    4812: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4813: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4814: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4815: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4816: {
-    "type": "Castle",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    4817: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4818: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4819: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4820: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4821: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "Basic"
-},
-    4822: {
-    "type": "Retreat",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4823: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4824: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4825: {
-    "type": "Retreat",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Rare"
-},
-    4826: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4827: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4828: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "Basic"
-},
-    4829: {
-    "type": "Saphiro",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    4830: {
-    "type": "Castle",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4831: {
-    "type": "Saphiro",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4832: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4833: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4834: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4835: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Rare"
-},
-    4836: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4837: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4838: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4839: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Rare"
-},
-    4840: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4841: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4842: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4843: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    4844: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4845: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4846: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "Basic"
-},
-    4847: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4848: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Mythical"
-},
-    4849: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4850: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4851: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4852: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4853: {
-    "type": "Sea",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "No Aura"
-},
-    4854: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    4855: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    4856: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4857: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4858: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4859: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "Basic"
-},
-    4860: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4861: {
-    "type": "Cave",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4862: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4863: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4864: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4865: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Carrot Head",
-    "aura": "Rare"
-},
-    4866: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    4867: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4868: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4869: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4870: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4871: {
-    "type": "Woodlands",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4872: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4873: {
-    "type": "Sea",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Banana",
-    "aura": "No Aura"
-},
-    4874: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Ruby Gem",
-    "aura": "Basic"
-},
-    4875: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Green"
-},
-    4876: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4877: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Fish Hat",
-    "aura": "No Aura"
-},
-    4878: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Rare"
-},
-    4879: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4880: {
-    "type": "Cave",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4881: {
-    "type": "Cave",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Rare"
-},
-    4882: {
-    "type": "Snow",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4883: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Ruby Gem",
-    "aura": "No Aura"
-},
-    4884: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4885: {
-    "type": "Beach",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4886: {
-    "type": "Cave",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4887: {
-    "type": "Plaza",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4888: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4889: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4890: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4891: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4892: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4893: {
-    "type": "Retreat",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Egg Head",
-    "aura": "No Aura"
-},
-    4894: {
-    "type": "Port",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4895: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4896: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4897: {
-    "type": "Sea",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4898: {
-    "type": "Saphiro",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4899: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4900: {
-    "type": "Retreat",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4901: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4902: {
-    "type": "Woodlands",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4903: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4904: {
-    "type": "Plaza",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4905: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4906: {
-    "type": "Port",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4907: {
-    "type": "Beach",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4908: {
-    "type": "Cave",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4909: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4910: {
-    "type": "Sea",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Magic Mushroom",
-    "aura": "Basic"
-},
-    4911: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4912: {
-    "type": "Plaza",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4913: {
-    "type": "Retreat",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "No Aura"
-},
-    4914: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "Basic"
-},
-    4915: {
-    "type": "Woodlands",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4916: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4917: {
-    "type": "Port",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4918: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4919: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4920: {
-    "type": "Snow",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4921: {
-    "type": "Snow",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4922: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "Basic"
-},
-    4923: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tree Hat",
-    "aura": "No Aura"
-},
-    4924: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    4925: {
-    "type": "Woodlands",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "No Aura"
-},
-    4926: {
-    "type": "Port",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4927: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Green"
-},
-    4928: {
-    "type": "Cave",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4929: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "Basic"
-},
-    4930: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4931: {
-    "type": "Snow",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4932: {
-    "type": "Beach",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4933: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4934: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4935: {
-    "type": "Snow",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4936: {
-    "type": "Port",
-    "colour": "Stone",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4937: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "No Aura"
-},
-    4938: {
-    "type": "Cave",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4939: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Basic"
-},
-    4940: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4941: {
-    "type": "Port",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    4942: {
-    "type": "Plaza",
-    "colour": "Brown",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4943: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-    4944: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Sunshield Foliage",
-    "aura": "Basic"
-},
-    4945: {
-    "type": "Castle",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Egg Head",
-    "aura": "Green"
-},
-    4946: {
-    "type": "Beach",
-    "colour": "Brown",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4947: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4948: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4949: {
-    "type": "Beach",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "No Aura"
-},
-    4950: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4951: {
-    "type": "Saphiro",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Mythical"
-},
-    4952: {
-    "type": "Beach",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4953: {
-    "type": "Retreat",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "Green"
-},
-    4954: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4955: {
-    "type": "Saphiro",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "Basic"
-},
-    4956: {
-    "type": "Sea",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Green"
-},
-    4957: {
-    "type": "Woodlands",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4958: {
-    "type": "Beach",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Tree Hat",
-    "aura": "Basic"
-},
-    4959: {
-    "type": "Beach",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Mushroom",
-    "aura": "No Aura"
-},
-    4960: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4961: {
-    "type": "Castle",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "Basic"
-},
-    4962: {
-    "type": "Retreat",
-    "colour": "Red",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4963: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4964: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Basic"
-},
-    4965: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Seashell",
-    "aura": "Basic"
-},
-    4966: {
-    "type": "Beach",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Rainbow Horn",
-    "aura": "No Aura"
-},
-    4967: {
-    "type": "Sea",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Basic"
-},
-    4968: {
-    "type": "Snow",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Seashell",
-    "aura": "Green"
-},
-    4969: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4970: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Red Bow",
-    "aura": "No Aura"
-},
-    4971: {
-    "type": "Plaza",
-    "colour": "Diamond",
-    "ears": "No Ears",
-    "stem": "Apple Head",
-    "aura": "No Aura"
-},
-    4972: {
-    "type": "Woodlands",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4973: {
-    "type": "Beach",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Axe Head",
-    "aura": "No Aura"
-},
-    4974: {
-    "type": "Woodlands",
-    "colour": "Diamond",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "No Aura"
-},
-    4975: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Acorn Hat",
-    "aura": "No Aura"
-},
-    4976: {
-    "type": "Sea",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Gold Gem",
-    "aura": "No Aura"
-},
-    4977: {
-    "type": "Castle",
-    "colour": "Gold",
-    "ears": "No Ears",
-    "stem": "Red Bow",
-    "aura": "Rare"
-},
-    4978: {
-    "type": "Snow",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4979: {
-    "type": "Woodlands",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "Basic"
-},
-    4980: {
-    "type": "Retreat",
-    "colour": "Beige",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "Basic"
-},
-    4981: {
-    "type": "Plaza",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Green"
-},
-    4982: {
-    "type": "Snow",
-    "colour": "Stone",
-    "ears": "Ears",
-    "stem": "Carrot Head",
-    "aura": "Basic"
-},
-    4983: {
-    "type": "Port",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "3 Leaf Clover",
-    "aura": "No Aura"
-},
-    4984: {
-    "type": "Castle",
-    "colour": "Orange",
-    "ears": "Ears",
-    "stem": "Silver Horn",
-    "aura": "Green"
-},
-    4985: {
-    "type": "Port",
-    "colour": "Purple",
-    "ears": "No Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4986: {
-    "type": "Cave",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Basic Leaf",
-    "aura": "No Aura"
-},
-    4987: {
-    "type": "Port",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Axe Head",
-    "aura": "Basic"
-},
-    4988: {
-    "type": "Castle",
-    "colour": "Purple",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "Rare"
-},
-    4989: {
-    "type": "Retreat",
-    "colour": "Orange",
-    "ears": "No Ears",
-    "stem": "Sunflower Hat",
-    "aura": "No Aura"
-},
-    4990: {
-    "type": "Woodlands",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Hibiscus",
-    "aura": "Rare"
-},
-    4991: {
-    "type": "Snow",
-    "colour": "Beige",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4992: {
-    "type": "Plaza",
-    "colour": "Blue",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4993: {
-    "type": "Plaza",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Miner Hat",
-    "aura": "No Aura"
-},
-    4994: {
-    "type": "Saphiro",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Diamond Gem",
-    "aura": "No Aura"
-},
-    4995: {
-    "type": "Saphiro",
-    "colour": "Red",
-    "ears": "Ears",
-    "stem": "Sunflower Headband",
-    "aura": "No Aura"
-},
-    4996: {
-    "type": "Castle",
-    "colour": "Blue",
-    "ears": "Ears",
-    "stem": "Apple Head",
-    "aura": "Basic"
-},
-    4997: {
-    "type": "Sea",
-    "colour": "Silver",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "No Aura"
-},
-    4998: {
-    "type": "Castle",
-    "colour": "Green",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Basic"
-},
-    4999: {
-    "type": "Woodlands",
-    "colour": "Gold",
-    "ears": "Ears",
-    "stem": "Tender Coral",
-    "aura": "Green"
-},
-    5000: {
-    "type": "Port",
-    "colour": "Silver",
-    "ears": "No Ears",
-    "stem": "Hibiscus",
-    "aura": "Green"
-},
-}
+import bisect
+import json
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Mapping
+
+TRAITS = ("type", "colour", "ears", "stem", "aura")
+
+BUDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "buds.bin")
+
+_MAGIC = b"BUDS"
+_FORMAT_VERSION = 1
+# Cabeçalho: magia, versão, número de Buds.
+_HEADER = struct.Struct("<4sBI")
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def write_table(buds: dict, path: str = BUDS_FILE) -> None:
+    """Grava `buds` ({bud_id: {trait: valor}}) no formato de colunas lido por `BudTraitsTable`."""
+    ids = sorted(int(bud_id) for bud_id in buds)
+    rows = {int(bud_id): traits for bud_id, traits in buds.items()}
+
+    parts = [_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(ids))]
+    columns = []
+    for trait in TRAITS:
+        vocabulary = sorted({rows[bud_id][trait] for bud_id in ids})
+        if len(vocabulary) > 255:
+            raise ValueError(f"A característica '{trait}' tem mais de 255 valores distintos.")
+        parts.append(struct.pack("<B", len(vocabulary)))
+        for value in vocabulary:
+            encoded = value.encode("utf-8")
+            parts.append(struct.pack("<B", len(encoded)) + encoded)
+        codes = {value: index for index, value in enumerate(vocabulary)}
+        columns.append(bytes(codes[rows[bud_id][trait]] for bud_id in ids))
+
+    parts.append(_little_endian(array("I", ids)).tobytes())
+    parts.extend(columns)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(tmp_path, path)
+
+
+class BudTraitsTable(Mapping):
+    """
+    Mapeamento somente leitura bud_id -> características, lido de `path` no primeiro acesso.
+    Cada consulta devolve um dicionário novo.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._ids = None         # array('I') ordenado
+        self._vocabularies = None
+        self._columns = None     # bytes por característica, alinhados com _ids
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._ids is not None:
+                return
+            with open(self._path, "rb") as f:
+                data = f.read()
+            magic, version, count = _HEADER.unpack_from(data, 0)
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                raise ValueError(f"Ficheiro de Buds inválido ou de versão não suportada: {self._path}")
+            offset = _HEADER.size
+
+            vocabularies = []
+            for _ in TRAITS:
+                size = data[offset]
+                offset += 1
+                vocabulary = []
+                for _ in range(size):
+                    length = data[offset]
+                    vocabulary.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+                    offset += 1 + length
+                vocabularies.append(tuple(vocabulary))
+
+            ids = array("I")
+            ids.frombytes(data[offset:offset + count * ids.itemsize])
+            offset += count * ids.itemsize
+            columns = []
+            for _ in TRAITS:
+                columns.append(data[offset:offset + count])
+                offset += count
+
+            self._vocabularies = tuple(vocabularies)
+            self._columns = tuple(columns)
+            self._ids = _little_endian(ids)
+
+    def _row(self, bud_id):
+        if self._ids is None:
+            self._load()
+        if not isinstance(bud_id, int):
+            return None
+        row = bisect.bisect_left(self._ids, bud_id)
+        if row == len(self._ids) or self._ids[row] != bud_id:
+            return None
+        return row
+
+    def __getitem__(self, bud_id) -> dict:
+        row = self._row(bud_id)
+        if row is None:
+            raise KeyError(bud_id)
+        return {
+            trait: vocabulary[column[row]]
+            for trait, vocabulary, column in zip(TRAITS, self._vocabularies, self._columns)
+        }
+
+    def __contains__(self, bud_id) -> bool:
+        return self._row(bud_id) is not None
+
+    def __iter__(self):
+        if self._ids is None:
+            self._load()
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        if self._ids is None:
+            self._load()
+        return len(self._ids)
+
+
+BUDS_DATA = BudTraitsTable(BUDS_FILE)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("Uso: python -m app.domain.buds <buds.json>")
+    with open(sys.argv[1], encoding="utf-8") as source:
+        write_table(json.load(source))
+    print(f"{len(BUDS_DATA)} Buds gravados em {BUDS_FILE}.")
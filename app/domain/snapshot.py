@@ -0,0 +1,164 @@
+# app/domain/snapshot.py
+
+# Snapshot compilado dos módulos de dados de app/domain.
+#
+# Os módulos de domínio são, na sua maioria, grandes literais (skills, collectibles,
+# wearables, ...) e tabelas derivadas calculadas na importação (MASTER_ITEM_MAP,
+# MASTER_PRICE_MAP, ISLAND_COORDINATES, CROP_TIERS). Em vez de executar esse código em
+# cada worker, `flask --app run build-domain-snapshot` grava o estado final de todos eles num
+# único ficheiro `marshal`, e um import hook (instalado em app/domain/__init__.py)
+# preenche cada módulo a partir desse ficheiro, lido de uma só vez.
+#
+# Regras:
+# - Um módulo só entra no snapshot se todas as funções/classes que define forem
+#   auxiliares privadas da importação (nome começado por "_"); essas ficam de fora.
+#   Módulos com API pública própria (ex: buds.BudTraitsTable) são sempre importados do código.
+# - O snapshot guarda um hash do código de todos os módulos de domínio e da versão
+#   do Python; se não coincidir (código alterado sem regenerar), é ignorado e os
+#   módulos são importados normalmente. DOMAIN_SNAPSHOT_ENABLED=false desativa o snapshot.
+
+import hashlib
+import importlib
+import importlib.abc
+import importlib.util
+import logging
+import marshal
+import os
+import pkgutil
+import sys
+import time
+import types
+
+log = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_DOMAIN_DIR = os.path.dirname(os.path.abspath(__file__))
+_PACKAGE = __name__.rpartition(".")[0]
+
+SNAPSHOT_FILE = os.path.join(_DOMAIN_DIR, "domain_snapshot.bin")
+
+_snapshot_modules = {}  # nome completo do módulo -> {"values": {...}, "refs": {...}}
+
+
+def source_version() -> str:
+    """Hash do código de todos os módulos de domínio, do formato e da versão do Python."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{FORMAT_VERSION}:{sys.version_info[:2]}:{marshal.version}".encode())
+    for name in sorted(os.listdir(_DOMAIN_DIR)):
+        if name.endswith(".py"):
+            with open(os.path.join(_DOMAIN_DIR, name), "rb") as f:
+                digest.update(name.encode())
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _module_state(module):
+    """
+    Divide o namespace do módulo em valores (serializáveis com marshal) e referências
+    (módulos, loggers, objetos importados). Devolve None se o módulo não puder entrar no snapshot.
+    """
+    values, refs = {}, {}
+    for name, value in vars(module).items():
+        if name.startswith("__"):
+            continue
+        if isinstance(value, types.ModuleType):
+            refs[name] = ("module", value.__name__)
+        elif isinstance(value, logging.Logger):
+            refs[name] = ("logger", value.name)
+        elif isinstance(value, (types.FunctionType, type)):
+            if value.__module__ == module.__name__:
+                if not name.startswith("_"):
+                    return None  # API pública definida no módulo: tem de ser importado do código.
+                continue  # Auxiliar da importação; o resultado já está nos valores.
+            refs[name] = ("object", value.__module__, value.__qualname__)
+        else:
+            values[name] = value
+    try:
+        marshal.dumps(values)
+    except ValueError:
+        return None
+    return {"values": values, "refs": refs}
+
+
+def build(path: str = SNAPSHOT_FILE) -> list:
+    """Importa todos os módulos de domínio e grava o snapshot. Devolve os módulos incluídos."""
+    modules = {}
+    package = importlib.import_module(_PACKAGE)
+    for info in pkgutil.iter_modules(package.__path__):
+        full_name = f"{_PACKAGE}.{info.name}"
+        if full_name == __name__:
+            continue
+        state = _module_state(importlib.import_module(full_name))
+        if state is None:
+            log.info(f"Módulo '{full_name}' fora do snapshot (define API própria ou dados não serializáveis).")
+        else:
+            modules[full_name] = state
+
+    # Um único marshal.dumps preserva os objetos partilhados entre módulos.
+    payload = marshal.dumps({"format": FORMAT_VERSION, "version": source_version(), "modules": modules})
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return sorted(modules)
+
+
+def _resolve_ref(ref):
+    kind = ref[0]
+    if kind == "module":
+        return importlib.import_module(ref[1])
+    if kind == "logger":
+        return logging.getLogger(ref[1])
+    value = importlib.import_module(ref[1])
+    for part in ref[2].split("."):
+        value = getattr(value, part)
+    return value
+
+
+class _SnapshotLoader(importlib.abc.Loader):
+    def create_module(self, spec):
+        return None  # Módulo padrão.
+
+    def exec_module(self, module):
+        state = _snapshot_modules.pop(module.__name__)
+        module.__dict__.update(state["values"])
+        for name, ref in state["refs"].items():
+            module.__dict__[name] = _resolve_ref(ref)
+
+
+class _SnapshotFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in _snapshot_modules:
+            return None
+        origin = os.path.join(_DOMAIN_DIR, fullname.rpartition(".")[2] + ".py")
+        spec = importlib.util.spec_from_loader(fullname, _SnapshotLoader(), origin=origin)
+        spec.has_location = True
+        return spec
+
+
+def install() -> bool:
+    """Carrega o snapshot, se existir e estiver atualizado, e instala o import hook."""
+    import config
+
+    if not config.DOMAIN_SNAPSHOT_ENABLED:
+        return False
+    start_time = time.perf_counter()
+    try:
+        with open(SNAPSHOT_FILE, "rb") as f:
+            data = marshal.loads(f.read())
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        log.warning(f"Snapshot de domínio ilegível ({SNAPSHOT_FILE}): {e}")
+        return False
+
+    if data.get("format") != FORMAT_VERSION or data.get("version") != source_version():
+        log.warning("Snapshot de domínio desatualizado; a importar os módulos do código. Regenere com 'flask --app run build-domain-snapshot'.")
+        return False
+
+    _snapshot_modules.update(data["modules"])
+    if not any(isinstance(finder, _SnapshotFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _SnapshotFinder())
+    log.debug(f"Snapshot de domínio carregado com {len(_snapshot_modules)} módulos em {(time.perf_counter() - start_time) * 1000:.1f} ms.")
+    return True
@@ -0,0 +1,141 @@
+# app/http_client.py
+"""
+Cliente HTTP partilhado para as chamadas às APIs de origem (Sunflower Land e sfl.world).
+
+Cada worker mantém uma única `requests.Session` com um pool de ligações keep-alive,
+política de novas tentativas com backoff e negociação de compressão (gzip/brotli).
+Assim, DNS, TCP e TLS são pagos uma vez por host e não a cada falha de cache.
+"""
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+import config
+
+from . import metrics
+
+log = logging.getLogger(__name__)
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """
+    Cria a sessão com o adaptador de pool e a política de novas tentativas
+    definidos em `config.py`.
+    """
+    retry_policy = Retry(
+        total=config.SFL_HTTP_MAX_RETRIES,
+        backoff_factor=config.SFL_HTTP_BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        # Devolve a última resposta em vez de lançar RetryError, para que
+        # `raise_for_status()` continue a produzir o HTTPError esperado pelos chamadores.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config.SFL_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.SFL_HTTP_POOL_SIZE,
+        max_retries=retry_policy,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # O urllib3 só anuncia 'br' quando há um descompressor brotli instalado.
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+    log.info(
+        f"Sessão HTTP criada para o worker {os.getpid()} "
+        f"(pool={config.SFL_HTTP_POOL_SIZE}, retries={config.SFL_HTTP_MAX_RETRIES}, encoding='{ACCEPT_ENCODING}')"
+    )
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Devolve a sessão do processo atual, criando-a na primeira utilização.
+    A verificação do PID garante que cada worker do gunicorn tem o seu próprio
+    pool, mesmo quando a aplicação é carregada antes do fork.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+    return _session
+
+
+def get(url: str, source: str = "other", **kwargs) -> requests.Response:
+    """
+    Executa um GET através da sessão partilhada. Aceita os mesmos argumentos de `requests.get`.
+    `source` identifica a função chamadora nas métricas de chamadas às APIs de origem.
+    """
+    start = time.perf_counter()
+    try:
+        response = get_session().get(url, **kwargs)
+    except Exception as e:
+        _record_upstream_call(source, type(e).__name__, time.perf_counter() - start)
+        raise
+    _record_upstream_call(source, response.status_code, time.perf_counter() - start)
+    _record_connection_usage()
+    return response
+
+
+def _record_upstream_call(source: str, status, elapsed: float) -> None:
+    metrics.inc("upstream_requests_total", function=source, status=status)
+    metrics.observe("upstream_request_duration_seconds", elapsed, function=source)
+
+
+# id(pool) -> (pool, {kind: total}) já contados em `upstream_connections_total`.
+_counted_pools = {}
+_counted_pools_lock = threading.Lock()
+
+
+def _record_connection_usage() -> None:
+    """
+    Soma a `upstream_connections_total{host,kind}` as ligações novas (com handshake) e
+    os pedidos que reutilizaram uma ligação aberta desde a última chamada, a partir dos
+    contadores dos pools do urllib3 deste worker.
+    """
+    if _session is None or _session_pid != os.getpid():
+        return
+
+    pools = []
+    seen_adapters = set()
+    for adapter in _session.adapters.values():
+        if id(adapter) in seen_adapters:
+            continue
+        seen_adapters.add(id(adapter))
+        pool_manager = adapter.poolmanager
+        for pool_key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(pool_key)
+            if pool is not None:
+                pools.append(pool)
+
+    with _counted_pools_lock:
+        current = {}
+        for pool in pools:
+            totals = {
+                "new": pool.num_connections,
+                "reused": max(pool.num_requests - pool.num_connections, 0),
+            }
+            counted = _counted_pools.get(id(pool))
+            # Um pool removido do LRU do urllib3 é substituído por um novo, que recomeça do zero.
+            counted_totals = counted[1] if counted is not None and counted[0] is pool else {}
+            for kind, total in totals.items():
+                delta = total - counted_totals.get(kind, 0)
+                if delta > 0:
+                    metrics.inc("upstream_connections_total", delta, host=pool.host, kind=kind)
+            current[id(pool)] = (pool, totals)
+        _counted_pools.clear()
+        _counted_pools.update(current)
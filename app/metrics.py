@@ -0,0 +1,258 @@
+# app/metrics.py
+"""
+Métricas no formato de texto do Prometheus, agregadas entre os workers do gunicorn.
+
+- Cada worker acumula contadores e histogramas em memória (`_Registry`).
+- Periodicamente (`METRICS_FLUSH_SECONDS`, verificado no fim de cada pedido) o
+  worker grava um instantâneo em `METRICS_DIR/worker-<id>.json` (escrita atómica).
+  O `<id>` é gerado por processo, para que um worker novo com o PID de um antigo
+  não sobrescreva os valores deste.
+- `/metrics` soma os ficheiros de todos os workers, usando os valores em memória
+  para o worker que responde. Os ficheiros de workers que já terminaram continuam
+  a contar, para que os contadores não diminuam; o gunicorn limpa o diretório ao
+  arrancar (`on_starting` em gunicorn.conf.py).
+
+Métricas exportadas:
+- `http_request_duration_seconds{route,method,status}`: latência por rota.
+- `upstream_requests_total{function,status}` e `upstream_request_duration_seconds{function}`:
+  chamadas às APIs de origem por função do `sunflower_api` (status HTTP ou nome da exceção).
+- `upstream_connections_total{host,kind}`: ligações às APIs de origem abertas (`new`) e
+  reutilizadas do pool keep-alive (`reused`), ver app/http_client.py.
+- `cache_requests_total{prefix,result}` e `cache_evictions_total{prefix}`: acertos
+  (memória/disco), falhas e remoções do LRU em memória, por prefixo de chave.
+- `dashboard_step_duration_seconds{step}`: duração de cada passo de análise do painel.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from flask import g, request
+
+import config
+
+log = logging.getLogger(__name__)
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Nome -> (tipo, descrição, buckets do histograma)
+METRICS = {
+    "http_request_duration_seconds": ("histogram", "Latência dos pedidos HTTP por rota.", _LATENCY_BUCKETS),
+    "upstream_requests_total": ("counter", "Chamadas às APIs de origem por função e resultado.", None),
+    "upstream_request_duration_seconds": ("histogram", "Latência das chamadas às APIs de origem.", _LATENCY_BUCKETS),
+    "upstream_connections_total": ("counter", "Ligações às APIs de origem: novas ou reutilizadas do pool.", None),
+    "cache_requests_total": ("counter", "Consultas ao cache por prefixo de chave e resultado.", None),
+    "cache_evictions_total": ("counter", "Entradas removidas do cache em memória por falta de espaço.", None),
+    "dashboard_step_duration_seconds": ("histogram", "Duração dos passos de análise do painel.", _LATENCY_BUCKETS),
+}
+
+# Prefixos das chaves de cache usados como rótulo (os restantes contam como 'other').
+CACHE_KEY_PREFIXES = ("farm_data_", "sfl_world_", "analysis_", "panel_", "prices", "exchange")
+
+
+def cache_key_prefix(key: str) -> str:
+    for prefix in CACHE_KEY_PREFIXES:
+        if key.startswith(prefix):
+            return prefix
+    return "other"
+
+
+class _Registry:
+    """Valores deste worker: (nome, rótulos) -> contador, ou [contagens por bucket, soma, total]."""
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def inc(self, name: str, labels: tuple, amount: float = 1.0) -> None:
+        with self.lock:
+            self.counters[(name, labels)] = self.counters.get((name, labels), 0.0) + amount
+
+    def observe(self, name: str, labels: tuple, value: float) -> None:
+        buckets = METRICS[name][2]
+        with self.lock:
+            entry = self.histograms.get((name, labels))
+            if entry is None:
+                entry = self.histograms[(name, labels)] = [[0] * len(buckets), 0.0, 0]
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "counters": [[name, list(labels), value] for (name, labels), value in self.counters.items()],
+                "histograms": [
+                    [name, list(labels), list(counts), total, count]
+                    for (name, labels), (counts, total, count) in self.histograms.items()
+                ],
+            }
+
+
+_registry = _Registry()
+_registry_pid = os.getpid()
+_registry_id = uuid.uuid4().hex
+_last_flush = 0.0
+_flush_lock = threading.Lock()
+
+
+def _get_registry() -> _Registry:
+    """Registo do processo atual; um worker criado por fork não herda os valores do processo pai."""
+    global _registry, _registry_pid, _registry_id
+    if _registry_pid != os.getpid():
+        with _flush_lock:
+            if _registry_pid != os.getpid():
+                _registry = _Registry()
+                _registry_id = uuid.uuid4().hex
+                _registry_pid = os.getpid()
+    return _registry
+
+
+def _labels(**labels) -> tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def inc(name: str, amount: float = 1.0, **labels) -> None:
+    if config.METRICS_ENABLED:
+        _get_registry().inc(name, _labels(**labels), amount)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    if config.METRICS_ENABLED:
+        _get_registry().observe(name, _labels(**labels), value)
+
+
+# --- Armazenamento partilhado entre workers ---
+
+def _worker_file() -> str:
+    _get_registry()  # Garante o identificador do processo atual (depois de um fork).
+    return os.path.join(config.METRICS_DIR, f"worker-{_registry_id}.json")
+
+
+def clear_dir() -> None:
+    """Remove os instantâneos gravados por uma execução anterior (ver gunicorn.conf.py)."""
+    try:
+        names = os.listdir(config.METRICS_DIR)
+    except FileNotFoundError:
+        return
+    for name in names:
+        if name.startswith("worker-") and (name.endswith(".json") or name.endswith(".tmp")):
+            try:
+                os.remove(os.path.join(config.METRICS_DIR, name))
+            except OSError as e:
+                log.warning(f"Não foi possível remover o ficheiro de métricas '{name}': {e}")
+
+
+def flush(force: bool = False) -> None:
+    """Grava o instantâneo deste worker, no máximo uma vez por `METRICS_FLUSH_SECONDS`."""
+    global _last_flush
+    now = time.monotonic()
+    if not force and now - _last_flush < config.METRICS_FLUSH_SECONDS:
+        return
+    with _flush_lock:
+        if not force and now - _last_flush < config.METRICS_FLUSH_SECONDS:
+            return
+        _last_flush = now
+    try:
+        os.makedirs(config.METRICS_DIR, exist_ok=True)
+        path = _worker_file()
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_get_registry().snapshot(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning(f"Não foi possível gravar as métricas do worker {os.getpid()}: {e}")
+
+
+def _load_snapshots() -> list:
+    """Instantâneos de todos os workers; o deste worker vem da memória, e não do disco."""
+    snapshots = [_get_registry().snapshot()]
+    own_file = os.path.basename(_worker_file())
+    try:
+        names = os.listdir(config.METRICS_DIR)
+    except FileNotFoundError:
+        return snapshots
+    for name in names:
+        if not (name.startswith("worker-") and name.endswith(".json")) or name == own_file:
+            continue
+        try:
+            with open(os.path.join(config.METRICS_DIR, name), encoding="utf-8") as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError) as e:
+            log.warning(f"Ficheiro de métricas '{name}' ignorado: {e}")
+    return snapshots
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(str(value))}"' for key, value in labels) + "}"
+
+
+def render_prometheus() -> str:
+    """Texto de exposição do Prometheus com a soma dos valores de todos os workers."""
+    counters = {}
+    histograms = {}
+    for snapshot in _load_snapshots():
+        for name, labels, value in snapshot.get("counters", []):
+            key = (name, tuple(tuple(label) for label in labels))
+            counters[key] = counters.get(key, 0.0) + value
+        for name, labels, counts, total, count in snapshot.get("histograms", []):
+            if name not in METRICS or len(counts) != len(METRICS[name][2]):
+                continue  # Instantâneo de uma versão com outros buckets.
+            key = (name, tuple(tuple(label) for label in labels))
+            entry = histograms.setdefault(key, [[0] * len(counts), 0.0, 0])
+            entry[0] = [a + b for a, b in zip(entry[0], counts)]
+            entry[1] += total
+            entry[2] += count
+
+    lines = []
+    for name, (metric_type, description, buckets) in METRICS.items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        if metric_type == "counter":
+            for (metric_name, labels), value in sorted(counters.items()):
+                if metric_name == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        else:
+            for (metric_name, labels), (counts, total, count) in sorted(histograms.items()):
+                if metric_name != name:
+                    continue
+                for bound, bucket_count in zip(buckets, counts):
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', f'{bound:g}'),))} {bucket_count}")
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {total:.6f}")
+                lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def init_app(app) -> None:
+    """Regista a medição da latência de cada pedido e a gravação periódica das métricas."""
+    if not config.METRICS_ENABLED:
+        return
+
+    @app.before_request
+    def _start_request_metrics():
+        g.metrics_request_start = time.perf_counter()
+
+    @app.after_request
+    def _finish_request_metrics(response):
+        start = g.pop("metrics_request_start", None)
+        if start is not None:
+            # A regra da rota (ex: '/farm/<int:farm_id>') evita um rótulo por fazenda.
+            route = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+            observe(
+                "http_request_duration_seconds", time.perf_counter() - start,
+                route=route, method=request.method, status=response.status_code
+            )
+        flush()
+        return response
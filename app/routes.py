@@ -1,16 +1,22 @@
 # app/routes.py
+import hmac
 import logging
+import os
+import threading
 from collections import defaultdict
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 
-from flask import (Blueprint, current_app, json, jsonify, redirect,
-                   render_template, request, url_for)
+from flask import (Blueprint, Response, current_app, g, json, jsonify, redirect,
+                   render_template, request, stream_template, url_for)
 from markupsafe import Markup
 
 import config
 
-from . import analysis, game_state, sunflower_api
+from . import (analysis, dashboard_cache, dashboard_pipeline, game_state,
+               metrics, serialization, startup, sunflower_api,
+               timings)
+from .dashboard_pipeline import Step
 from .analysis import build_bumpkin_image_url
 from .cache import cache  # Importa o objeto 'cache' diretamente
 from .domain import crops as crops_domain
@@ -20,13 +26,14 @@ from .domain import foods as foods_domain
 from .domain import fruits as fruit_domain
 from .domain import npcs as npc_domain
 from .game_state import GAME_STATE
-from .services import (animation_service, bud_service, chop_service, chores_service,
+from .services import (animation_service, chop_service, chores_service,
                        crop_machine_service, crop_service, delivery_service,
                        exchange_service, expansion_service,
                        farm_layout_service, flower_service, fruit_service, crimstone_service,
                        sunstone_service, oil_service, lava_service,
                        greenhouse_service, mining_service, mushrooms_service,
-                       pricing_service, summary_service, treasure_dig_service, calendar_service)
+                       pricing_service, resource_analysis_service, summary_service,
+                       treasure_dig_service, calendar_service)
 
 log = logging.getLogger(__name__)
 bp = Blueprint('main', __name__)
@@ -85,55 +92,82 @@ def get_item_prices(item_name):
     if not item_name: return {}
     return pricing_service.get_item_prices(item_name)
 
-@bp.app_template_filter()
-def generate_currency_html(sfl_value, prefix=""):
-    """
-    Filtro do Jinja para gerar a estrutura HTML com todos os valores de moeda pré-calculados.
-    Isso espelha a funcionalidade de `generateCurrencyHTML` no TypeScript.
-    """
-    if sfl_value is None:
+# Bandeiras usadas em `generate_currency_html` (replica a formatação do TypeScript).
+_SFL_FLAG = '<img src="/static/images/resources/flower.webp" alt="SFL" class="icon icon-1x me-1">'
+_USD_FLAG = '<span class="fi fi-us me-2"></span>'
+_BRL_FLAG = '<span class="fi fi-br me-2"></span>'
+
+
+def _format_currency_html(value, prefix, from_currency, rates):
+    """HTML de um valor em Flower, USD e BRL com as taxas de `rates` (um `RatesSnapshot`)."""
+    if value is None:
         return ""
-        
+
     try:
-        sfl_value = Decimal(sfl_value)
+        sfl_value = Decimal(value)
     except (InvalidOperation, TypeError):
         return ""
+    if from_currency == "coins":
+        sfl_value *= rates.coin_sfl
 
-    rates = exchange_service.get_exchange_rates().get('sfl', {})
-    
-    usd_rate = Decimal(str(rates.get('usd', 0)))
-    brl_rate = Decimal(str(rates.get('brl', 0)))
-
-    usd_value = sfl_value * usd_rate
-    brl_value = sfl_value * brl_rate
-
-# Replica a lógica de formatação do TypeScript, incluindo as bandeiras
-    sfl_flag = '<img src="/static/images/resources/flower.webp" alt="SFL" class="icon icon-1x me-1">'
-    usd_flag = '<span class="fi fi-us me-2"></span>'
-    brl_flag = '<span class="fi fi-br me-2"></span>'
-    sfl_formatted = f"{sfl_flag}{prefix}{sfl_value:,.2f} Flower"
-    usd_formatted = f"{usd_flag}{prefix}US$ {usd_value:,.2f}"
-    brl_formatted = f"{brl_flag}{prefix}R$ {brl_value:,.2f}"
+    usd_value = sfl_value * rates.sfl_usd
+    brl_value = sfl_value * rates.sfl_brl
+
+    sfl_formatted = f"{_SFL_FLAG}{prefix}{sfl_value:,.2f} Flower"
+    usd_formatted = f"{_USD_FLAG}{prefix}US$ {usd_value:,.2f}"
+    brl_formatted = f"{_BRL_FLAG}{prefix}R$ {brl_value:,.2f}"
     html = f"""<span class="currency-container">
         <span class="currency-value-display currency-flower">{sfl_formatted}</span>
         <span class="currency-value-display currency-usd">{usd_formatted}</span>
         <span class="currency-value-display currency-brl">{brl_formatted}</span>
-    </span>"""    
+    </span>"""
     return Markup(html)
 
 
+@bp.app_template_filter()
+def generate_currency_html(sfl_value, prefix="", from_currency="sfl"):
+    """
+    Filtro do Jinja para gerar a estrutura HTML com todos os valores de moeda pré-calculados.
+    Isso espelha a funcionalidade de `generateCurrencyHTML` no TypeScript.
+    Com `from_currency='coins'`, o valor é convertido de Coins para Flower antes.
+    As taxas são as do pedido atual (ver `exchange_service.get_request_rates`).
+    """
+    return _format_currency_html(sfl_value, prefix, from_currency, exchange_service.get_request_rates())
+
+
+@bp.app_template_filter()
+def generate_currency_html_list(values, prefix="", from_currency="sfl"):
+    """
+    Versão em lote de `generate_currency_html` para tabelas de valores: devolve
+    a lista de fragmentos HTML, pela mesma ordem, com uma única leitura das taxas.
+    """
+    rates = exchange_service.get_request_rates()
+    return [_format_currency_html(value, prefix, from_currency, rates) for value in values]
+
+
 @bp.route('/api/animated-characters')
 def api_animated_characters():
     """
     Endpoint da API que busca os personagens animados do serviço e os retorna em JSON.
+
+    A resposta vem do manifesto construído no arranque. Pedida com `?v=<versão>`
+    (o URL que o base.html fornece), pode ficar em cache no navegador por tempo
+    indeterminado, pois uma nova versão muda o URL; sem versão, é revalidada pelo ETag.
     """
     try:
-        characters = animation_service.get_animated_characters()
-        return jsonify(characters)
+        manifest = animation_service.get_manifest()
     except Exception as e:
         log.error(f"Erro ao buscar personagens animados para a API: {e}", exc_info=True)
         return jsonify({"error": "Não foi possível buscar a lista de personagens"}), 500
 
+    response = Response(manifest.payload, mimetype="application/json")
+    response.set_etag(manifest.version)
+    if request.args.get('v') == manifest.version:
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    else:
+        response.headers["Cache-Control"] = "public, max-age=300"
+    return response.make_conditional(request)
+
 
 @bp.route('/', methods=['GET'])
 def index():
@@ -149,29 +183,24 @@ def handle_farm_request():
     return redirect(url_for('main.index'))
 
 @bp.route('/api/exchange-rates')
-@cache.cached(timeout=600)  # Cache de 10 minutos para este endpoint
 def api_exchange_rates():
     """
     Endpoint da API para fornecer as taxas de câmbio em formato JSON.
     O frontend chamará este endpoint para inicializar o conversor de moeda.
+    As cotações vêm de um cache stale-while-revalidate, por isso esta rota nunca
+    espera pela sfl.world; 'last_refreshed' indica a idade dos dados (epoch, segundos).
     """
     try:
-        rates = exchange_service.get_exchange_rates()
-        return jsonify(rates)
+        rates = exchange_service.get_request_rates().as_dict()
+        return jsonify({**rates, "last_refreshed": sunflower_api.get_exchange_data.last_refreshed()})
     except Exception as e:
         log.error(f"Erro ao buscar taxas de câmbio para a API: {e}", exc_info=True)
         return jsonify({"error": "Não foi possível buscar as taxas de câmbio"}), 500
 
-@bp.route('/farm/<int:farm_id>')
-def farm_dashboard(farm_id):
-    """
-    Exibe o painel de bordo completo para uma fazenda específica, usando a
-    estrutura de dados de expansão unificada.
-    """
-    log.info(f"Iniciando a montagem do painel para a fazenda #{farm_id}")
 
-    # 1. Contexto base com valores padrão seguros.
-    context = {
+def _new_dashboard_context(farm_id):
+    """Contexto base do painel com valores padrão seguros."""
+    return {
         "farm_id": farm_id, "username": f"Fazenda #{farm_id}", "error": None,
         "sfl": 0, "coins": 0, "bumpkin_level": 0, "current_land_level": 0,
         "current_land_type": "basic", "expansion_progress": None,
@@ -191,21 +220,29 @@ def farm_dashboard(farm_id):
         "enumerate": enumerate
     }
 
-    unified_analyses = [] # Inicialização movida para o início da função
 
+def _load_farm_context(farm_id, context):
+    """
+    Busca os dados da fazenda e dos preços e preenche os dados gerais do contexto
+    (passos 2 e 3 do painel).
+
+    Retorna:
+        tuple: (main_farm_data, secondary_farm_data), ou (None, None) se a busca
+               falhou; nesse caso a mensagem fica em `context['error']`.
+    """
     # 2. Busca dos dados das APIs.
     try:
-        main_farm_data, secondary_farm_data, api_error = sunflower_api.get_farm_data(farm_id)
-        prices_data, prices_error = sunflower_api.get_prices_data()
+        with timings.measure("fetch.farm"):
+            main_farm_data, secondary_farm_data, api_error = sunflower_api.get_farm_data(farm_id)
+        with timings.measure("fetch.prices"):
+            prices_data, prices_error = sunflower_api.get_prices_data()
 
         if api_error or prices_error:
             context['error'] = api_error or prices_error
-            return render_template('dashboard.html', title=f"Erro na Fazenda #{farm_id}", **context)
+            return None, None
     except Exception as e:
         context['error'] = f"Falha crítica ao comunicar com as APIs: {e}"
-        return render_template('dashboard.html', title=f"Erro na Fazenda #{farm_id}", **context)
-
-    
+        return None, None
 
     # CORREÇÃO: Adiciona os dados de preços ao contexto para serem usados no `base.html`.
     context['prices_data'] = prices_data
@@ -247,354 +284,633 @@ def farm_dashboard(farm_id):
     except Exception as e:
         log.error(f"Erro ao processar dados gerais: {e}")
 
-    # 3.5. Processamento da Imagem do Bumpkin
-    try:
-        bumpkin_data = main_farm_data.get("bumpkin", {})
-        equipped_items = bumpkin_data.get("equipped")
+    return main_farm_data, secondary_farm_data
 
-        # NOVO: Corrige o nome do item "Parsnip" vindo da API para "Parsnip Sword"
-        if equipped_items and equipped_items.get("Tool") == "Parsnip":
-            log.info("API retornou 'Parsnip' como ferramenta, corrigindo para 'Parsnip Sword'.")
-            equipped_items["Tool"] = "Parsnip Sword"
-            
-        if equipped_items:
-            # Passa o dicionário de itens para a função de construção
-            context['bumpkin_image_url'] = analysis.build_bumpkin_image_url(equipped_items)
-            log.info(f"URL da imagem do Bumpkin gerada para a fazenda #{farm_id}")
-        else:
-            log.warning(f"Dicionário 'equipped' não encontrado para a fazenda #{farm_id}.")
-            
-    except Exception as e:
-        log.error(f"Erro ao processar a imagem do Bumpkin para a fazenda #{farm_id}: {e}", exc_info=True)  
 
-    # 4. Processamento dos NODES (recursos por nível) da Expansão Atual.
+@bp.route('/farm/<int:farm_id>')
+def farm_dashboard(farm_id):
+    """
+    Exibe o painel de bordo completo para uma fazenda específica, usando a
+    estrutura de dados de expansão unificada.
+
+    Com `DASHBOARD_LAZY_PANELS`, a página sai sem as análises e cada painel é
+    carregado depois pelo navegador a partir de `/farm/<id>/panel/<nome>`.
+    Com `DASHBOARD_STREAMING`, a página é enviada por partes (ver `_stream_dashboard`).
+    """
+    log.info(f"Iniciando a montagem do painel para a fazenda #{farm_id}")
+
+    # 1. Contexto base com valores padrão seguros.
+    context = _new_dashboard_context(farm_id)
+
+    # 2-3. Dados das APIs e dados gerais.
+    main_farm_data, secondary_farm_data = _load_farm_context(farm_id, context)
+    if main_farm_data is None:
+        return render_template('dashboard.html', title=f"Erro na Fazenda #{farm_id}", **context)
+
+    if config.DASHBOARD_LAZY_PANELS:
+        context['lazy_panels'] = True
+    elif config.DASHBOARD_STREAMING:
+        return _stream_dashboard(farm_id, main_farm_data, secondary_farm_data, context)
+    else:
+        # 4-20. Análises da fazenda. O resultado é reutilizado enquanto os dados da
+        # fazenda, os domínios e o estado dos recursos não mudarem (ver dashboard_cache).
+        with timings.measure("analysis"):
+            context.update(dashboard_cache.get_dashboard_analysis(
+                farm_id, main_farm_data, secondary_farm_data, context,
+                compute=_run_dashboard_analysis
+            ))
+
+    with timings.measure("render"):
+        return render_template('dashboard.html', title=f"Painel de {context['username']}", **context)
+
+
+# Marcador emitido pelo dashboard.html antes de cada painel em streaming: tudo o que
+# foi gerado até ele é enviado ao navegador antes de esperar pelas análises do painel.
+_STREAM_FLUSH_MARKER = Markup("<!-- stream-flush -->")
+
+
+def _stream_dashboard(farm_id, main_farm_data, secondary_farm_data, context):
+    """
+    Renderiza o painel em streaming.
+
+    O cabeçalho da página (head, CSS e abas) é enviado logo que os dados da fazenda
+    chegam, para que o navegador comece a buscar os recursos estáticos. As análises
+    correm numa thread à parte; cada painel é escrito, pela ordem da página, assim
+    que os passos de que precisa terminam.
+    """
+    app = current_app._get_current_object()
+    progress = dashboard_pipeline.StepProgress()
+    recorder = timings.current()
+
+    def compute(farm_id, main_farm_data, secondary_farm_data, analysis_context):
+        _run_dashboard_analysis(
+            farm_id, main_farm_data, secondary_farm_data, analysis_context,
+            on_step_done=progress.step_done
+        )
+
+    def run_analysis():
+        result = {}
+        try:
+            with app.app_context():
+                if recorder is not None:
+                    # As etapas medidas nesta thread contam para o pedido (ver timings.finish_on_close).
+                    g.request_timings = recorder
+                with timings.measure("analysis"):
+                    result = dashboard_cache.get_dashboard_analysis(
+                        farm_id, main_farm_data, secondary_farm_data, context, compute=compute
+                    )
+        except Exception as e:
+            log.error(f"Falha nas análises em streaming da fazenda #{farm_id}: {e}", exc_info=True)
+        finally:
+            progress.finish(result)
+
+    threading.Thread(target=run_analysis, name=f"dashboard-stream-{farm_id}", daemon=True).start()
+
+    def render_panel(name):
+        template, step_names = DASHBOARD_PANELS[name]
+        try:
+            panel_context = progress.wait_for(step_names)
+            return Markup(render_template(template, **{**context, **panel_context}))
+        except Exception as e:
+            log.error(f"Falha ao renderizar o painel '{name}' em streaming: {e}", exc_info=True)
+            return Markup(render_template('partials/_panel_error.html', error="Não foi possível carregar este painel."))
+
+    def coalesce(chunks):
+        # O Jinja produz muitos fragmentos pequenos; são agrupados até cada marcador.
+        buffer = []
+        for chunk in chunks:
+            if chunk == _STREAM_FLUSH_MARKER:
+                if buffer:
+                    yield "".join(buffer)
+                    buffer = []
+            else:
+                buffer.append(chunk)
+        if buffer:
+            yield "".join(buffer)
+
+    chunks = stream_template(
+        'dashboard.html', title=f"Painel de {context['username']}",
+        stream_panels=True, stream_flush=lambda: _STREAM_FLUSH_MARKER, render_panel=render_panel,
+        **context
+    )
+    response = Response(coalesce(chunks), mimetype="text/html")
+    # Evita que um proxy (ex: nginx) acumule a resposta antes de a enviar.
+    response.headers["X-Accel-Buffering"] = "no"
+    # Os passos ainda não correram: as medições vão só para /internal/timings, no fim.
+    timings.finish_on_close(response)
+    return response
+
+
+# Painéis do painel de bordo que podem ser pedidos em separado:
+# nome -> (template parcial, passos de análise de que o painel precisa).
+DASHBOARD_PANELS = {
+    "geral": ('partials/_geral_panel.html', ('bumpkin_image', 'unified')),
+    "wood": ('partials/_wood_panel.html', ('wood',)),
+    "expansion": ('partials/_expansion_panel.html', ('level_nodes', 'expansion_progress', 'expansion_goals', 'expansion_map')),
+    "inventory": ('partials/_inventory_panel.html', ()),
+    "deliveries": ('partials/_deliveries_panel.html', ('deliveries',)),
+    "chores": ('partials/_chores_panel.html', ('chores',)),
+    "fishing": ('partials/_fishing_panel.html', ('fishing',)),
+    "flowers": ('partials/_flowers_panel.html', ('flower_info', 'npc_gifts')),
+    "treasure_dig": ('partials/_treasuredig_panel.html', ('treasure_dig',)),
+    "layout_map": ('partials/_layout_map_panel.html', ('layout_map',)),
+    "summary": ('partials/_summary_panel.html', ('resources_summary',)),
+    "buds": ('partials/_buds_panel.html', ('buds',)),
+}
+
+
+@bp.route('/farm/<int:farm_id>/panel/<string:panel>')
+def farm_dashboard_panel(farm_id, panel):
+    """
+    Devolve o HTML de um único painel do painel de bordo, executando apenas os
+    passos de análise de que ele precisa.
+
+    Cada painel tem a sua entrada de cache e o seu ETag (hash do HTML), por isso
+    um pedido com `If-None-Match` igual recebe 304 sem corpo.
+    """
+    if panel not in DASHBOARD_PANELS:
+        return jsonify({"error": f"Painel '{panel}' desconhecido."}), 404
+    template, step_names = DASHBOARD_PANELS[panel]
+
+    context = _new_dashboard_context(farm_id)
+    main_farm_data, secondary_farm_data = _load_farm_context(farm_id, context)
+    if main_farm_data is None:
+        return render_template('partials/_panel_error.html', error=context['error']), 502
+
+    def compute(farm_id, main_farm_data, secondary_farm_data, analysis_context):
+        _run_dashboard_analysis(farm_id, main_farm_data, secondary_farm_data, analysis_context, only=step_names)
+
+    def render(analysis_context):
+        return render_template(template, **{**context, **analysis_context})
+
     try:
-        expansion_details = expansions.EXPANSION_DATA.get(context['current_land_type'], {}).get(context['current_land_level'], {})
-        nodes_data = expansion_details.get("nodes", {})
-        if nodes_data:
-            processed_nodes = []
-            for node_name, count in nodes_data.items():
-                if count > 0:
-                    processed_nodes.append({"name": node_name, "count": count})
-            context['current_level_nodes'] = sorted(processed_nodes, key=lambda x: x['name'])
+        with timings.measure("analysis"):
+            fragment = dashboard_cache.get_panel_fragment(
+                farm_id, panel, main_farm_data, secondary_farm_data, context,
+                compute=compute, render=render
+            )
     except Exception as e:
-        log.error(f"Erro ao processar nodes da expansão atual: {e}")
+        log.error(f"Falha ao gerar o painel '{panel}' da fazenda #{farm_id}: {e}", exc_info=True)
+        return render_template('partials/_panel_error.html', error="Não foi possível carregar este painel."), 500
+
+    response = current_app.make_response(fragment["html"])
+    response.set_etag(fragment["etag"])
+    # O navegador guarda o fragmento, mas revalida-o sempre com If-None-Match.
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
+
+
+# Versão do formato de /api/farm/<id>/analysis; mudar quando uma alteração quebrar os clientes.
+ANALYSIS_API_VERSION = 1
+
+# Dados gerais da fazenda incluídos na resposta da API (ver `_load_farm_context`).
+_ANALYSIS_API_FARM_KEYS = (
+    "username", "sfl", "coins", "bumpkin_level", "current_land_level",
+    "current_land_type", "is_vip", "expansion_construction_info",
+)
+
+
+@bp.route('/api/farm/<int:farm_id>/analysis')
+def api_farm_analysis(farm_id):
+    """
+    Endpoint da API com o modelo completo das análises do painel em JSON.
+
+    Parâmetros:
+        sections (opcional): Lista separada por vírgulas das secções de `analysis`
+                             a devolver (ex: `?sections=summary_data,fishing_info`).
+
+    A resposta tem um ETag forte (hash do corpo) e `Cache-Control: no-cache`: um
+    cliente que envie `If-None-Match` recebe 304 sem corpo enquanto os dados não
+    mudarem. As análises vêm do mesmo cache que o painel (ver dashboard_cache).
+    """
+    context = _new_dashboard_context(farm_id)
+    main_farm_data, secondary_farm_data = _load_farm_context(farm_id, context)
+    if main_farm_data is None:
+        return jsonify({"error": f"Não foi possível buscar dados: {context['error']}"}), 502
 
-    # 5. Processamento do ASSESSOR DE EXPANSÃO.
     try:
-        expansion_progress_data = expansion_service.analyze_expansion_progress(secondary_farm_data, main_farm_data)
-        
-        # Este loop adiciona as chaves 'shortfall' e 'surplus' que o template precisa.
-        if expansion_progress_data and 'resources' in expansion_progress_data:
-            for resource in expansion_progress_data['resources']:
-                have = Decimal(str(resource.get('have', 0)))
-                required = Decimal(str(resource.get('required', 0)))
-                resource['shortfall'] = float(max(required - have, Decimal('0')))
-                resource['surplus'] = float(max(have - required, Decimal('0')))
-        # --- FIM DO BLOCO RESTAURADO ---
-        
-        context['expansion_progress'] = expansion_progress_data
+        with timings.measure("analysis"):
+            analysis_result = dashboard_cache.get_dashboard_analysis(
+                farm_id, main_farm_data, secondary_farm_data, context,
+                compute=_run_dashboard_analysis
+            )
     except Exception as e:
-        log.error(f"Falha ao analisar progresso de expansão: {e}", exc_info=True)
+        log.error(f"Falha nas análises da API para a fazenda #{farm_id}: {e}", exc_info=True)
+        return jsonify({"error": "Um erro inesperado ocorreu."}), 500
 
-   # 6. Processamento das METAS DE EXPANSÃO.
+    sections_arg = request.args.get('sections')
+    if sections_arg:
+        sections = [name.strip() for name in sections_arg.split(',') if name.strip()]
+        unknown = [name for name in sections if name not in analysis_result]
+        if unknown:
+            return jsonify({
+                "error": f"Secções desconhecidas: {', '.join(unknown)}.",
+                "available_sections": sorted(analysis_result)
+            }), 400
+        analysis_result = {name: analysis_result[name] for name in sections}
+
+    document = {
+        "api_version": ANALYSIS_API_VERSION,
+        "domain_version": dashboard_cache.get_domain_version(),
+        "farm_id": farm_id,
+        "farm": {key: context.get(key) for key in _ANALYSIS_API_FARM_KEYS},
+        "analysis": analysis_result,
+    }
     try:
-        expansion_goals = {}
-        effective_current_level = context['current_land_level']
-        if context.get("expansion_construction_info"):
-            effective_current_level += 1
+        with timings.measure("serialize"):
+            payload = serialization.dumps(document)
+    except TypeError as e:
+        log.error(f"Não foi possível serializar as análises da fazenda #{farm_id}: {e}", exc_info=True)
+        return jsonify({"error": "Um erro inesperado ocorreu."}), 500
 
-        island_order = expansions.ISLAND_ORDER
-        current_land_type = context['current_land_type']
-        
-        if current_land_type in island_order:
-            current_island_index = island_order.index(current_land_type)
-            
-            for island_name in island_order:
-                island_index = island_order.index(island_name)
-                
-                if island_index < current_island_index:
-                    continue
-                
-                levels_data = expansions.EXPANSION_DATA.get(island_name, {})
-                
-                # --- LÓGICA FINAL E CORRETA ---
-
-                # 1. Verifica se a ilha tem algum requisito. Se não, não é um objetivo válido.
-                if not any(info.get("requirements") for info in levels_data.values()):
-                    continue # Ignora ilhas como a "Swamp" por enquanto
-
-                # 2. Converte os níveis para números de forma segura
-                levels_as_int = []
-                for lvl in levels_data.keys():
-                    try:
-                        levels_as_int.append(int(lvl))
-                    except (ValueError, TypeError):
+    response = Response(payload, mimetype="application/json")
+    response.set_etag(serialization.etag_for(payload))
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
+
+
+def _run_dashboard_analysis(farm_id, main_farm_data, secondary_farm_data, context, only=None, on_step_done=None):
+    """
+    Executa as análises do painel e escreve os resultados em `context`.
+
+    Com `only` (nomes de passos), executa apenas esses passos e as suas dependências;
+    é o que os fragmentos de `farm_dashboard_panel` usam. `on_step_done` é passado
+    a `dashboard_pipeline.run_steps` (renderização em streaming).
+
+    Recebe apenas o contexto com os dados gerais já processados (nível, tipo de ilha,
+    construção em curso). Tudo o que é escrito aqui tem de ser serializável, pois o
+    resultado é guardado no cache de análises.
+
+    Os passos são declarados com as suas dependências e executados em paralelo por
+    `dashboard_pipeline.run_steps`. Cada passo escreve apenas no seu `out`; os dados
+    de outros passos chegam através de `deps`.
+    """
+    # Perfil de bônus do jogador, partilhado por todos os serviços de análise deste pedido.
+    boost_profile = resource_analysis_service.PlayerBoostProfile(main_farm_data)
+
+    # 3.5. Processamento da Imagem do Bumpkin
+    def bumpkin_image(out, deps):
+        try:
+            bumpkin_data = main_farm_data.get("bumpkin", {})
+            equipped_items = bumpkin_data.get("equipped")
+
+            # NOVO: Corrige o nome do item "Parsnip" vindo da API para "Parsnip Sword"
+            if equipped_items and equipped_items.get("Tool") == "Parsnip":
+                log.info("API retornou 'Parsnip' como ferramenta, corrigindo para 'Parsnip Sword'.")
+                # Cópia: os dados da fazenda vêm do cache em memória e são partilhados entre pedidos.
+                equipped_items = {**equipped_items, "Tool": "Parsnip Sword"}
+
+            if equipped_items:
+                # Passa o dicionário de itens para a função de construção
+                out['bumpkin_image_url'] = analysis.build_bumpkin_image_url(equipped_items)
+                log.info(f"URL da imagem do Bumpkin gerada para a fazenda #{farm_id}")
+            else:
+                log.warning(f"Dicionário 'equipped' não encontrado para a fazenda #{farm_id}.")
+
+        except Exception as e:
+            log.error(f"Erro ao processar a imagem do Bumpkin para a fazenda #{farm_id}: {e}", exc_info=True)
+
+    # 4. Processamento dos NODES (recursos por nível) da Expansão Atual.
+    def level_nodes(out, deps):
+        try:
+            expansion_details = expansions.EXPANSION_DATA.get(context['current_land_type'], {}).get(context['current_land_level'], {})
+            nodes_data = expansion_details.get("nodes", {})
+            if nodes_data:
+                processed_nodes = []
+                for node_name, count in nodes_data.items():
+                    if count > 0:
+                        processed_nodes.append({"name": node_name, "count": count})
+                out['current_level_nodes'] = sorted(processed_nodes, key=lambda x: x['name'])
+        except Exception as e:
+            log.error(f"Erro ao processar nodes da expansão atual: {e}")
+
+    # 5. Processamento do ASSESSOR DE EXPANSÃO.
+    def expansion_progress(out, deps):
+        try:
+            expansion_progress_data = expansion_service.analyze_expansion_progress(secondary_farm_data, main_farm_data)
+
+            # Este loop adiciona as chaves 'shortfall' e 'surplus' que o template precisa.
+            if expansion_progress_data and 'resources' in expansion_progress_data:
+                for resource in expansion_progress_data['resources']:
+                    have = Decimal(str(resource.get('have', 0)))
+                    required = Decimal(str(resource.get('required', 0)))
+                    resource['shortfall'] = float(max(required - have, Decimal('0')))
+                    resource['surplus'] = float(max(have - required, Decimal('0')))
+            # --- FIM DO BLOCO RESTAURADO ---
+
+            out['expansion_progress'] = expansion_progress_data
+        except Exception as e:
+            log.error(f"Falha ao analisar progresso de expansão: {e}", exc_info=True)
+
+    # 6. Processamento das METAS DE EXPANSÃO.
+    def expansion_goals(out, deps):
+        try:
+            expansion_goals = {}
+            effective_current_level = context['current_land_level']
+            if context.get("expansion_construction_info"):
+                effective_current_level += 1
+
+            island_order = expansions.ISLAND_ORDER
+            current_land_type = context['current_land_type']
+
+            if current_land_type in island_order:
+                current_island_index = island_order.index(current_land_type)
+
+                for island_name in island_order:
+                    island_index = island_order.index(island_name)
+
+                    if island_index < current_island_index:
                         continue
-                levels_as_int.sort()
-
-                # 3. Determina quais níveis são válidos para a meta
-                if island_index == current_island_index:
-                    # Para a ilha atual, apenas níveis futuros são válidos
-                    valid_levels = [lvl for lvl in levels_as_int if lvl > effective_current_level]
-                else:
-                    # Para ilhas futuras, todos os níveis são válidos
-                    valid_levels = levels_as_int
-                
-                # 4. Adiciona ao dicionário de metas se houver níveis válidos
-                if valid_levels:
-                    expansion_goals[island_name] = valid_levels
-                    
-        context['expansion_goals'] = expansion_goals
-    except Exception as e:
-        log.error(f"Falha ao calcular metas de expansão: {e}", exc_info=True)
+
+                    levels_data = expansions.EXPANSION_DATA.get(island_name, {})
+
+                    # --- LÓGICA FINAL E CORRETA ---
+
+                    # 1. Verifica se a ilha tem algum requisito. Se não, não é um objetivo válido.
+                    if not any(info.get("requirements") for info in levels_data.values()):
+                        continue # Ignora ilhas como a "Swamp" por enquanto
+
+                    # 2. Converte os níveis para números de forma segura
+                    levels_as_int = []
+                    for lvl in levels_data.keys():
+                        try:
+                            levels_as_int.append(int(lvl))
+                        except (ValueError, TypeError):
+                            continue
+                    levels_as_int.sort()
+
+                    # 3. Determina quais níveis são válidos para a meta
+                    if island_index == current_island_index:
+                        # Para a ilha atual, apenas níveis futuros são válidos
+                        valid_levels = [lvl for lvl in levels_as_int if lvl > effective_current_level]
+                    else:
+                        # Para ilhas futuras, todos os níveis são válidos
+                        valid_levels = levels_as_int
+
+                    # 4. Adiciona ao dicionário de metas se houver níveis válidos
+                    if valid_levels:
+                        expansion_goals[island_name] = valid_levels
+
+            out['expansion_goals'] = expansion_goals
+        except Exception as e:
+            log.error(f"Falha ao calcular metas de expansão: {e}", exc_info=True)
 
     # 7. Processamento da PESCA.
-    try:
-        # Chama a função de análise APENAS UMA VEZ e guarda o resultado.
-        fishing_info = analysis.analyze_fishing_data(main_farm_data, secondary_farm_data)
-
-        # Se a análise foi bem-sucedida, adiciona a informação da estação.
-        if fishing_info:
-            current_season = main_farm_data.get("season", {}).get("season", "spring")
-            fishing_info['current_season'] = current_season
-                
-        # Passa o resultado já modificado para o contexto.
-        context['fishing_info'] = fishing_info
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de pesca: {e}", exc_info=True)
-    
+    def fishing(out, deps):
+        try:
+            # Chama a função de análise APENAS UMA VEZ e guarda o resultado.
+            fishing_info = analysis.analyze_fishing_data(main_farm_data, secondary_farm_data)
 
+            # Se a análise foi bem-sucedida, adiciona a informação da estação.
+            if fishing_info:
+                current_season = main_farm_data.get("season", {}).get("season", "spring")
+                fishing_info['current_season'] = current_season
+
+            # Passa o resultado já modificado para o contexto.
+            out['fishing_info'] = fishing_info
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de pesca: {e}", exc_info=True)
 
     # 8. Processamento do Mini-Mapa de Expansão
-    try:
-        map_data = expansion_service.generate_map_plots_data(
-            current_land_level=context['current_land_level'],
-            current_land_type=context['current_land_type'],
-            construction_info=context.get("expansion_construction_info")
-        )
-        context.update(map_data) # Adiciona 'map_plots', 'in_progress_plot_island', etc., ao contexto
-    except Exception as e:
-        log.error(f"Erro ao processar o mapa de expansão: {e}", exc_info=True)
-        context['map_plots'] = [] # Garante que map_plots exista mesmo em caso de erro
-        context['plots_by_island'] = {} # Evita que o template quebre
+    def expansion_map(out, deps):
+        try:
+            map_data = expansion_service.generate_map_plots_data(
+                current_land_level=context['current_land_level'],
+                current_land_type=context['current_land_type'],
+                construction_info=context.get("expansion_construction_info")
+            )
+            out.update(map_data) # Adiciona 'map_plots', 'in_progress_plot_island', etc., ao contexto
+        except Exception as e:
+            log.error(f"Erro ao processar o mapa de expansão: {e}", exc_info=True)
+            out['map_plots'] = [] # Garante que map_plots exista mesmo em caso de erro
+            out['plots_by_island'] = {} # Evita que o template quebre
 
     # 9. Processamento das FLORES.
-    try:
-        context.update(analysis.process_flower_info(main_farm_data))
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de flores: {e}", exc_info=True)
+    def flower_info(out, deps):
+        try:
+            out.update(analysis.process_flower_info(main_farm_data))
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de flores: {e}", exc_info=True)
 
     # 10. Processamento de Presentes de NPCs
-    try:
-        context['npc_gift_info'] = analysis.process_npc_gifts(main_farm_data)
-    except Exception as e:
-        log.error(f"Falha ao processar dados de presentes de NPCs: {e}", exc_info=True)
-        context['npc_gift_info'] = [] # Garante que a chave exista no contexto
+    def npc_gifts(out, deps):
+        try:
+            out['npc_gift_info'] = analysis.process_npc_gifts(main_farm_data)
+        except Exception as e:
+            log.error(f"Falha ao processar dados de presentes de NPCs: {e}", exc_info=True)
+            out['npc_gift_info'] = [] # Garante que a chave exista no contexto
 
     # 11. Processamento do Quadro de Tarefas (Chore Board)
-    try:
-        context['chore_analysis'] = chores_service.analyze_chore_board(main_farm_data)
-        log.info(f"Análise do Chore Board concluída para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao processar dados do Chore Board: {e}", exc_info=True)
+    def chores(out, deps):
+        try:
+            out['chore_analysis'] = chores_service.analyze_chore_board(main_farm_data)
+            log.info(f"Análise do Chore Board concluída para a fazenda #{farm_id}.")
+        except Exception as e:
+            log.error(f"Falha ao processar dados do Chore Board: {e}", exc_info=True)
 
     # 11. Processamento de Escavação de Tesouros (Desert Digging)
-    try:
-        context['treasure_dig_info'] = treasure_dig_service.analyze_desert_digging_data(
-            main_farm_data,
-            seasonal_artefact=game_state.GAME_STATE.get('current_artefact_name')
-        )
-    except Exception as e:
-        log.error(f"Falha ao processar dados de digitação de tesouros: {e}", exc_info=True)
-        # Garante que a estrutura padrão exista em caso de erro para evitar que o template quebre
-        context['treasure_dig_info'] = {
-            'grid_mirror': [],
-            'stats': {
-                'total_digs': 0,
-                'items_found': {},
-                'tool_usage': {},
-                'streak': {}
-            },
-            'patterns': {'current': [], 'completed': []},
-            'hints': []
-        }
+    def treasure_dig(out, deps):
+        try:
+            out['treasure_dig_info'] = treasure_dig_service.analyze_desert_digging_data(
+                main_farm_data,
+                seasonal_artefact=game_state.GAME_STATE.get('current_artefact_name'),
+                profile=boost_profile
+            )
+        except Exception as e:
+            log.error(f"Falha ao processar dados de digitação de tesouros: {e}", exc_info=True)
+            # Garante que a estrutura padrão exista em caso de erro para evitar que o template quebre
+            out['treasure_dig_info'] = {
+                'grid_mirror': [],
+                'stats': {
+                    'total_digs': 0,
+                    'items_found': {},
+                    'tool_usage': {},
+                    'streak': {}
+                },
+                'patterns': {'current': [], 'completed': []},
+                'hints': []
+            }
 
     # 12. Processamento de Entregas (Deliveries)
-    try:
-        context['delivery_analysis'] = delivery_service.analyze_deliveries(
-            farm_data=main_farm_data, # A função de delivery agora precisa dos dados completos
-            game_state=game_state.GAME_STATE
-        )
-        log.info(f"Análise de entregas concluída para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao processar dados de entregas: {e}", exc_info=True)
-
-    # 12. Processamento de Buffs de Buds (MOVIDO PARA CIMA para ser usado por outros serviços)
-    context['bud_analysis'] = None
-    active_bud_buffs = {}  # Inicializa como um dicionário vazio para segurança
-    try:
-        bud_data = bud_service.analyze_bud_buffs(main_farm_data)
-        if bud_data:
-            context['bud_analysis'] = bud_data
-            # Extrai os bônus ativos do novo formato interno para passar a outros serviços.
-            # Acessa de forma segura a estrutura aninhada para obter os bônus.
-            active_bud_buffs = bud_data.get("internal", {}).get("active_buffs", {})
-            # DEBUG: Log para verificar quais bônus de Bud estão sendo passados para outros serviços.
-            log.debug(f"Passing the following active_bud_buffs to services: {active_bud_buffs}")
-            log.info(f"Análise de Buds concluída com sucesso para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao analisar buffs de Buds: {e}", exc_info=True)
-
-    # Lista para agregar todas as análises de recursos para o painel de depuração
-    resource_analyses = []
-    # 19. Agregação e Padronização de Dados para o Painel Unificado
-
-    # 13. Processamento de Recursos de Madeira (Wood) - CORRIGIDO
-    context['wood_analysis'] = None
-    wood_data = None
-    try:
-        # O chop_service agora é autônomo e busca todos os seus próprios bônus.
-        wood_data = chop_service.analyze_wood_resources(main_farm_data)
-        if wood_data and wood_data.get("view"):
-            context['wood_analysis'] = wood_data
-            resource_analyses.append({'name': 'Madeira', 'data': wood_data.get("view")})
-            log.info(f"Análise de madeira processada com sucesso para a fazenda #{farm_id}.")
-        else:
-            log.warning(f"Dados de análise de madeira ausentes ou incompletos para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de madeira: {e}", exc_info=True)
-
-    # 14. Processamento de Recursos de Mineração (Mining)
-    context['mining_analysis'] = None
-    mining_data = None
-    try:
-        mining_data = mining_service.analyze_mining_resources(main_farm_data)
+    def deliveries(out, deps):
+        try:
+            out['delivery_analysis'] = delivery_service.analyze_deliveries(
+                farm_data=main_farm_data, # A função de delivery agora precisa dos dados completos
+                game_state=game_state.GAME_STATE
+            )
+            log.info(f"Análise de entregas concluída para a fazenda #{farm_id}.")
+        except Exception as e:
+            log.error(f"Falha ao processar dados de entregas: {e}", exc_info=True)
+
+    # 12. Processamento de Buffs de Buds
+    def buds(out, deps):
+        out['bud_analysis'] = None
+        try:
+            bud_data = boost_profile.bud_analysis
+            if bud_data:
+                out['bud_analysis'] = bud_data
+                # Os outros serviços obtêm os bônus dos Buds pelo mesmo `boost_profile`.
+                active_bud_buffs = bud_data.get("internal", {}).get("active_buffs", {})
+                # DEBUG: Log para verificar quais bônus de Bud estão sendo passados para outros serviços.
+                log.debug(f"Passing the following active_bud_buffs to services: {active_bud_buffs}")
+                log.info(f"Análise de Buds concluída com sucesso para a fazenda #{farm_id}.")
+        except Exception as e:
+            log.error(f"Falha ao analisar buffs de Buds: {e}", exc_info=True)
+
+    # 13. Processamento de Recursos de Madeira (Wood)
+    def wood(out, deps):
+        out['wood_analysis'] = None
+        try:
+            # O chop_service agora é autônomo e busca todos os seus próprios bônus.
+            wood_data = chop_service.analyze_wood_resources(main_farm_data, profile=boost_profile)
+            if wood_data and wood_data.get("view"):
+                out['wood_analysis'] = wood_data
+                log.info(f"Análise de madeira processada com sucesso para a fazenda #{farm_id}.")
+            else:
+                log.warning(f"Dados de análise de madeira ausentes ou incompletos para a fazenda #{farm_id}.")
+            return wood_data
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de madeira: {e}", exc_info=True)
+
+    # 14. Processamento de Recursos de Mineração (Mining) e dos novos serviços de minerais.
+    # Cada serviço corre no seu passo; a junção no resultado da mineração é feita em `minerals`.
+    def mining(out, deps):
+        try:
+            return mining_service.analyze_mining_resources(main_farm_data, profile=boost_profile)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de mineração: {e}", exc_info=True)
+
+    def crimstone(out, deps):
+        try:
+            return crimstone_service.analyze_crimstone_resources(main_farm_data, profile=boost_profile)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de crimstone: {e}", exc_info=True)
+
+    def sunstone(out, deps):
+        try:
+            return sunstone_service.analyze_sunstone_resources(main_farm_data)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de sunstone: {e}", exc_info=True)
+
+    def oil(out, deps):
+        try:
+            return oil_service.analyze_oil_resources(main_farm_data, profile=boost_profile)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de oil: {e}", exc_info=True)
+
+    def lava(out, deps):
+        try:
+            return lava_service.analyze_lava_resources(main_farm_data, profile=boost_profile)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de mineração: {e}", exc_info=True)
+
+    def minerals(out, deps):
+        out['mining_analysis'] = None
+        mining_data = deps['mining']
         mining_view_data = mining_data.get("view") if mining_data else None
-
-        if mining_view_data:
-            context['mining_analysis'] = mining_view_data
-            resource_analyses.append({'name': 'Mineração', 'data': mining_view_data})
-            log.info(f"Análise de mineração processada com sucesso para a fazenda #{farm_id}.")
-        else:
+        if not mining_view_data:
             log.warning(f"Dados de análise de mineração ausentes para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de mineração: {e}", exc_info=True)
-
-    # Chamadas para os novos serviços de minerais
-    try:
-        crimstone_data = crimstone_service.analyze_crimstone_resources(main_farm_data)
-        if crimstone_data and crimstone_data.get("view"):
-            mining_view_data.get("nodes_by_type", {}).update(crimstone_data["view"].get("nodes_by_type", {}))
-            # Garante que o summary_by_type exista antes de tentar atualizar
-            if "summary_by_type" not in mining_view_data:
-                mining_view_data["summary_by_type"] = {}
-            mining_view_data.get("summary_by_type", {}).update(crimstone_data["view"].get("summary_by_type", {}))
-            log.info(f"Análise de Crimstone integrada com sucesso.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de crimstone: {e}", exc_info=True)
-
-    try:
-        sunstone_data = sunstone_service.analyze_sunstone_resources(main_farm_data)
-        if sunstone_data and sunstone_data.get("view"):
-            mining_view_data.get("nodes_by_type", {}).update(sunstone_data["view"].get("nodes_by_type", {}))
-            # Garante que o summary_by_type exista antes de tentar atualizar
-            if "summary_by_type" not in mining_view_data:
-                mining_view_data["summary_by_type"] = {}
-            mining_view_data.get("summary_by_type", {}).update(sunstone_data["view"].get("summary_by_type", {}))
-            log.info(f"Análise de Sunstone integrada com sucesso.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de sunstone: {e}", exc_info=True)
-
-    try:
-        oil_data = oil_service.analyze_oil_resources(main_farm_data)
-        if oil_data and oil_data.get("view"):
-            mining_view_data.get("nodes_by_type", {}).update(oil_data["view"].get("nodes_by_type", {}))
-            # Garante que o summary_by_type exista antes de tentar atualizar
-            if "summary_by_type" not in mining_view_data:
-                mining_view_data["summary_by_type"] = {}
-            mining_view_data.get("summary_by_type", {}).update(oil_data["view"].get("summary_by_type", {}))
-            log.info(f"Análise de Oil integrada com sucesso.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de oil: {e}", exc_info=True)
-    
-    try:
-        lava_data = lava_service.analyze_lava_resources(main_farm_data)
-        if lava_data and lava_data.get("view"):
-            mining_view_data.get("nodes_by_type", {}).update(lava_data["view"].get("nodes_by_type", {}))
-            # Garante que o summary_by_type exista antes de tentar atualizar
-            if "summary_by_type" not in mining_view_data:
-                mining_view_data["summary_by_type"] = {}
-            mining_view_data.get("summary_by_type", {}).update(lava_data["view"].get("summary_by_type", {}))
-            log.info(f"Análise de Lava (Obsidian) integrada com sucesso.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de mineração: {e}", exc_info=True)
+            return mining_data
+
+        out['mining_analysis'] = mining_view_data
+        log.info(f"Análise de mineração processada com sucesso para a fazenda #{farm_id}.")
+
+        for step_name, label in (("crimstone", "Crimstone"), ("sunstone", "Sunstone"), ("oil", "Oil"), ("lava", "Lava (Obsidian)")):
+            try:
+                mineral_data = deps[step_name]
+                if mineral_data and mineral_data.get("view"):
+                    mining_view_data.get("nodes_by_type", {}).update(mineral_data["view"].get("nodes_by_type", {}))
+                    # Garante que o summary_by_type exista antes de tentar atualizar
+                    if "summary_by_type" not in mining_view_data:
+                        mining_view_data["summary_by_type"] = {}
+                    mining_view_data.get("summary_by_type", {}).update(mineral_data["view"].get("summary_by_type", {}))
+                    log.info(f"Análise de {label} integrada com sucesso.")
+            except Exception as e:
+                log.error(f"Falha ao integrar dados de {label}: {e}", exc_info=True)
+        return mining_data
 
     # 15. Processamento de Culturas (Crops)
-    context['crop_analysis'] = None
-    crop_data = None
-    try:
-        # NOVO: Chama o calendar_service refatorado para obter bônus para a categoria 'Crop'
-        calendar_boosts = calendar_service.get_active_event_boosts(main_farm_data, 'Crop')
-
-        # Passa os boosts de calendário para o serviço de culturas
-        crop_data = crop_service.analyze_crop_resources(main_farm_data, calendar_boosts=calendar_boosts)
-        crop_view_data = crop_data.get("view") if crop_data else None
-
-        if crop_view_data:
-            context['crop_analysis'] = crop_view_data
-            resource_analyses.append({'name': 'Culturas', 'data': crop_view_data})
-            log.info(f"Análise de culturas processada com sucesso para a fazenda #{farm_id}.")
-        else:
-            log.warning(f"Dados de análise de culturas ausentes para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de culturas: {e}", exc_info=True)
+    def calendar(out, deps):
+        try:
+            # NOVO: Chama o calendar_service refatorado para obter bônus para a categoria 'Crop'
+            return calendar_service.get_active_event_boosts(main_farm_data, 'Crop')
+        except Exception as e:
+            log.error(f"Falha ao obter bônus de eventos do calendário: {e}", exc_info=True)
+
+    def crops(out, deps):
+        out['crop_analysis'] = None
+        try:
+            # Passa os boosts de calendário para o serviço de culturas
+            crop_data = crop_service.analyze_crop_resources(main_farm_data, calendar_boosts=deps['calendar'], profile=boost_profile)
+            crop_view_data = crop_data.get("view") if crop_data else None
+
+            if crop_view_data:
+                out['crop_analysis'] = crop_view_data
+                log.info(f"Análise de culturas processada com sucesso para a fazenda #{farm_id}.")
+            else:
+                log.warning(f"Dados de análise de culturas ausentes para a fazenda #{farm_id}.")
+            return crop_data
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de culturas: {e}", exc_info=True)
 
     # 16. Processamento da Crop Machine
-    context['crop_machine_analysis'] = None
-    try:
-        machine_data = crop_machine_service.analyze_crop_machine(main_farm_data)
-        # A lógica de processamento foi movida para o crop_machine_service.
-        # O serviço agora retorna os dados prontos para o template.
-        if machine_data:
-            context['crop_machine_analysis'] = machine_data.get("view")
-            log.info(f"Análise da Crop Machine processada com sucesso para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados da Crop Machine: {e}", exc_info=True)
-
-    # 17. Processamento da Greenhouse (continua abaixo)
-    context['greenhouse_analysis'] = None
-    try:
-        greenhouse_data = greenhouse_service.analyze_greenhouse_resources(main_farm_data)
-        if greenhouse_data:
-            context['greenhouse_analysis'] = greenhouse_data.get("view")
-            # Adiciona o domínio de culturas ao contexto para que o template da estufa possa usá-lo
-            context['crops_domain'] = crops_domain
-            log.info(f"Análise da Greenhouse processada com sucesso para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao analisar dados da Greenhouse: {e}", exc_info=True)
+    def crop_machine(out, deps):
+        out['crop_machine_analysis'] = None
+        try:
+            machine_data = crop_machine_service.analyze_crop_machine(main_farm_data, profile=boost_profile)
+            # A lógica de processamento foi movida para o crop_machine_service.
+            # O serviço agora retorna os dados prontos para o template.
+            if machine_data:
+                out['crop_machine_analysis'] = machine_data.get("view")
+                log.info(f"Análise da Crop Machine processada com sucesso para a fazenda #{farm_id}.")
+                return machine_data.get("view")
+        except Exception as e:
+            log.error(f"Falha ao analisar dados da Crop Machine: {e}", exc_info=True)
+
+    # 17. Processamento da Greenhouse
+    def greenhouse(out, deps):
+        out['greenhouse_analysis'] = None
+        try:
+            greenhouse_data = greenhouse_service.analyze_greenhouse_resources(main_farm_data, profile=boost_profile)
+            if greenhouse_data:
+                out['greenhouse_analysis'] = greenhouse_data.get("view")
+                log.info(f"Análise da Greenhouse processada com sucesso para a fazenda #{farm_id}.")
+                return greenhouse_data.get("view")
+        except Exception as e:
+            log.error(f"Falha ao analisar dados da Greenhouse: {e}", exc_info=True)
 
     # 18. Processamento de Frutas e Flores (para o painel unificado)
-    fruit_data, flower_data, beehive_data = None, None, None
-    try:
-        fruit_data = fruit_service.analyze_fruit_patches(main_farm_data)
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de frutas: {e}", exc_info=True)
-    
-    try:
-        flower_data = flower_service.analyze_flower_beds(main_farm_data)
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de flores: {e}", exc_info=True)
+    def fruits(out, deps):
+        try:
+            return fruit_service.analyze_fruit_patches(main_farm_data, profile=boost_profile)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de frutas: {e}", exc_info=True)
+
+    def flower_beds(out, deps):
+        try:
+            return flower_service.analyze_flower_beds(main_farm_data, profile=boost_profile)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de flores: {e}", exc_info=True)
+
+    def beehives(out, deps):
+        try:
+            return flower_service.analyze_beehives(main_farm_data, profile=boost_profile)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de colmeias: {e}", exc_info=True)
+
+    # NOVO: Processamento de Cogumelos
+    def mushrooms(out, deps):
+        try:
+            return mushrooms_service.analyze_mushroom_spawns(main_farm_data)
+        except Exception as e:
+            log.error(f"Falha ao analisar dados de cogumelos: {e}", exc_info=True)
 
-    try:
-        beehive_data = flower_service.analyze_beehives(main_farm_data)
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de colmeias: {e}", exc_info=True)
+    # 19. Agregação e Padronização de Dados para o Painel Unificado
+    def unified(out, deps):
+        unified_analyses = []
+        wood_data, mining_data, crop_data = deps['wood'], deps['minerals'], deps['crops']
+        fruit_data, flower_data, mushroom_data = deps['fruits'], deps['flower_beds'], deps['mushrooms']
 
-    # NOVO: Processamento de Cogumelos (movido para o local correto)
-    mushroom_data = None
-    try:
-        mushroom_data = mushrooms_service.analyze_mushroom_spawns(main_farm_data)
         if mushroom_data and mushroom_data.get("view"):
             mushroom_view = mushroom_data["view"]
             mushroom_resources = {
@@ -607,159 +923,196 @@ def farm_dashboard(farm_id):
                 "title": "Cogumelos",
                 "resources": mushroom_resources
             })
-    except Exception as e:
-        log.error(f"Falha ao analisar dados de cogumelos: {e}", exc_info=True)
-
-    if wood_data and wood_data.get("view"):
-        wood_view = wood_data["view"]
-        wood_resources = {
-            "Wood": {
-                "nodes": wood_view.get("tree_status", {}),
-                "summary": wood_view.get("summary", {})
-            }
-        }
-        unified_analyses.append({
-            "title": "Madeira",
-            "resources": wood_resources
-        })
-    if mining_data and mining_data.get("view"):
-        mining_view = mining_data["view"]
-        nodes_by_type = mining_view.get("nodes_by_type", {})
-        summaries_by_type = mining_view.get("summary_by_type", {})
-        mining_resources = {
-            name: {"nodes": nodes, "summary": summaries_by_type.get(name, {})}
-            for name, nodes in nodes_by_type.items()
-        }
-        unified_analyses.append({
-            "title": "Mineração",
-            "resources": dict(sorted(mining_resources.items()))
-        })
-    if crop_data and crop_data.get("view"):
-        crop_view = crop_data["view"]
-        plots_by_crop = defaultdict(dict)
-        for plot_id, plot_info in crop_view.get("plot_status", {}).items():
-            plots_by_crop[plot_info['crop_name']][plot_id] = plot_info
-        
-        summaries_by_crop = crop_view.get("summary_by_crop", {})
-        crop_resources = {
-            name: {"nodes": nodes, "summary": summaries_by_crop.get(name, {})}
-            for name, nodes in plots_by_crop.items()
-        }
-        unified_analyses.append({
-            "title": "Culturas",
-            "resources": dict(sorted(crop_resources.items()))
-        })
-    if fruit_data and fruit_data.get("view"):
-        fruit_view = fruit_data["view"]
-        patches_by_fruit = defaultdict(dict)
-        for patch_id, patch_info in fruit_view.get("patch_status", {}).items():
-            patches_by_fruit[patch_info['fruit_name']][patch_id] = patch_info
-        
-        summaries_by_fruit = fruit_view.get("summary_by_fruit", {})
-        fruit_resources = {
-            name: {"nodes": nodes, "summary": summaries_by_fruit.get(name, {})}
-            for name, nodes in patches_by_fruit.items()
-        }
-        unified_analyses.append({
-            "title": "Frutas",
-            "resources": dict(sorted(fruit_resources.items()))
-        })
-    if flower_data and flower_data.get("view"):
-        flower_view = flower_data["view"]
-        beds_by_flower = defaultdict(dict)
-        for bed_id, bed_info in flower_view.get("beds", {}).items():
-            beds_by_flower[bed_info['flower_name']][bed_id] = bed_info
-        
-        summaries_by_flower = flower_view.get("summary_by_flower", {})
-        flower_resources = {
-            name: {"nodes": nodes, "summary": summaries_by_flower.get(name, {})}
-            for name, nodes in beds_by_flower.items()
-        }
-        unified_analyses.append({
-            "title": "Flores",
-            "resources": dict(sorted(flower_resources.items()))
-        })
-
-    context['unified_resource_analyses'] = unified_analyses
-
-    # Processamento do Mapa da Fazenda
-    context['layout_map'] = None
-    try:
-        # NOVO: Consolida todos os nós analisados em um único dicionário para o mapa.
-        # Isso garante que o mapa use os dados calculados (rendimento, minas restantes, etc.)
-        # em vez dos dados brutos da API.
-        all_analyzed_nodes = {}
         if wood_data and wood_data.get("view"):
-            for tree_id, tree_info in wood_data["view"].get("tree_status", {}).items():
-                all_analyzed_nodes[f"trees-{tree_id}"] = tree_info
-        
+            wood_view = wood_data["view"]
+            wood_resources = {
+                "Wood": {
+                    "nodes": wood_view.get("tree_status", {}),
+                    "summary": wood_view.get("summary", {})
+                }
+            }
+            unified_analyses.append({
+                "title": "Madeira",
+                "resources": wood_resources
+            })
         if mining_data and mining_data.get("view"):
-            for resource_name, nodes in mining_data["view"].get("nodes_by_type", {}).items():
-                api_key = next((key for key, info in mining_service.RESOURCE_NODE_MAP.items() if info["name"] == resource_name), None)
-                if api_key:
-                    for node_id, node_info in nodes.items():
-                        all_analyzed_nodes[f"{api_key}-{node_id}"] = node_info
-
+            mining_view = mining_data["view"]
+            nodes_by_type = mining_view.get("nodes_by_type", {})
+            summaries_by_type = mining_view.get("summary_by_type", {})
+            mining_resources = {
+                name: {"nodes": nodes, "summary": summaries_by_type.get(name, {})}
+                for name, nodes in nodes_by_type.items()
+            }
+            unified_analyses.append({
+                "title": "Mineração",
+                "resources": dict(sorted(mining_resources.items()))
+            })
         if crop_data and crop_data.get("view"):
-            for plot_id, plot_info in crop_data["view"].get("plot_status", {}).items():
-                all_analyzed_nodes[f"crops-{plot_id}"] = plot_info
-
+            crop_view = crop_data["view"]
+            plots_by_crop = defaultdict(dict)
+            for plot_id, plot_info in crop_view.get("plot_status", {}).items():
+                plots_by_crop[plot_info['crop_name']][plot_id] = plot_info
+
+            summaries_by_crop = crop_view.get("summary_by_crop", {})
+            crop_resources = {
+                name: {"nodes": nodes, "summary": summaries_by_crop.get(name, {})}
+                for name, nodes in plots_by_crop.items()
+            }
+            unified_analyses.append({
+                "title": "Culturas",
+                "resources": dict(sorted(crop_resources.items()))
+            })
         if fruit_data and fruit_data.get("view"):
-            for patch_id, patch_info in fruit_data["view"].get("patch_status", {}).items():
-                all_analyzed_nodes[f"fruitPatches-{patch_id}"] = patch_info
-
+            fruit_view = fruit_data["view"]
+            patches_by_fruit = defaultdict(dict)
+            for patch_id, patch_info in fruit_view.get("patch_status", {}).items():
+                patches_by_fruit[patch_info['fruit_name']][patch_id] = patch_info
+
+            summaries_by_fruit = fruit_view.get("summary_by_fruit", {})
+            fruit_resources = {
+                name: {"nodes": nodes, "summary": summaries_by_fruit.get(name, {})}
+                for name, nodes in patches_by_fruit.items()
+            }
+            unified_analyses.append({
+                "title": "Frutas",
+                "resources": dict(sorted(fruit_resources.items()))
+            })
         if flower_data and flower_data.get("view"):
-            for bed_id, bed_info in flower_data["view"].get("beds", {}).items():
-                all_analyzed_nodes[f"flowerBeds-{bed_id}"] = bed_info
-        
-        if mushroom_data and mushroom_data.get("view"):
-            for mushroom_id, mushroom_info in mushroom_data["view"].get("mushroom_status", {}).items():
-                all_analyzed_nodes[f"mushrooms-{mushroom_id}"] = mushroom_info
-
-        # NOVO: Adiciona os dados da Crop Machine e Greenhouse aos nós analisados.
-        # CORREÇÃO: A chave para edifícios deve ser construída usando o ID único do
-        # edifício dos dados do jogo, em vez de um índice fixo como '0'.
-        # Isso garante que o farm_layout_service possa associar os dados de análise
-        # ao edifício correto no mapa.
-        if context.get('crop_machine_analysis'):
-            crop_machine_buildings = main_farm_data.get("buildings", {}).get("Crop Machine", [])
-            if crop_machine_buildings:
-                machine_id = crop_machine_buildings[0].get("id")
-                all_analyzed_nodes[f"Crop Machine-{machine_id}"] = context['crop_machine_analysis']
-        
-        if context.get('greenhouse_analysis'):
-            greenhouse_buildings = main_farm_data.get("buildings", {}).get("Greenhouse", [])
-            if greenhouse_buildings:
-                greenhouse_id = greenhouse_buildings[0].get("id")
-                all_analyzed_nodes[f"Greenhouse-{greenhouse_id}"] = context['greenhouse_analysis']
-
-        if beehive_data and beehive_data.get("view"):
-            for hive_id, hive_info in beehive_data["view"].get("hives", {}).items():
-                # ADICIONADO: Garante que o nome do recurso seja 'Honey' para a busca de preços.
-                hive_info['resource_name'] = 'Honey'
-                all_analyzed_nodes[f"beehives-{hive_id}"] = hive_info
-
-        layout_map_data = farm_layout_service.generate_layout_map(main_farm_data, all_analyzed_nodes)
-        if layout_map_data:
-            context['layout_map'] = layout_map_data
-            log.info(f"Mapa da fazenda gerado com sucesso para a fazenda #{farm_id}.")
-        else:
-            log.warning(f"Não foi possível gerar o mapa da fazenda para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao gerar o mapa da fazenda: {e}", exc_info=True)
+            flower_view = flower_data["view"]
+            beds_by_flower = defaultdict(dict)
+            for bed_id, bed_info in flower_view.get("beds", {}).items():
+                beds_by_flower[bed_info['flower_name']][bed_id] = bed_info
+
+            summaries_by_flower = flower_view.get("summary_by_flower", {})
+            flower_resources = {
+                name: {"nodes": nodes, "summary": summaries_by_flower.get(name, {})}
+                for name, nodes in beds_by_flower.items()
+            }
+            unified_analyses.append({
+                "title": "Flores",
+                "resources": dict(sorted(flower_resources.items()))
+            })
 
-    # Análise de Sumário de Recursos (anteriormente na página WIP)
-    try:
-        summary_data = summary_service.analyze_resources_summary(main_farm_data)
-        context['summary_data'] = summary_data
-        log.info(f"Análise de sumário de recursos concluída para a fazenda #{farm_id}.")
-    except Exception as e:
-        log.error(f"Falha ao analisar o sumário de recursos: {e}", exc_info=True)
-        context['summary_data'] = {}
+        out['unified_resource_analyses'] = unified_analyses
 
+    # Processamento do Mapa da Fazenda
+    def layout_map(out, deps):
+        out['layout_map'] = None
+        try:
+            wood_data, mining_data, crop_data = deps['wood'], deps['minerals'], deps['crops']
+            fruit_data, flower_data, mushroom_data = deps['fruits'], deps['flower_beds'], deps['mushrooms']
+            beehive_data = deps['beehives']
+
+            # NOVO: Consolida todos os nós analisados em um único dicionário para o mapa.
+            # Isso garante que o mapa use os dados calculados (rendimento, minas restantes, etc.)
+            # em vez dos dados brutos da API.
+            all_analyzed_nodes = {}
+            if wood_data and wood_data.get("view"):
+                for tree_id, tree_info in wood_data["view"].get("tree_status", {}).items():
+                    all_analyzed_nodes[f"trees-{tree_id}"] = tree_info
+
+            if mining_data and mining_data.get("view"):
+                for resource_name, nodes in mining_data["view"].get("nodes_by_type", {}).items():
+                    api_key = next((key for key, info in mining_service.RESOURCE_NODE_MAP.items() if info["name"] == resource_name), None)
+                    if api_key:
+                        for node_id, node_info in nodes.items():
+                            all_analyzed_nodes[f"{api_key}-{node_id}"] = node_info
+
+            if crop_data and crop_data.get("view"):
+                for plot_id, plot_info in crop_data["view"].get("plot_status", {}).items():
+                    all_analyzed_nodes[f"crops-{plot_id}"] = plot_info
+
+            if fruit_data and fruit_data.get("view"):
+                for patch_id, patch_info in fruit_data["view"].get("patch_status", {}).items():
+                    all_analyzed_nodes[f"fruitPatches-{patch_id}"] = patch_info
+
+            if flower_data and flower_data.get("view"):
+                for bed_id, bed_info in flower_data["view"].get("beds", {}).items():
+                    all_analyzed_nodes[f"flowerBeds-{bed_id}"] = bed_info
+
+            if mushroom_data and mushroom_data.get("view"):
+                for mushroom_id, mushroom_info in mushroom_data["view"].get("mushroom_status", {}).items():
+                    all_analyzed_nodes[f"mushrooms-{mushroom_id}"] = mushroom_info
+
+            # NOVO: Adiciona os dados da Crop Machine e Greenhouse aos nós analisados.
+            # CORREÇÃO: A chave para edifícios deve ser construída usando o ID único do
+            # edifício dos dados do jogo, em vez de um índice fixo como '0'.
+            # Isso garante que o farm_layout_service possa associar os dados de análise
+            # ao edifício correto no mapa.
+            if deps['crop_machine']:
+                crop_machine_buildings = main_farm_data.get("buildings", {}).get("Crop Machine", [])
+                if crop_machine_buildings:
+                    machine_id = crop_machine_buildings[0].get("id")
+                    all_analyzed_nodes[f"Crop Machine-{machine_id}"] = deps['crop_machine']
+
+            if deps['greenhouse']:
+                greenhouse_buildings = main_farm_data.get("buildings", {}).get("Greenhouse", [])
+                if greenhouse_buildings:
+                    greenhouse_id = greenhouse_buildings[0].get("id")
+                    all_analyzed_nodes[f"Greenhouse-{greenhouse_id}"] = deps['greenhouse']
+
+            if beehive_data and beehive_data.get("view"):
+                for hive_id, hive_info in beehive_data["view"].get("hives", {}).items():
+                    # ADICIONADO: Garante que o nome do recurso seja 'Honey' para a busca de preços.
+                    hive_info['resource_name'] = 'Honey'
+                    all_analyzed_nodes[f"beehives-{hive_id}"] = hive_info
+
+            layout_map_data = farm_layout_service.generate_layout_map(main_farm_data, all_analyzed_nodes)
+            if layout_map_data:
+                out['layout_map'] = layout_map_data
+                log.info(f"Mapa da fazenda gerado com sucesso para a fazenda #{farm_id}.")
+            else:
+                log.warning(f"Não foi possível gerar o mapa da fazenda para a fazenda #{farm_id}.")
+        except Exception as e:
+            log.error(f"Falha ao gerar o mapa da fazenda: {e}", exc_info=True)
+
+    # Análise de Sumário de Recursos (anteriormente na página WIP)
+    def resources_summary(out, deps):
+        try:
+            summary_data = summary_service.analyze_resources_summary(main_farm_data, profile=boost_profile)
+            out['summary_data'] = summary_data
+            log.info(f"Análise de sumário de recursos concluída para a fazenda #{farm_id}.")
+        except Exception as e:
+            log.error(f"Falha ao analisar o sumário de recursos: {e}", exc_info=True)
+            out['summary_data'] = {}
+
+    node_steps = ('wood', 'minerals', 'crops', 'fruits', 'flower_beds', 'mushrooms')
+    steps = [
+        Step('bumpkin_image', bumpkin_image),
+        Step('level_nodes', level_nodes),
+        Step('expansion_progress', expansion_progress),
+        Step('expansion_goals', expansion_goals),
+        Step('fishing', fishing),
+        Step('expansion_map', expansion_map),
+        Step('flower_info', flower_info),
+        Step('npc_gifts', npc_gifts),
+        Step('chores', chores),
+        Step('treasure_dig', treasure_dig),
+        Step('deliveries', deliveries),
+        Step('buds', buds),
+        Step('wood', wood),
+        Step('mining', mining),
+        Step('crimstone', crimstone),
+        Step('sunstone', sunstone),
+        Step('oil', oil),
+        Step('lava', lava),
+        Step('minerals', minerals, depends_on=('mining', 'crimstone', 'sunstone', 'oil', 'lava')),
+        Step('calendar', calendar),
+        Step('crops', crops, depends_on=('calendar',)),
+        Step('crop_machine', crop_machine),
+        Step('greenhouse', greenhouse),
+        Step('fruits', fruits),
+        Step('flower_beds', flower_beds),
+        Step('beehives', beehives),
+        Step('mushrooms', mushrooms),
+        Step('unified', unified, depends_on=node_steps),
+        Step('layout_map', layout_map, depends_on=node_steps + ('crop_machine', 'greenhouse', 'beehives')),
+        Step('resources_summary', resources_summary),
+    ]
+    if only is not None:
+        steps = dashboard_pipeline.select_steps(steps, only)
+    dashboard_pipeline.run_steps(steps, context, label=f"painel da fazenda #{farm_id}", on_step_done=on_step_done)
 
-    return render_template('dashboard.html', title=f"Painel de {context['username']}", **context)
-    
 
 @bp.route('/api/goal_requirements/<int:farm_id>/<string:current_land_type>/<int:current_level>')
 def api_goal_requirements(farm_id, current_land_type, current_level):
@@ -896,3 +1249,67 @@ def api_treasure_dig_update(farm_id):
     except Exception as e:
         log.error(f"Erro inesperado ao atualizar dados de escavação para a fazenda {farm_id}: {e}", exc_info=True)
         return jsonify({"error": "Um erro inesperado ocorreu no servidor."}), 500
+
+
+_LOOPBACK_ADDRESSES = {"127.0.0.1", "::1"}
+
+
+def _internal_request_allowed() -> bool:
+    """
+    Os endpoints /internal/* e /metrics exigem o cabeçalho X-Internal-Token quando
+    INTERNAL_API_TOKEN está definido. Sem token, só aceitam pedidos diretos da própria
+    máquina (loopback e sem X-Forwarded-For, que um proxy local acrescentaria).
+    """
+    if not config.INTERNAL_API_TOKEN:
+        return request.remote_addr in _LOOPBACK_ADDRESSES and "X-Forwarded-For" not in request.headers
+    return hmac.compare_digest(request.headers.get("X-Internal-Token", ""), config.INTERNAL_API_TOKEN)
+
+
+@bp.route('/internal/timings')
+def internal_timings():
+    """
+    Percentis (p50/p95/p99) do tempo real e de CPU de cada etapa dos pedidos
+    recentes deste worker (ver app/timings.py). Com `?recent=N` inclui também
+    as medições brutas dos últimos N pedidos.
+    """
+    if not _internal_request_allowed():
+        return jsonify({"error": "Acesso negado."}), 403
+
+    renders = timings.recent_renders()
+    endpoint = request.args.get('endpoint')
+    if endpoint:
+        renders = [render for render in renders if render["endpoint"] == endpoint]
+
+    payload = {
+        "worker_pid": os.getpid(),
+        "renders": len(renders),
+        "steps": timings.summarize(renders),
+    }
+    recent = request.args.get('recent', type=int)
+    if recent:
+        payload["recent"] = renders[-recent:]
+    return jsonify(payload)
+
+
+@bp.route('/internal/memory')
+def internal_memory():
+    """
+    Memória própria (`unique_kb`) e partilhada (`shared_kb`) do processo principal do
+    gunicorn e de cada worker (ver app/startup.py).
+    """
+    if not _internal_request_allowed():
+        return jsonify({"error": "Acesso negado."}), 403
+    return jsonify(startup.memory_report())
+
+
+@bp.route('/metrics')
+def prometheus_metrics():
+    """
+    Métricas no formato de texto do Prometheus, somadas entre todos os workers
+    (ver app/metrics.py).
+    """
+    if not config.METRICS_ENABLED:
+        return jsonify({"error": "Métricas desativadas."}), 404
+    if not _internal_request_allowed():
+        return jsonify({"error": "Acesso negado."}), 403
+    return Response(metrics.render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
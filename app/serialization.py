@@ -0,0 +1,47 @@
+# app/serialization.py
+"""
+Serialização JSON das respostas da API de análises.
+
+Usa o `orjson` quando está instalado (várias vezes mais rápido que o `json` da
+biblioteca padrão em documentos grandes, como o mapa da fazenda) e o `json` como
+alternativa. Em ambos os casos o resultado é o mesmo:
+- `Decimal` é convertido em número (float), como no `DecimalEncoder` do mapa;
+- conjuntos passam a listas ordenadas e as chaves dos dicionários são ordenadas,
+  para que os mesmos dados produzam sempre os mesmos bytes (e o mesmo ETag) em
+  qualquer worker.
+"""
+import hashlib
+import json
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON.")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj) -> bytes:
+        """Serializa `obj` em JSON compacto (UTF-8)."""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+else:
+    def dumps(obj) -> bytes:
+        """Serializa `obj` em JSON compacto (UTF-8)."""
+        return json.dumps(
+            obj, default=_default, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+
+def etag_for(payload: bytes) -> str:
+    """ETag forte: hash do corpo exato da resposta."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
@@ -1,41 +1,126 @@
 """
 Serviço para lidar com a lógica de animações, como fornecer
 personagens animados dinamicamente.
+
+A lista de personagens é um manifesto construído no arranque da aplicação
+(`build_manifest`), com um hash do conteúdo de cada imagem para invalidar o cache
+do navegador. Com `ANIMATION_MANIFEST_WATCH=true` (desenvolvimento), as pastas são
+verificadas periodicamente e o manifesto é refeito quando mudam.
 """
+import logging
 import os
+import threading
+import time
+from typing import NamedTuple
+
 from flask import current_app
 
-def get_animated_characters():
+import config
+
+from .. import serialization, static_assets
+
+log = logging.getLogger(__name__)
+
+CHARACTER_FOLDERS = ('npcs', 'pets', 'animals')
+_IMAGE_EXTENSIONS = ('.png', '.webp', '.gif', '.jpg', '.jpeg')
+
+
+class CharacterManifest(NamedTuple):
+    characters: tuple   # Dicionários {"type", "name", "hash"}; só leitura
+    version: str        # Hash do manifesto inteiro
+    payload: bytes      # Resposta JSON já serializada
+    signature: tuple    # Datas de modificação das pastas, para detetar alterações
+
+
+_manifest = None
+_manifest_lock = threading.Lock()
+_last_check = 0.0
+
+
+def _folders_signature(base_path: str) -> tuple:
+    """(pasta, mtime) de todas as pastas de personagens; muda quando um ficheiro é criado, removido ou renomeado."""
+    signature = []
+    for folder in CHARACTER_FOLDERS:
+        for root, _, _ in os.walk(os.path.join(base_path, folder)):
+            signature.append((root, os.stat(root).st_mtime_ns))
+    return tuple(signature)
+
+
+def build_manifest(static_folder: str) -> CharacterManifest:
     """
     Escaneia os diretórios de imagens estáticas para encontrar personagens animados
-    (npcs, pets, animals) e retorna uma lista formatada em JSON.
+    (npcs, pets, animals) e guarda o manifesto usado por `get_animated_characters`.
 
     A estrutura de diretórios esperada é:
     - static/images/npcs/...
     - static/images/pets/...
     - static/images/animals/...
-
-    Retorna:
-        list: Uma lista de dicionários, onde cada dicionário representa um personagem
-              com as chaves "type" (e.g., "npcs") e "name" (caminho relativo do arquivo).
     """
-    characters = []
-    base_path = os.path.join(current_app.static_folder, 'images')
-    character_folders = ['npcs', 'pets', 'animals']
+    global _manifest
+    start_time = time.perf_counter()
+    base_path = os.path.join(static_folder, 'images')
+    signature = _folders_signature(base_path)
 
-    for folder in character_folders:
+    characters = []
+    for folder in CHARACTER_FOLDERS:
         folder_path = os.path.join(base_path, folder)
         if os.path.isdir(folder_path):
             for root, _, files in os.walk(folder_path):
                 for file in files:
                     # Garante que estamos lidando apenas com arquivos de imagem
-                    if file.lower().endswith(('.png', '.webp', '.gif', '.jpg', '.jpeg')):
+                    if file.lower().endswith(_IMAGE_EXTENSIONS):
                         # Cria o caminho relativo a partir da pasta base do tipo (e.g., 'pets/')
                         relative_path = os.path.relpath(os.path.join(root, file), folder_path).replace('\\', '/')
                         characters.append({
                             "type": folder,
-                            "name": relative_path
+                            "name": relative_path,
+                            "hash": static_assets.file_hash(os.path.join(root, file)),
                         })
-    
-    return characters
+    # Ordem estável, para que o mesmo conteúdo produza sempre a mesma versão.
+    characters.sort(key=lambda character: (character["type"], character["name"]))
+
+    payload = serialization.dumps(characters)
+    manifest = CharacterManifest(
+        characters=tuple(characters),
+        version=serialization.etag_for(payload)[:16],
+        payload=payload,
+        signature=signature,
+    )
+    with _manifest_lock:
+        _manifest = manifest
+    log.info(
+        f"Manifesto de personagens animados construído com {len(characters)} imagens "
+        f"em {(time.perf_counter() - start_time) * 1000:.1f} ms (versão {manifest.version})."
+    )
+    return manifest
+
+
+def get_manifest() -> CharacterManifest:
+    """Manifesto atual, construído no primeiro uso se a aplicação ainda não o fez."""
+    global _last_check
+    manifest = _manifest
+    if manifest is None:
+        return build_manifest(current_app.static_folder)
+
+    if config.ANIMATION_MANIFEST_WATCH:
+        now = time.monotonic()
+        if now - _last_check >= config.ANIMATION_MANIFEST_CHECK_SECONDS:
+            _last_check = now
+            base_path = os.path.join(current_app.static_folder, 'images')
+            if _folders_signature(base_path) != manifest.signature:
+                log.info("Pastas de personagens animados alteradas; reconstruindo o manifesto.")
+                manifest = build_manifest(current_app.static_folder)
+    return manifest
 
+
+def get_animated_characters():
+    """
+    Devolve a lista de personagens animados do manifesto.
+
+    Retorna:
+        list: Uma lista de dicionários, onde cada dicionário representa um personagem
+              com as chaves "type" (e.g., "npcs"), "name" (caminho relativo do arquivo)
+              e "hash" (hash do conteúdo, para invalidar o cache do navegador).
+              Os dicionários são partilhados e não devem ser alterados.
+    """
+    return list(get_manifest().characters)
@@ -6,11 +6,10 @@ eventos de calendário ativos, incluindo a aplicação de modificadores como os
 
 import logging
 import time
-import copy
 from typing import List, Dict, Any, Optional
 
 from ..domain import calendar_events as domain_events
-from .resource_analysis_service import _get_player_items, _process_boost_modifiers
+from .resource_analysis_service import Boost
 
 log = logging.getLogger(__name__)
 
@@ -55,9 +54,9 @@ def _get_active_event_name(game_state: Dict[str, Any]) -> Optional[str]:
 def get_active_event_boosts(game_state: Dict[str, Any], category: str) -> List[Dict[str, Any]]:
     """
     Obtém os bônus de evento de calendário ativos para uma categoria específica,
-    já com as modificações de itens (como Guardiões) aplicadas.
-
-    O método agora reutiliza a lógica de `resource_analysis_service` para garantir consistência.
+    ainda sem as modificações de itens (como Guardiões). Essas são aplicadas por
+    `PlayerBoostProfile.get_active_boosts` quando os bônus lhe são passados como
+    `external_boosts`, para que não contem duas vezes.
 
     Args:
         game_state (Dict[str, Any]): O estado completo do jogo do jogador.
@@ -65,8 +64,8 @@ def get_active_event_boosts(game_state: Dict[str, Any], category: str) -> List[D
                         (ex: "Crop", "Fruit", "Greenhouse").
 
     Returns:
-        List[Dict[str, Any]]: Uma lista de dicionários de bônus, prontos para serem
-                               usados por outros serviços.
+        List[Dict[str, Any]]: Uma lista de bônus (`Boost`), a passar como bônus
+                               externos aos serviços de análise.
     """
     active_event_name = _get_active_event_name(game_state)
     if not active_event_name:
@@ -78,19 +77,16 @@ def get_active_event_boosts(game_state: Dict[str, Any], category: str) -> List[D
     # 1. Adicionar bônus base do evento, marcando a origem corretamente.
     for boost in event_details.get("boosts", []):
         if boost.get("item") == category or "item" not in boost:
-            processed_boost = copy.deepcopy(boost)
-            processed_boost["source_item"] = event_details.get("display_name", active_event_name)
-            processed_boost["source_type"] = "event"
-            base_boosts.append(processed_boost)
-
-    # 2. Obter itens do jogador para aplicar modificadores.
-    player_items = _get_player_items(game_state)
-
-    # 3. Aplicar modificações de itens (Guardiões, etc.) usando o serviço central.
-    # A função `_process_boost_modifiers` espera que o `target_item` do modificador
-    # corresponda ao `source_item` do bônus. Por isso, o `source_item` foi definido
-    # como o nome de exibição do evento.
-    modified_boosts = _process_boost_modifiers(base_boosts, player_items)
-
-    log.debug(f"Encontrados {len(modified_boosts)} bônus (com modificações) para a categoria '{category}' do evento '{active_event_name}'.")
-    return modified_boosts
+            # Variante imutável do bônus do domínio (o original não é copiado nem alterado).
+            base_boosts.append(Boost(
+                boost,
+                source_item=event_details.get("display_name", active_event_name),
+                source_type="event",
+            ))
+
+    # 2. Os modificadores de itens (Guardiões, etc.) não são aplicados aqui: os bônus são
+    # passados como `external_boosts` a `PlayerBoostProfile.get_active_boosts`, que os
+    # aplica uma única vez, junto com os restantes. O `source_item` é o nome de exibição
+    # do evento, que é o `target_item` dos modificadores.
+    log.debug(f"Encontrados {len(base_boosts)} bônus para a categoria '{category}' do evento '{active_event_name}'.")
+    return base_boosts
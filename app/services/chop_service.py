@@ -1,16 +1,14 @@
 # app/services/chop_service.py
 
-import copy
 import logging
 import time
 from collections import defaultdict
 from decimal import Decimal
 
-from ..domain import collectiblesItemBuffs as collectibles_domain
-from ..domain import resources as resources_domain
 from ..domain import skills as skills_domain
-from ..domain import wearablesItemBuffs as wearables_domain, upgradables as upgradables_domain, tools as tools_domain
-from . import bud_service
+from ..domain import wearablesItemBuffs as wearables_domain, tools as tools_domain
+from . import item_registry, resource_analysis_service
+from .resource_analysis_service import Boost
 
 log = logging.getLogger(__name__)
 
@@ -38,35 +36,6 @@ TREE_RECOVERY_TIME_SECONDS = 2 * 60 * 60  # 2 horas em segundos
 # FUNÇÕES AUXILIARES (LÓGICA INTERNALIZADA)
 # ==============================================================================
 
-def _get_all_item_data() -> dict:
-    """Unifica todos os dicionários de domínio em um só para fácil acesso."""
-    return {
-        **skills_domain.LEGACY_BADGES,
-        **skills_domain.BUMPKIN_REVAMP_SKILLS,
-        **wearables_domain.WEARABLES_ITEM_BUFFS,
-        **collectibles_domain.COLLECTIBLES_ITEM_BUFFS,
-        **resources_domain.RESOURCES_DATA,
-        **upgradables_domain.ALL_UPGRADABLES,
-    }
-
-def _get_player_items(farm_data: dict) -> set:
-    """Extrai e unifica todos os itens que um jogador possui."""
-    player_items = set(farm_data.get("collectibles", {}).keys())
-    player_items.update(farm_data.get("home", {}).get("collectibles", {}).keys())
-    
-    bumpkin = farm_data.get("bumpkin", {})
-    if bumpkin:
-        player_items.update(bumpkin.get("equipped", {}).values())
-        player_items.update(bumpkin.get("skills", {}).keys())
-
-    farm_hands_data = farm_data.get("farmHands", {}).get("bumpkins", {})
-    if farm_hands_data:
-        for hand in farm_hands_data.values():
-            player_items.update(hand.get("equipped", {}).values())
-
-    player_items.update(farm_data.get("inventory", {}).keys())
-    return player_items
-
 def _filter_boosts_for_wood(all_item_data: dict) -> dict:
     """
     Cria um catálogo contendo apenas os itens e bônus relevantes para madeira.
@@ -109,13 +78,12 @@ def _filter_boosts_for_wood(all_item_data: dict) -> dict:
 
             if is_boost_relevant:
                 is_item_relevant = True
-                standardized_boost = boost.copy()
-                if boost.get("type") in ["YIELD", "RESOURCE_YIELD"]:
-                    standardized_boost['type'] = 'YIELD'
-                elif boost.get("type") in ["RECOVERY_TIME", "GROWTH_TIME", "TREE_RECOVERY_TIME"]:
-                    standardized_boost['type'] = 'RECOVERY_TIME'
-                elif boost.get("type") == "COST":
-                    standardized_boost['type'] = 'COST'
+                if boost_type in ["YIELD", "RESOURCE_YIELD"]:
+                    standardized_boost = Boost(boost, type='YIELD')
+                elif boost_type in ["RECOVERY_TIME", "GROWTH_TIME", "TREE_RECOVERY_TIME"]:
+                    standardized_boost = Boost(boost, type='RECOVERY_TIME')
+                else:
+                    standardized_boost = Boost(boost)
                 relevant_boosts.append(standardized_boost)
 
         if is_item_relevant:
@@ -134,10 +102,19 @@ def _filter_boosts_for_wood(all_item_data: dict) -> dict:
             }
     return boost_catalogue
 
-def _get_active_player_boosts(player_items: set, wood_boost_catalogue: dict, farm_data: dict) -> list:
+# O catálogo só depende dos domínios, por isso é construído uma única vez.
+WOOD_BOOST_CATALOGUE = _filter_boosts_for_wood(item_registry.ITEM_DATA_WITH_UPGRADABLES)
+
+def _get_active_player_boosts(profile: resource_analysis_service.PlayerBoostProfile) -> list:
     """
     Determina a lista de bônus de madeira ativos para o jogador.
+    Calculada uma vez por perfil; os bônus devolvidos são só de leitura.
     """
+    return profile.get_domain_boosts("wood", _collect_wood_boosts)
+
+def _collect_wood_boosts(profile: resource_analysis_service.PlayerBoostProfile) -> list:
+    player_items = profile.player_items
+    wood_boost_catalogue = WOOD_BOOST_CATALOGUE
     active_boosts = []
     
     # 1. Processa grupos não cumulativos (beavers)
@@ -145,13 +122,13 @@ def _get_active_player_boosts(player_items: set, wood_boost_catalogue: dict, far
         if item_name in player_items and item_name in wood_boost_catalogue:
             source_type = wood_boost_catalogue[item_name].get("source_type")
             for boost in wood_boost_catalogue[item_name]["boosts"]:
-                active_boosts.append({"source_item": item_name, "source_type": source_type, **boost})
+                active_boosts.append(boost.sourced(item_name, source_type))
             break # Aplica apenas o melhor e para
 
     # 2. Processa bônus cumulativos
     beaver_items = set(NON_CUMULATIVE_BOOST_GROUPS["beavers"])
-    for item_name in player_items:
-        if item_name in wood_boost_catalogue and item_name not in beaver_items:
+    for item_name in profile.owned_items(wood_boost_catalogue):
+        if item_name not in beaver_items:
             source_type = wood_boost_catalogue[item_name].get("source_type")
             item_boosts = wood_boost_catalogue[item_name]["boosts"]
             is_critical_item = any(b.get("type") == "CRITICAL_CHANCE" for b in item_boosts)
@@ -161,10 +138,10 @@ def _get_active_player_boosts(player_items: set, wood_boost_catalogue: dict, far
                 # então não são adicionados à lista de bônus ativos base.
                 if is_critical_item and boost.get("type") == "YIELD":
                     continue
-                active_boosts.append({"source_item": item_name, "source_type": source_type, **boost})
+                active_boosts.append(boost.sourced(item_name, source_type))
 
     # 3. Processa bônus de Buds
-    bud_analysis = bud_service.analyze_bud_buffs(farm_data)
+    bud_analysis = profile.bud_analysis
     if bud_analysis:
         active_bud_buffs = bud_analysis["internal"]["active_buffs"]
         winning_bud_info = bud_analysis["internal"]["winning_bud_info"]
@@ -172,19 +149,19 @@ def _get_active_player_boosts(player_items: set, wood_boost_catalogue: dict, far
         if 'WOOD_YIELD' in active_bud_buffs:
             source_bud = winning_bud_info.get('WOOD_YIELD')
             source_item_name = f"Bud #{source_bud['bud_id']} ({source_bud['type']}, {source_bud['aura']})" if source_bud else "Buds"
-            active_boosts.append({
+            active_boosts.append(Boost({
                 "type": "YIELD", "operation": "add",
                 "value": active_bud_buffs['WOOD_YIELD'],
                 "source_item": source_item_name, "source_type": "bud"
-            })
+            }))
         if 'TREE_RECOVERY_TIME' in active_bud_buffs:
             source_bud = winning_bud_info.get('TREE_RECOVERY_TIME')
             source_item_name = f"Bud #{source_bud['bud_id']} ({source_bud['type']}, {source_bud['aura']})" if source_bud else "Buds"
-            active_boosts.append({
+            active_boosts.append(Boost({
                 "type": "RECOVERY_TIME", "operation": "percentage",
                 "value": active_bud_buffs['TREE_RECOVERY_TIME'],
                 "source_item": source_item_name, "source_type": "bud"
-            })
+            }))
 
     return active_boosts
 
@@ -230,7 +207,7 @@ def _get_wood_drop_amount(active_boosts: list, tree_multiplier: int = 1, tree_ti
     for boost in active_boosts:
         if boost.get("type") == "YIELD":
             operation = boost["operation"]
-            value = Decimal(str(boost["value"]))
+            value = resource_analysis_service.boost_value(boost)
             
             if operation == "add":
                 additive_bonus += value
@@ -270,7 +247,7 @@ def _get_tree_recovery_time(active_boosts: list) -> dict:
     for boost in active_boosts:
         if boost.get("type") == "RECOVERY_TIME":
             operation = boost["operation"]
-            value = Decimal(str(boost["value"]))
+            value = resource_analysis_service.boost_value(boost)
 
             if operation == "percentage":
                 multiplicative_factor *= (Decimal('1') - abs(value)) # Reduções são negativas
@@ -312,7 +289,7 @@ def _get_axe_cost_and_quantity_info(active_boosts: list) -> dict:
     for boost in active_boosts:
         if boost.get("type") == "COST" and boost.get("conditions", {}).get("resource") == "Axe":
             if boost.get("operation") == "multiply":
-                cost_multiplier *= Decimal(str(boost["value"]))
+                cost_multiplier *= resource_analysis_service.boost_value(boost)
                 cost_buffs.append(boost)
 
     final_cost_per_axe = base_cost * cost_multiplier
@@ -368,27 +345,28 @@ def _format_buffs_for_display(buff_list: list) -> list:
             formatted.append({"source_item": source_item, "source_type": source_type, "effect_str": effect_str})
     return sorted(formatted, key=lambda x: x['source_item'])
 
-def _analyze_farm_summary(player_items: set, wood_boost_catalogue: dict, farm_data: dict) -> dict:
+def _analyze_farm_summary(profile: resource_analysis_service.PlayerBoostProfile, wood_boost_catalogue: dict) -> dict:
     """
     Realiza a análise de potencial teórico (sumário) da fazenda para madeira.
     Calcula rendimento Min/Avg/Max, custos e tempos de ciclo.
     """
+    farm_data = profile.farm_data
+
     # Obtém a lista de bônus base (sem YIELD de críticos) para o cálculo do MÍNIMO.
-    base_active_boosts = _get_active_player_boosts(player_items, wood_boost_catalogue, farm_data)
+    base_active_boosts = _get_active_player_boosts(profile)
 
     # 1. Análise de Rendimento (Min, Avg, Max) para uma árvore Tier 1.
     min_yield_info = _get_wood_drop_amount(base_active_boosts, tree_multiplier=1, tree_tier=1)
     
     # Constrói a lista de bônus para o cálculo do MÁXIMO.
     potential_crit_boosts = list(base_active_boosts)
-    for item_name in player_items:
-        if item_name in wood_boost_catalogue:
-            item_boosts = wood_boost_catalogue[item_name].get("boosts", [])
-            is_critical_item = any(b.get("type") == "CRITICAL_CHANCE" for b in item_boosts)
-            if is_critical_item:
-                for boost in item_boosts:
-                    if boost.get("type") == "YIELD":
-                        potential_crit_boosts.append({"source_item": f"{item_name} (Critical)", **boost})
+    for item_name in profile.owned_items(wood_boost_catalogue):
+        item_boosts = wood_boost_catalogue[item_name].get("boosts", [])
+        is_critical_item = any(b.get("type") == "CRITICAL_CHANCE" for b in item_boosts)
+        if is_critical_item:
+            for boost in item_boosts:
+                if boost.get("type") == "YIELD":
+                    potential_crit_boosts.append({"source_item": f"{item_name} (Critical)", **boost})
     
     # Adiciona o bônus de YIELD do "Native" para o cálculo do MÁXIMO, pois ele é um crítico especial.
     if "Native" in wood_boost_catalogue:
@@ -460,12 +438,14 @@ def _analyze_farm_summary(player_items: set, wood_boost_catalogue: dict, farm_da
         }
     }
 
-def _analyze_individual_trees(player_items: set, wood_boost_catalogue: dict, farm_data: dict) -> dict:
+def _analyze_individual_trees(profile: resource_analysis_service.PlayerBoostProfile, wood_boost_catalogue: dict) -> dict:
     """
     Realiza a análise do estado real de cada árvore na fazenda.
     """
+    farm_data = profile.farm_data
+
     # Obtém a lista de bônus base que se aplica a todas as árvores como ponto de partida.
-    base_active_boosts = _get_active_player_boosts(player_items, wood_boost_catalogue, farm_data)
+    base_active_boosts = _get_active_player_boosts(profile)
     
     temporal_boosts, regular_base_boosts, temporal_item_names = _extract_and_process_temporal_boosts(
         base_active_boosts, farm_data
@@ -495,8 +475,8 @@ def _analyze_individual_trees(player_items: set, wood_boost_catalogue: dict, far
             if hit_count > 0:
                 critical_hit_stats[hit_name] += hit_count
 
-        # Cria uma cópia profunda para garantir que a lista base não seja modificada entre as iterações.
-        tree_specific_boosts = copy.deepcopy(regular_base_boosts)
+        # Os bônus são imutáveis (`Boost`): basta uma lista nova por árvore, sem copiá-los.
+        tree_specific_boosts = list(regular_base_boosts)
 
         for temporal_info in temporal_boosts:
             if chopped_at_ms > temporal_info['activation_ts']:
@@ -516,10 +496,9 @@ def _analyze_individual_trees(player_items: set, wood_boost_catalogue: dict, far
 
                 if crit_yield_boost:
                     source_item_text = "(Critical Hit)" if hit_name == "Native" else f"{hit_name} (Critical Hit)"
-                    tree_specific_boosts.append({
-                        **crit_yield_boost,
-                        "source_item": source_item_text, "source_type": source_type
-                    })
+                    tree_specific_boosts.append(crit_yield_boost.overlay(
+                        source_item=source_item_text, source_type=source_type
+                    ))
         yield_info = _get_wood_drop_amount(tree_specific_boosts, tree_multiplier, tree_tier)
         summary_stats['total_yield'] += Decimal(str(yield_info['final_deterministic']))
 
@@ -556,30 +535,28 @@ def _analyze_individual_trees(player_items: set, wood_boost_catalogue: dict, far
         "temporal_item_names": temporal_item_names
     }
 
-def analyze_wood_resources(farm_data: dict) -> dict:
+def analyze_wood_resources(farm_data: dict, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Orquestrador principal para a análise de madeira.
-    Cria um catálogo de bônus e delega a análise de sumário e individual
+    Usa o catálogo de bônus de madeira e delega a análise de sumário e individual
     para funções especializadas, garantindo o desacoplamento.
+
+    Args:
+        farm_data (dict): Os dados completos da fazenda do jogador.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
     """
-    all_item_data = _get_all_item_data()
-    wood_boost_catalogue = _filter_boosts_for_wood(all_item_data)
-    
-    player_items = _get_player_items(farm_data)
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
+    wood_boost_catalogue = WOOD_BOOST_CATALOGUE
 
-    active_boosts = _get_active_player_boosts(
-        player_items,
-        wood_boost_catalogue,
-        farm_data
-    )
+    active_boosts = _get_active_player_boosts(profile)
 
     active_item_names = {boost['source_item'] for boost in active_boosts}
 
     # Delega a análise de sumário para a função dedicada.
-    summary_analysis = _analyze_farm_summary(player_items, wood_boost_catalogue, farm_data)
+    summary_analysis = _analyze_farm_summary(profile, wood_boost_catalogue)
 
     # Delega a análise individual para a função dedicada.
-    individual_analysis_result = _analyze_individual_trees(player_items, wood_boost_catalogue, farm_data)
+    individual_analysis_result = _analyze_individual_trees(profile, wood_boost_catalogue)
 
     # Combina os resultados das duas análises para a view
     active_item_names.update(individual_analysis_result["temporal_item_names"])
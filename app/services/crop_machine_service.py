@@ -122,27 +122,25 @@ def _calculate_oil_consumption_info(active_boosts: list) -> dict:
 # FUNÇÃO PRINCIPAL (ORQUESTRADOR)
 # ==============================================================================
 
-def analyze_crop_machine(farm_data: dict) -> dict:
+def analyze_crop_machine(farm_data: dict, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Analisa o estado da Crop Machine, calculando o rendimento e o custo de óleo de cada pacote na fila.
+
+    Args:
+        farm_data (dict): O estado completo da fazenda do jogador.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
     """
     crop_machine_building = farm_data.get("buildings", {}).get("Crop Machine")
     if not crop_machine_building:
         return {"view": None}
 
-    player_items = resource_analysis_service._get_player_items(farm_data)
-    
-    base_active_yield_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items, CROP_MACHINE_YIELD_BOOST_CATALOGUE, {}, farm_data
-    )
-    
-    active_oil_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items, OIL_BOOST_CATALOGUE, {}, farm_data
-    )
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
+
+    base_active_yield_boosts = profile.get_active_boosts(CROP_MACHINE_YIELD_BOOST_CATALOGUE)
+
+    active_oil_boosts = profile.get_active_boosts(OIL_BOOST_CATALOGUE)
 
-    active_time_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items, CROP_MACHINE_TIME_BOOST_CATALOGUE, {}, farm_data
-    )
+    active_time_boosts = profile.get_active_boosts(CROP_MACHINE_TIME_BOOST_CATALOGUE)
 
     # Adiciona um filtro para garantir que apenas os bônus de tempo corretos sejam processados.
     active_time_boosts = [b for b in active_time_boosts if b.get('type') == 'CROP_MACHINE_GROWTH_TIME']
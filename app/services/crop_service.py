@@ -33,7 +33,7 @@ CROP_BOOST_CATALOGUE = resource_analysis_service.filter_boosts_from_domains(CROP
 # FUNÇÕES DE CÁLCULO (LÓGICA INTERNA)
 # ==============================================================================
 
-def _get_crop_yield_amount(game_state: dict, plot: dict, crop_name: str, calendar_boosts: list = None) -> dict:
+def _get_crop_yield_amount(game_state: dict, plot: dict, crop_name: str, calendar_boosts: list = None, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Calcula o rendimento final de uma cultura, aplicando bônus de itens, habilidades,
     fertilizantes, AOE, eventos de calendário e acertos críticos, seguindo o padrão 
@@ -44,22 +44,21 @@ def _get_crop_yield_amount(game_state: dict, plot: dict, crop_name: str, calenda
         plot (dict): Os dados específicos do canteiro de cultura (plot) sendo analisado.
         crop_name (str): O nome da cultura plantada no canteiro.
         calendar_boosts (list, optional): Lista de bônus de eventos de calendário ativos.
+        profile (PlayerBoostProfile, optional): Perfil de bônus partilhado do pedido.
 
     Returns:
         dict: Um dicionário contendo o rendimento final e uma lista detalhada de bônus.
     """
     base_yield = Decimal('1')
 
-    player_items = resource_analysis_service._get_player_items(game_state)
-    player_skills = set(game_state.get("bumpkin", {}).get("skills", {}).keys())
+    profile = profile or resource_analysis_service.PlayerBoostProfile(game_state)
+    player_skills = profile.player_skills
     collectibles = {**game_state.get("collectibles", {}), **game_state.get("home", {}).get("collectibles", {})}
 
     # 1. Obter bônus ativos, incluindo os de calendário, para processamento unificado.
-    active_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items=player_items,
-        boost_catalogue=CROP_BOOST_CATALOGUE,
+    active_boosts = profile.get_active_boosts(
+        CROP_BOOST_CATALOGUE,
         non_cumulative_groups=NON_CUMULATIVE_BOOST_GROUPS,
-        farm_data=game_state,
         external_boosts=calendar_boosts
     )
 
@@ -140,7 +139,7 @@ def _get_crop_yield_amount(game_state: dict, plot: dict, crop_name: str, calenda
 
     return {"final_deterministic": float(final_yield), "applied_buffs": applied_buffs_details}
 
-def _get_crop_growth_time(game_state: dict, crop_name: str, plot: dict, calendar_boosts: list = None) -> dict:
+def _get_crop_growth_time(game_state: dict, crop_name: str, plot: dict, calendar_boosts: list = None, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Calcula o tempo de crescimento de uma cultura, espelhando a lógica de `plant.ts`,
     e aplicando bônus de eventos de calendário como 'sunshower'.
@@ -151,15 +150,13 @@ def _get_crop_growth_time(game_state: dict, crop_name: str, plot: dict, calendar
     if base_time == 0:
         return {"final": 0, "applied_buffs": []}
 
-    player_items = resource_analysis_service._get_player_items(game_state)
-    player_skills = set(game_state.get("bumpkin", {}).get("skills", {}).keys())
+    profile = profile or resource_analysis_service.PlayerBoostProfile(game_state)
+    player_skills = profile.player_skills
     collectibles = {**game_state.get("collectibles", {}), **game_state.get("home", {}).get("collectibles", {})}
 
-    active_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items=player_items,
-        boost_catalogue=CROP_BOOST_CATALOGUE,
+    active_boosts = profile.get_active_boosts(
+        CROP_BOOST_CATALOGUE,
         non_cumulative_groups=NON_CUMULATIVE_BOOST_GROUPS,
-        farm_data=game_state,
         external_boosts=calendar_boosts
     )
     
@@ -189,7 +186,7 @@ def _get_crop_growth_time(game_state: dict, crop_name: str, plot: dict, calendar
 # FUNÇÃO PRINCIPAL (ORQUESTRADOR)
 # ==============================================================================
 
-def analyze_crop_resources(farm_data: dict, calendar_boosts: list = None) -> dict:
+def analyze_crop_resources(farm_data: dict, calendar_boosts: list = None, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Analisa todos os canteiros de culturas na fazenda do jogador, calcula seus
     tempos de crescimento e rendimentos potenciais, e retorna um relatório
@@ -202,6 +199,7 @@ def analyze_crop_resources(farm_data: dict, calendar_boosts: list = None) -> dic
     Args:
         farm_data (dict): O estado completo do jogo da fazenda do jogador.
         calendar_boosts (list, optional): Lista de bônus de eventos de calendário ativos.
+        profile (PlayerBoostProfile, optional): Perfil de bônus partilhado do pedido.
 
     Returns:
         dict: Um dicionário contendo:
@@ -211,10 +209,8 @@ def analyze_crop_resources(farm_data: dict, calendar_boosts: list = None) -> dic
                                incluindo cálculos de rendimento e crescimento, fertilizantes,
                                bônus de abelhas, acertos críticos e recompensas bônus.
     """
-    player_items = resource_analysis_service._get_player_items(farm_data)
-    active_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items, CROP_BOOST_CATALOGUE, NON_CUMULATIVE_BOOST_GROUPS, farm_data
-    )
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
+    active_boosts = profile.get_active_boosts(CROP_BOOST_CATALOGUE, NON_CUMULATIVE_BOOST_GROUPS)
     
     plots_api_data = farm_data.get("crops", {})
     analyzed_plots = {}
@@ -235,7 +231,7 @@ def analyze_crop_resources(farm_data: dict, calendar_boosts: list = None) -> dic
         base_growth_seconds = crops_domain.CROPS.get(crop_name, {}).get("harvestSeconds", 0)
         summary[crop_name]['base_recovery_time'] = base_growth_seconds
         
-        growth_time_info = _get_crop_growth_time(farm_data, crop_name, plot_data, calendar_boosts)
+        growth_time_info = _get_crop_growth_time(farm_data, crop_name, plot_data, calendar_boosts, profile)
         final_growth_ms = growth_time_info["final"] * 1000
         
         planted_at_ms = crop_details.get("plantedAt", 0)
@@ -278,7 +274,8 @@ def analyze_crop_resources(farm_data: dict, calendar_boosts: list = None) -> dic
             game_state=farm_data,
             plot=plot_data,
             crop_name=crop_name,
-            calendar_boosts=calendar_boosts
+            calendar_boosts=calendar_boosts,
+            profile=profile
         )
         summary[crop_name]['total_yield'] += Decimal(str(yield_info['final_deterministic']))
 
@@ -1,11 +1,80 @@
 # app/services/exchange_service.py
 import logging
 from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
+from typing import NamedTuple
+
+from flask import g, has_request_context
 
 from .. import sunflower_api
 
 log = logging.getLogger(__name__)
 
+
+class RatesSnapshot(NamedTuple):
+    """
+    Taxas de câmbio já processadas, partilhadas (só leitura) entre pedidos até à
+    próxima atualização das cotações.
+    """
+    rates: MappingProxyType  # Mesma estrutura de `get_exchange_rates()`
+    sfl_usd: Decimal
+    sfl_brl: Decimal
+    coin_sfl: Decimal        # SFL por Coin (melhor pacote)
+
+    def as_dict(self) -> dict:
+        """Cópia das taxas como dicionário comum (ex: para `jsonify`)."""
+        return {currency: dict(values) for currency, values in self.rates.items()}
+
+
+_EMPTY_SNAPSHOT = RatesSnapshot(MappingProxyType({}), Decimal("0"), Decimal("0"), Decimal("0"))
+
+# (dados da API, snapshot): reutilizado enquanto o cache devolver os mesmos dados de cotação.
+_last_snapshot = (None, _EMPTY_SNAPSHOT)
+
+
+def get_rates_snapshot() -> RatesSnapshot:
+    """
+    Devolve as taxas processadas, recalculando-as apenas quando os dados de
+    cotação em cache mudam (ou seja, uma vez por atualização da sfl.world).
+    """
+    global _last_snapshot
+    data, error = sunflower_api.get_exchange_data()
+
+    if error or not data:
+        log.error(f"Não foi possível obter dados de cotação do API client: {error}")
+        return _EMPTY_SNAPSHOT
+
+    source, snapshot = _last_snapshot
+    if source is data or source == data:
+        return snapshot
+
+    rates = _process_exchange_data(data)
+    snapshot = _EMPTY_SNAPSHOT if not rates else RatesSnapshot(
+        rates=MappingProxyType({currency: MappingProxyType(values) for currency, values in rates.items()}),
+        sfl_usd=Decimal(str(rates['sfl'].get('usd', 0))),
+        sfl_brl=Decimal(str(rates['sfl'].get('brl', 0))),
+        coin_sfl=Decimal(str(rates['coin'].get('sfl', 0))),
+    )
+    if rates:
+        # Os dados vêm do cache em memória e não são alterados por ninguém.
+        _last_snapshot = (data, snapshot)
+    return snapshot
+
+
+def get_request_rates() -> RatesSnapshot:
+    """
+    Snapshot das taxas do pedido atual, obtido no primeiro uso e guardado em
+    `flask.g`: todos os valores de uma página usam a mesma cotação e o cache é
+    consultado uma única vez.
+    """
+    if not has_request_context():
+        return get_rates_snapshot()
+    snapshot = g.get("exchange_rates_snapshot")
+    if snapshot is None:
+        snapshot = g.exchange_rates_snapshot = get_rates_snapshot()
+    return snapshot
+
+
 def get_exchange_rates():
     """
     Processa as taxas de câmbio obtidas pelo cliente de API.
@@ -22,13 +91,12 @@ def get_exchange_rates():
               }
         Retorna um dicionário vazio em caso de erro.
     """
-    log.info("Processando taxas de câmbio...")
-    data, error = sunflower_api.get_exchange_data()
+    return get_rates_snapshot().as_dict()
 
-    if error or not data:
-        log.error(f"Não foi possível obter dados de cotação do API client: {error}")
-        return {}
 
+def _process_exchange_data(data: dict) -> dict:
+    """Calcula as taxas a partir da resposta da API de cotação ({} em caso de erro)."""
+    log.info("Processando taxas de câmbio...")
     try:
         processed_rates = {'sfl': {}, 'coin': {}, 'gem': {}}
 
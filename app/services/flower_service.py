@@ -64,7 +64,7 @@ def _get_honey_yield_amount(active_boosts: list) -> dict:
         resource_name="Honey"
     )
 
-def _get_honey_production_time(game_state: dict, attached_flowers: int) -> dict:
+def _get_honey_production_time(game_state: dict, attached_flowers: int, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Calcula o tempo de produção de mel para uma colmeia de forma data-driven.
     Espelha a lógica de `getHoneyProductionRate` de `updateBeehives.ts` e considera
@@ -74,6 +74,7 @@ def _get_honey_production_time(game_state: dict, attached_flowers: int) -> dict:
     Args:
         game_state (dict): O estado atual do jogo.
         attached_flowers (int): O número de flores anexadas à colmeia, que afeta a velocidade.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
 
     Returns:
         dict: Um dicionário contendo o tempo base, tempo final, detalhes dos buffs aplicados
@@ -97,6 +98,7 @@ def _get_honey_production_time(game_state: dict, attached_flowers: int) -> dict:
 
     # Obter todos os bônus ativos relevantes para a produção de mel
     # Estes bônus são definidos nos arquivos de domínio (collectiblesItemBuffs, wearablesItemBuffs, skills)
+    # Os dados da fazenda são passados como `player_items`: na prática só os bônus dos Buds se aplicam.
     active_production_boosts = resource_analysis_service.get_active_player_boosts(
         game_state, BEEHIVE_BOOST_CATALOGUE, {}, game_state
     )
@@ -138,17 +140,15 @@ def _get_honey_production_time(game_state: dict, attached_flowers: int) -> dict:
 # FUNÇÕES PRINCIPAIS (ORQUESTRADORES)
 # ==============================================================================
 
-def analyze_flower_beds(farm_data: dict) -> dict:
+def analyze_flower_beds(farm_data: dict, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """Analisa todos os canteiros de flores, calcula bônus e retorna um relatório completo."""
     flower_beds_api_data = farm_data.get("flowers", {}).get("flowerBeds", {})
     analyzed_beds = {}
     summary = defaultdict(lambda: {"total": 0, "ready": 0, "growing": 0, "total_yield": Decimal('0')})
     current_timestamp_ms = int(time.time() * 1000)
 
-    player_items = resource_analysis_service._get_player_items(farm_data)
-    active_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items, FLOWER_BOOST_CATALOGUE, {}, farm_data
-    )
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
+    active_boosts = profile.get_active_boosts(FLOWER_BOOST_CATALOGUE)
 
     for bed_id, bed_data in flower_beds_api_data.items():
         flower_details = bed_data.get("flower")
@@ -200,7 +200,7 @@ def analyze_flower_beds(farm_data: dict) -> dict:
         "summary_by_flower": dict(sorted(summary.items()))
     }}
 
-def analyze_beehives(farm_data: dict) -> dict:
+def analyze_beehives(farm_data: dict, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """Analisa todas as colmeias, calcula bônus e retorna um relatório completo."""
     beehives_api_data = farm_data.get("beehives", {})
     if not beehives_api_data:
@@ -209,17 +209,15 @@ def analyze_beehives(farm_data: dict) -> dict:
     analyzed_hives = {}
     current_timestamp_ms = int(time.time() * 1000)
 
-    player_items = resource_analysis_service._get_player_items(farm_data)
-    active_yield_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items, BEEHIVE_BOOST_CATALOGUE, {}, farm_data
-    )
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
+    active_yield_boosts = profile.get_active_boosts(BEEHIVE_BOOST_CATALOGUE)
 
     base_honey_time = resources_domain.RESOURCES_DATA['Honey']['details']['cycle']['Beehive']['recovery_time_seconds']
 
     for hive_id, hive_data in beehives_api_data.items():
         attached_flowers = len(hive_data.get("flowers", []))
         
-        production_time_info = _get_honey_production_time(farm_data, attached_flowers)
+        production_time_info = _get_honey_production_time(farm_data, attached_flowers, profile)
         yield_info = _get_honey_yield_amount(active_yield_boosts)
         
         final_production_time_seconds = production_time_info.get("final", base_honey_time)
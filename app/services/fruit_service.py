@@ -20,11 +20,10 @@ from ..domain import resources as resources_domain
 
 # Importa as funções necessárias do serviço de análise centralizado.
 # Este serviço é a "fonte da verdade" para como os bônus são processados.
-from .resource_analysis_service import (_get_player_items,
+from .resource_analysis_service import (PlayerBoostProfile,
                                         calculate_final_recovery_time,
                                         calculate_final_yield,
-                                        filter_boosts_from_domains,
-                                        get_active_player_boosts)
+                                        filter_boosts_from_domains)
 
 log = logging.getLogger(__name__)
 
@@ -87,13 +86,14 @@ def _get_fruit_yield_amount(game_state: dict, fruit_name: str, fertiliser: str,
 
     return yield_calculation
 
-def _get_fruit_patch_recovery_time(game_state: dict, fruit_name: str) -> dict:
+def _get_fruit_patch_recovery_time(game_state: dict, fruit_name: str, profile: PlayerBoostProfile = None) -> dict:
     """
     Calcula o tempo de recuperação de um canteiro de frutas após a colheita.
 
     Args:
         game_state (dict): O estado atual do jogo da fazenda.
         fruit_name (str): O nome da fruta plantada no canteiro.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
 
     Returns:
         dict: Um dicionário contendo o tempo de recuperação final e os bônus aplicados.
@@ -110,13 +110,9 @@ def _get_fruit_patch_recovery_time(game_state: dict, fruit_name: str) -> dict:
         log.warning(f"Tempo base de plantio/recuperação zero para a semente: {seed_name}")
         return {"final": 0, "applied_buffs": []}
 
-    # Obtém todos os itens que o jogador possui para calcular os bônus ativos.
-    player_items = _get_player_items(game_state)
-    active_boosts = get_active_player_boosts(
-        player_items=player_items,
-        boost_catalogue=FRUIT_BOOST_CATALOGUE,
-        farm_data=game_state
-    )
+    # Obtém os bônus ativos a partir dos itens que o jogador possui.
+    profile = profile or PlayerBoostProfile(game_state)
+    active_boosts = profile.get_active_boosts(FRUIT_BOOST_CATALOGUE)
     
     # Delega o cálculo do tempo de recuperação final ao serviço de análise de recursos.
     return calculate_final_recovery_time(base_time, active_boosts, fruit_name)
@@ -125,7 +121,7 @@ def _get_fruit_patch_recovery_time(game_state: dict, fruit_name: str) -> dict:
 # FUNÇÃO PRINCIPAL (ORQUESTRADOR)
 # ==============================================================================
 
-def analyze_fruit_patches(farm_data: dict) -> dict:
+def analyze_fruit_patches(farm_data: dict, profile: PlayerBoostProfile = None) -> dict:
     """
     Analisa todos os canteiros de frutas na fazenda do jogador,
     calcula o rendimento e o tempo de recuperação para cada um,
@@ -136,11 +132,13 @@ def analyze_fruit_patches(farm_data: dict) -> dict:
 
     Args:
         farm_data (dict): Os dados completos da fazenda do jogador.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
 
     Returns:
         dict: Um relatório detalhado do estado dos canteiros de frutas,
               incluindo resumos e cálculos individuais.
     """
+    profile = profile or PlayerBoostProfile(farm_data)
     fruit_patches_api_data = farm_data.get("fruitPatches", {})
     analyzed_patches = {}
     # defaultdict para facilitar a agregação de dados de resumo por fruta.
@@ -159,7 +157,7 @@ def analyze_fruit_patches(farm_data: dict) -> dict:
         summary[fruit_name]["total"] += 1 # Incrementa o contador total para esta fruta
         
         # Calcula o tempo de recuperação do canteiro
-        recovery_info = _get_fruit_patch_recovery_time(farm_data, fruit_name)
+        recovery_info = _get_fruit_patch_recovery_time(farm_data, fruit_name, profile)
         final_recovery_ms = recovery_info["final"] * 1000 # Converte segundos para milissegundos
         
         # Armazena o tempo de recuperação final no resumo, se ainda não estiver lá
@@ -176,17 +174,10 @@ def analyze_fruit_patches(farm_data: dict) -> dict:
 
         fertiliser_name = patch_data.get("fertiliser", {}).get("name")
         
-        # 1. Obtém todos os itens que o jogador possui (habilidades, vestíveis, etc.).
-        player_items = _get_player_items(farm_data)
-        
-        # 2. Obtém a lista de bônus globais ativos do jogador.
+        # 1-2. Obtém a lista de bônus globais ativos do jogador (do perfil partilhado).
         # A função `get_active_player_boosts` intencionalmente ignora fertilizantes,
         # pois eles são específicos do nó e devem ser tratados pelo serviço do nó.
-        active_boosts = get_active_player_boosts(
-            player_items=player_items,
-            boost_catalogue=FRUIT_BOOST_CATALOGUE,
-            farm_data=farm_data
-        )
+        active_boosts = profile.get_active_boosts(FRUIT_BOOST_CATALOGUE)
 
         # Adiciona manualmente o bônus do fertilizante, se aplicável a este canteiro.
         if fertiliser_name and fertiliser_name in FRUIT_BOOST_CATALOGUE:
@@ -130,21 +130,23 @@ def _calculate_greenhouse_growth_time(active_boosts: list, plant_name: str, node
 # FUNÇÃO PRINCIPAL (ORQUESTRADOR)
 # ==============================================================================
 
-def analyze_greenhouse_resources(farm_data: dict) -> dict:
+def analyze_greenhouse_resources(farm_data: dict, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Analisa todos os vasos da estufa, calcula bônus e retorna um relatório completo.
+
+    Args:
+        farm_data (dict): O estado completo da fazenda do jogador.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
     """
     greenhouse_data = farm_data.get("greenhouse")
     if not greenhouse_data:
         return None
 
     # 1. Obter todos os bônus ativos do jogador que se aplicam à estufa.
-    player_items = resource_analysis_service._get_player_items(farm_data)
-    active_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items,
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
+    active_boosts = profile.get_active_boosts(
         GREENHOUSE_BOOST_CATALOGUE,
         NON_CUMULATIVE_BOOST_GROUPS, # A estufa não possui grupos de bônus não cumulativos definidos.
-        farm_data
     )
 
     # 2. Analisar cada vaso individualmente.
@@ -0,0 +1,198 @@
+# app/services/item_registry.py
+"""
+Registo unificado, só de leitura, dos dados de itens com bônus.
+
+Os serviços de análise precisavam de juntar os mesmos domínios (habilidades,
+vestíveis, coletáveis, recursos...) num único dicionário, e faziam-no a cada
+chamada. Aqui essas junções são feitas uma única vez, na importação, e expostas
+como `MappingProxyType` (só de leitura).
+
+Para cada item do registo base há também um `ItemInfo` com as propriedades
+derivadas que as análises consultam repetidamente (tipo de origem, AOE e
+modificadores).
+
+Cada nome de item tem também um ID inteiro denso (`item_id`), para que conjuntos
+de itens (itens do jogador, catálogos, tabelas) sejam representados como bitsets
+(`int`): as interseções passam a ser `&` e os nomes só são recuperados ao percorrer
+o resultado (`item_names`), pela ordem dos IDs. Os IDs começam pelo registo base,
+na sua ordem, seguidos dos restantes registos e do mapa mestre de itens; nomes
+desconhecidos (ex: itens novos do jogo) recebem um ID no primeiro uso.
+"""
+import threading
+from types import MappingProxyType
+from typing import NamedTuple
+
+from ..domain import collectiblesItemBuffs as collectibles_domain
+from ..domain import factions as factions_domain
+from ..domain import game as game_domain
+from ..domain import item_map as item_map_domain
+from ..domain import resources as resources_domain
+from ..domain import skills as skills_domain
+from ..domain import upgradables as upgradables_domain
+from ..domain import wearablesItemBuffs as wearables_domain
+
+# Tipos de efeito que alteram outros bônus em vez de darem um bônus próprio.
+MODIFIER_EFFECT_TYPES = frozenset({"ITEM_MODIFICATION", "COLLECTIBLE_EFFECT_MULTIPLIER"})
+_MODIFIER_ONLY_EFFECT_TYPES = MODIFIER_EFFECT_TYPES | {"MODIFY_ITEM_AOE"}
+
+
+def _merge(*tables) -> MappingProxyType:
+    """Junta os domínios pela ordem dada (o último prevalece), tal como `{**a, **b}`."""
+    merged = {}
+    for table in tables:
+        merged.update(table)
+    return MappingProxyType(merged)
+
+
+# Registo base: habilidades, vestíveis, coletáveis e recursos.
+ITEM_DATA = _merge(
+    skills_domain.LEGACY_BADGES,            # Habilidades legadas
+    skills_domain.BUMPKIN_REVAMP_SKILLS,    # Habilidades do sistema de revamp
+    wearables_domain.WEARABLES_ITEM_BUFFS,  # Bônus de itens vestíveis
+    collectibles_domain.COLLECTIBLES_ITEM_BUFFS,  # Bônus de itens coletáveis
+    resources_domain.RESOURCES_DATA,        # Dados de recursos (pode incluir bônus)
+)
+
+# Registo base mais as ferramentas e edifícios melhoráveis (usado pela madeira).
+ITEM_DATA_WITH_UPGRADABLES = _merge(ITEM_DATA, upgradables_domain.ALL_UPGRADABLES)
+
+# Registo base mais os itens de facção e os termos do jogo (usado pelos minerais).
+# Os itens de facção prevalecem sobre os vestíveis com o mesmo nome.
+ITEM_DATA_WITH_FACTIONS = _merge(
+    ITEM_DATA,
+    factions_domain.FACTION_ITEMS_DATA,
+    getattr(game_domain, "GAME_TERMS", {}),
+)
+
+# Itens que podem originar acertos críticos na mineração.
+CRITICAL_HIT_ITEM_DATA = _merge(
+    skills_domain.LEGACY_BADGES,
+    skills_domain.BUMPKIN_REVAMP_SKILLS,
+    wearables_domain.WEARABLES_ITEM_BUFFS,
+    collectibles_domain.COLLECTIBLES_ITEM_BUFFS,
+    factions_domain.FACTION_ITEMS_DATA,
+)
+
+# Itens que podem originar acertos críticos na Crimstone. Os vestíveis prevalecem.
+CRIMSTONE_CRITICAL_HIT_ITEM_DATA = _merge(
+    collectibles_domain.COLLECTIBLES_ITEM_BUFFS,
+    skills_domain.BUMPKIN_REVAMP_SKILLS,
+    wearables_domain.WEARABLES_ITEM_BUFFS,
+)
+
+
+class ItemInfo(NamedTuple):
+    """Propriedades pré-calculadas de um item do registo base."""
+    source_type: str            # 'skill_legacy', 'skill', 'wearable', 'fertiliser' ou 'collectible'
+    has_aoe: bool               # O item tem Área de Efeito
+    is_aoe_modifier: bool       # Tem um efeito MODIFY_ITEM_AOE (os YIELD são locais à AOE)
+    is_modifier_only: bool      # Todos os efeitos apenas modificam outros bônus
+    modifier_source_type: str   # Tipo de origem usado ao aplicar os seus modificadores
+    modifier_effects: tuple     # Efeitos/bônus do tipo ITEM_MODIFICATION ou COLLECTIBLE_EFFECT_MULTIPLIER
+
+
+def _build_item_info(item_name: str, item_details: dict) -> ItemInfo:
+    if item_name in skills_domain.LEGACY_BADGES:
+        source_type = "skill_legacy"
+    elif item_name in skills_domain.BUMPKIN_REVAMP_SKILLS:
+        source_type = "skill"
+    elif item_name in wearables_domain.WEARABLES_ITEM_BUFFS:
+        source_type = "wearable"
+    elif item_details.get("type") == "Fertiliser":
+        source_type = "fertiliser"
+    else:
+        source_type = "collectible"
+
+    if item_name in skills_domain.BUMPKIN_REVAMP_SKILLS:
+        modifier_source_type = "skill"
+    elif item_name in wearables_domain.WEARABLES_ITEM_BUFFS:
+        modifier_source_type = "wearable"
+    else:
+        modifier_source_type = "collectible"
+
+    effects = item_details.get("effects") or []
+    possible_effects = effects + (item_details.get("boosts") or [])
+
+    return ItemInfo(
+        source_type=source_type,
+        has_aoe="aoe" in item_details,
+        is_aoe_modifier=any(e.get("name") == "MODIFY_ITEM_AOE" for e in effects),
+        is_modifier_only=bool(effects) and all(e.get("type") in _MODIFIER_ONLY_EFFECT_TYPES for e in effects),
+        modifier_source_type=modifier_source_type,
+        modifier_effects=tuple(e for e in possible_effects if e.get("type") in MODIFIER_EFFECT_TYPES),
+    )
+
+
+ITEM_INFO = MappingProxyType({
+    item_name: _build_item_info(item_name, item_details)
+    for item_name, item_details in ITEM_DATA.items()
+    if item_details
+})
+
+
+# ==============================================================================
+# IDs INTEIROS E BITSETS DE ITENS
+# ==============================================================================
+
+_ITEM_NAMES = []   # ID -> nome
+_ITEM_IDS = {}     # nome -> ID
+_intern_lock = threading.Lock()
+
+
+def item_id(item_name: str) -> int:
+    """ID inteiro do item, atribuído no primeiro uso (estável durante o processo)."""
+    found = _ITEM_IDS.get(item_name)
+    if found is not None:
+        return found
+    with _intern_lock:
+        found = _ITEM_IDS.get(item_name)
+        if found is None:
+            found = _ITEM_IDS[item_name] = len(_ITEM_NAMES)
+            _ITEM_NAMES.append(item_name)
+        return found
+
+
+def item_bits(item_names_) -> int:
+    """Bitset com os IDs dos nomes dados."""
+    bits = 0
+    for name in item_names_:
+        bits |= 1 << item_id(name)
+    return bits
+
+
+def item_names(bits: int) -> list:
+    """Nomes dos itens de um bitset, pela ordem dos IDs."""
+    names = []
+    while bits:
+        lowest = bits & -bits
+        names.append(_ITEM_NAMES[lowest.bit_length() - 1])
+        bits ^= lowest
+    return names
+
+
+# Atalho por identidade para as tabelas partilhadas (registos, catálogos), que não
+# mudam depois de construídas. Guarda a própria tabela para que o `id` não seja reutilizado.
+_BITS_BY_ID = {}
+
+
+def mapping_bits(table) -> int:
+    """Bitset das chaves de uma tabela partilhada e só de leitura (memorizado por identidade)."""
+    cached = _BITS_BY_ID.get(id(table))
+    if cached is not None and cached[0] is table:
+        return cached[1]
+    bits = item_bits(table)
+    if len(_BITS_BY_ID) < 4096:
+        _BITS_BY_ID[id(table)] = (table, bits)
+    return bits
+
+
+for _table in (
+    ITEM_DATA, ITEM_DATA_WITH_UPGRADABLES, ITEM_DATA_WITH_FACTIONS,
+    CRITICAL_HIT_ITEM_DATA, item_map_domain.MASTER_ITEM_MAP,
+):
+    mapping_bits(_table)
+
+# Itens do registo base com efeitos modificadores (ITEM_MODIFICATION, etc.).
+MODIFIER_ITEM_BITS = item_bits(name for name, info in ITEM_INFO.items() if info.modifier_effects)
+# Itens do registo base cujos efeitos apenas modificam outros bônus.
+MODIFIER_ONLY_ITEM_BITS = item_bits(name for name, info in ITEM_INFO.items() if info.is_modifier_only)
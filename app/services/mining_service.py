@@ -5,15 +5,7 @@ import time
 from collections import defaultdict
 from decimal import Decimal
 
-from ..domain import (
-    collectiblesItemBuffs as collectibles_domain,
-    resources as resources_domain,
-    skills as skills_domain,
-    wearablesItemBuffs as wearables_domain,
-    factions as factions_domain,
-    game as game_domain
-)
-from . import bud_service
+from . import item_registry, resource_analysis_service
 
 log = logging.getLogger(__name__)
 
@@ -38,44 +30,23 @@ RESOURCE_NODE_MAP = {
 # FUNÇÃO DE AGREGAÇÃO DE BÔNUS (LÓGICA CENTRAL)
 # ==============================================================================
 
-def _get_player_items(farm_data: dict) -> set:
-    """
-    Extrai e unifica todos os itens que um jogador possui em um único conjunto.
-    """
-    player_items = set(farm_data.get("collectibles", {}).keys())
-    player_items.update(farm_data.get("home", {}).get("collectibles", {}).keys())
-    
-    bumpkin = farm_data.get("bumpkin", {})
-    if bumpkin:
-        player_items.update(bumpkin.get("equipped", {}).values())
-        player_items.update(bumpkin.get("skills", {}).keys())
-
-    player_items.update(farm_data.get("inventory", {}).keys())
-    return player_items
-
-def _get_mining_buffs(farm_data: dict) -> list:
+def _get_mining_buffs(profile: resource_analysis_service.PlayerBoostProfile) -> list:
     """
     Coleta e filtra todos os bônus relevantes para a mineração (Stone, Iron, Gold)
     e recuperação de nós de mineração, espelhando a lógica do `chop_service`.
 
     Args:
-        farm_data (dict): O estado completo da fazenda do jogador.
+        profile (PlayerBoostProfile): Perfil de bônus do jogador para este pedido.
 
     Returns:
         list: Uma lista de dicionários de bônus ativos e relevantes para mineração.
     """
-    player_items = _get_player_items(farm_data)
+    farm_data = profile.farm_data
+    # Os vestíveis dos Farm Hands não contam para os minerais.
+    player_items = profile.player_items_without_farm_hands
     active_buffs = []
 
-    all_item_data = {
-        **skills_domain.LEGACY_BADGES,
-        **skills_domain.BUMPKIN_REVAMP_SKILLS,
-        **wearables_domain.WEARABLES_ITEM_BUFFS,
-        **collectibles_domain.COLLECTIBLES_ITEM_BUFFS,
-        **resources_domain.RESOURCES_DATA,
-        **factions_domain.FACTION_ITEMS_DATA,
-        **game_domain.GAME_TERMS
-    }
+    all_item_data = item_registry.ITEM_DATA_WITH_FACTIONS
     player_faction = farm_data.get("faction", {}).get("name")
 
     # Processa grupos não cumulativos
@@ -91,7 +62,7 @@ def _get_mining_buffs(farm_data: dict) -> list:
                 break
 
     # Processa itens cumulativos
-    for item_name in player_items:
+    for item_name in profile.owned_items(all_item_data, include_farm_hands=False):
         if item_name in processed_non_cumulative:
             continue
 
@@ -142,7 +113,7 @@ def _get_mining_buffs(farm_data: dict) -> list:
             mining_related_buffs.append(buff)
 
     # Adiciona buffs de Bud
-    bud_analysis = bud_service.analyze_bud_buffs(farm_data)
+    bud_analysis = profile.bud_analysis
     if bud_analysis:
         for resource in mining_resources:
             if resource in bud_analysis.get("yield", {}):
@@ -217,8 +188,10 @@ def _calculate_yield(base_yield: float, all_buffs: list, resource_name: str, cri
                     elif operation == "multiply":
                         final_yield *= value
                     
-                    crit_boost_info['source_item'] = f"{hit_name} (Critical Hit)"
-                    applied_buffs_details.append(crit_boost_info)
+                    # Variante do bônus do domínio para este acerto; o original não é alterado.
+                    applied_buffs_details.append(resource_analysis_service.overlay_boost(
+                        crit_boost_info, source_item=f"{hit_name} (Critical Hit)"
+                    ))
 
     return {
         "base": float(base),
@@ -270,23 +243,22 @@ def _calculate_recovery_time(base_time: float, all_buffs: list, resource_name: s
 # FUNÇÃO PRINCIPAL (ORQUESTRADOR)
 # ==============================================================================
 
-def analyze_mining_resources(farm_data: dict) -> dict:
+def analyze_mining_resources(farm_data: dict, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Analisa todos os recursos de mineração, calcula bônus e retorna um relatório completo.
+
+    Args:
+        farm_data (dict): O estado completo da fazenda do jogador.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
     """
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
     start_time = time.time()
 
     # 1. Coleta todos os bônus do jogador de uma só vez, filtrados para mineração.
-    all_player_buffs = _get_mining_buffs(farm_data)
+    all_player_buffs = _get_mining_buffs(profile)
 
     # Catálogo de itens para consulta de bônus de crítico
-    all_item_data_for_crit = {
-        **skills_domain.LEGACY_BADGES,
-        **skills_domain.BUMPKIN_REVAMP_SKILLS,
-        **wearables_domain.WEARABLES_ITEM_BUFFS,
-        **collectibles_domain.COLLECTIBLES_ITEM_BUFFS,
-        **factions_domain.FACTION_ITEMS_DATA,
-    }
+    all_item_data_for_crit = item_registry.CRITICAL_HIT_ITEM_DATA
 
     # Extrai nomes de itens ativos para a UI
     active_item_names = sorted(list(set(b['source_item'] for b in all_player_buffs)))
@@ -5,15 +5,7 @@ import time
 from collections import defaultdict
 from decimal import Decimal
 
-from ..domain import (
-    collectiblesItemBuffs as collectibles_domain,
-    resources as resources_domain,
-    skills as skills_domain,
-    wearablesItemBuffs as wearables_domain,
-    factions as factions_domain,
-    game as game_domain
-)
-from . import bud_service
+from . import item_registry, resource_analysis_service
 
 log = logging.getLogger(__name__)
 
@@ -35,38 +27,17 @@ RESOURCE_NODE_MAP = {
 # FUNÇÃO DE AGREGAÇÃO DE BÔNUS (LÓGICA CENTRAL)
 # ==============================================================================
 
-def _get_player_items(farm_data: dict) -> set:
-    """
-    Extrai e unifica todos os itens que um jogador possui em um único conjunto.
-    """
-    player_items = set(farm_data.get("collectibles", {}).keys())
-    player_items.update(farm_data.get("home", {}).get("collectibles", {}).keys())
-    
-    bumpkin = farm_data.get("bumpkin", {})
-    if bumpkin:
-        player_items.update(bumpkin.get("equipped", {}).values())
-        player_items.update(bumpkin.get("skills", {}).keys())
-
-    player_items.update(farm_data.get("inventory", {}).keys())
-    return player_items
-
-def _get_oil_buffs(farm_data: dict) -> list:
+def _get_oil_buffs(profile: resource_analysis_service.PlayerBoostProfile) -> list:
     """
     Coleta e filtra todos os bônus relevantes para a perfuração de Oil
     e recuperação de reservas de Oil.
     """
-    player_items = _get_player_items(farm_data)
+    farm_data = profile.farm_data
+    # Os vestíveis dos Farm Hands não contam para os minerais.
+    player_items = profile.player_items_without_farm_hands
     active_buffs = []
 
-    all_item_data = {
-        **skills_domain.LEGACY_BADGES,
-        **skills_domain.BUMPKIN_REVAMP_SKILLS,
-        **wearables_domain.WEARABLES_ITEM_BUFFS,
-        **collectibles_domain.COLLECTIBLES_ITEM_BUFFS,
-        **resources_domain.RESOURCES_DATA,
-        **factions_domain.FACTION_ITEMS_DATA,
-        **game_domain.GAME_TERMS
-    }
+    all_item_data = item_registry.ITEM_DATA_WITH_FACTIONS
 
     processed_non_cumulative = set()
     for group_name, ordered_items in NON_CUMULATIVE_GROUPS.items():
@@ -79,7 +50,7 @@ def _get_oil_buffs(farm_data: dict) -> list:
                     active_buffs.append({"source_item": item_name, **boost})
                 break
 
-    for item_name in player_items:
+    for item_name in profile.owned_items(all_item_data, include_farm_hands=False):
         if item_name in processed_non_cumulative:
             continue
 
@@ -110,7 +81,7 @@ def _get_oil_buffs(farm_data: dict) -> list:
         if is_yield or is_time:
             oil_related_buffs.append(buff)
 
-    bud_analysis = bud_service.analyze_bud_buffs(farm_data)
+    bud_analysis = profile.bud_analysis
     if bud_analysis and "yield" in bud_analysis:
         if oil_resource in bud_analysis["yield"]:
             bud_yield_buff = bud_analysis["yield"][oil_resource]
@@ -203,13 +174,18 @@ def _calculate_recovery_time(base_time: float, all_buffs: list, resource_name: s
 # FUNÇÃO PRINCIPAL (ORQUESTRADOR)
 # ==============================================================================
 
-def analyze_oil_resources(farm_data: dict) -> dict:
+def analyze_oil_resources(farm_data: dict, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Analisa todas as reservas de Oil, calcula bônus e retorna um relatório completo.
+
+    Args:
+        farm_data (dict): O estado completo da fazenda do jogador.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
     """
+    profile = profile or resource_analysis_service.PlayerBoostProfile(farm_data)
     start_time = time.time()
 
-    all_player_buffs = _get_oil_buffs(farm_data)
+    all_player_buffs = _get_oil_buffs(profile)
     active_item_names = sorted(list(set(b['source_item'] for b in all_player_buffs)))
 
     analyzed_nodes_by_type = defaultdict(dict)
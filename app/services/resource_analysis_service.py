@@ -12,6 +12,7 @@ Principais responsabilidades:
 - Lidar com a lógica de acertos críticos e bônus temporais.
 """
 
+import functools
 import logging
 import time
 from decimal import Decimal
@@ -22,10 +23,8 @@ from ..domain import collectiblesItemBuffs as collectibles_domain
 from ..domain import crops as crops_domain
 from ..domain import flowers as flower_domain
 from ..domain import fruits as fruit_domain
-from ..domain import resources as resources_domain
 from ..domain import skills as skills_domain
-from ..domain import wearablesItemBuffs as wearables_domain
-from . import bud_service
+from . import bud_service, item_registry
 
 log = logging.getLogger(__name__)
 
@@ -57,7 +56,7 @@ RESOURCE_CATEGORIES = {
 }
 
 
-def _get_player_items(farm_data: dict) -> set:
+def _get_player_items(farm_data: dict, include_farm_hands: bool = True) -> set:
     """
     Extrai e unifica todos os itens que um jogador possui (coletáveis,
     vestíveis, habilidades, etc.) em um único conjunto para fácil consulta.
@@ -65,6 +64,7 @@ def _get_player_items(farm_data: dict) -> set:
 
     Args:
         farm_data (dict): Os dados completos da fazenda do jogador.
+        include_farm_hands (bool): Se inclui os vestíveis equipados nos Farm Hands.
 
     Returns:
         set: Um conjunto contendo os nomes de todos os itens que o jogador possui.
@@ -82,7 +82,7 @@ def _get_player_items(farm_data: dict) -> set:
 
     # Adiciona itens equipados nos Farm Hands (ajudantes da fazenda).
     farm_hands_data = farm_data.get("farmHands", {}).get("bumpkins", {})
-    if farm_hands_data:
+    if include_farm_hands and farm_hands_data:
         for hand in farm_hands_data.values():
             player_items.update(hand.get("equipped", {}).values())
 
@@ -91,176 +91,502 @@ def _get_player_items(farm_data: dict) -> set:
 
     return player_items
 
-def _get_all_item_data() -> dict:
+# ==============================================================================
+# CONDIÇÕES DE BÔNUS COMPILADAS
+# ==============================================================================
+
+def _freeze(value):
+    """Converte as condições (dicts e listas) numa estrutura imutável e hashable."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+# Tabelas de consulta com frozensets, construídas uma vez a partir de RESOURCE_CATEGORIES
+# e dos tiers de culturas, para que as condições não percorram listas a cada avaliação.
+_CATEGORY_MEMBERS = {name: frozenset(members) for name, members in RESOURCE_CATEGORIES.items()}
+
+# Em caso de cultura repetida em vários tiers, prevalece o primeiro ('basic'), como antes.
+_CROP_TIER_BY_NAME = {
+    crop_name: tier
+    for tier in ("advanced", "medium", "basic")
+    for crop_name in crops_domain.CROP_TIERS[tier]
+}
+
+
+def get_crop_tier(crop_name: str) -> str | None:
     """
-    Unifica todos os dicionários de domínio que contêm definições de itens
-    e seus bônus/efeitos em um único dicionário para fácil acesso.
+    Retorna o tier ('basic', 'medium', 'advanced') de uma cultura específica.
+    Consulta a tabela de tiers pré-calculada a partir do domínio de culturas (`crops_domain`).
+
+    Args:
+        crop_name (str): O nome da cultura.
 
     Returns:
-        dict: Um dicionário consolidado de todos os dados de itens do jogo.
+        str | None: O tier da cultura (ex: 'basic', 'medium', 'advanced') ou None se não encontrado.
     """
-    return {
-        **skills_domain.LEGACY_BADGES,          # Habilidades legadas
-        **skills_domain.BUMPKIN_REVAMP_SKILLS,  # Habilidades do sistema de revamp
-        **wearables_domain.WEARABLES_ITEM_BUFFS,# Bônus de itens vestíveis
-        **collectibles_domain.COLLECTIBLES_ITEM_BUFFS, # Bônus de itens coletáveis
-        **resources_domain.RESOURCES_DATA       # Dados de recursos (pode incluir bônus)
-    }
+    return _CROP_TIER_BY_NAME.get(crop_name)
 
-def filter_boosts_from_domains(resource_conditions: dict) -> dict:
+
+def _as_list(value) -> list:
+    # Aceita tuplos porque as condições chegam "congeladas" (ver `_freeze`) ao compilador.
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _compile_condition(condition_key: str, required_value):
+    """
+    Converte uma única condição num teste `(resource_name, context) -> bool`.
+    Retorna None para condições que não restringem nada aqui (ex: 'faction').
+    """
+    # Condição de Recurso/Item/Cultura (ex: "resource": "Wood" ou "resource": ["Crop", "Fruit"]).
+    # É atendida se o recurso estiver na lista ou pertencer a uma das categorias listadas.
+    if condition_key in ("resource", "item", "crop"):
+        required_list = _as_list(required_value)
+        allowed = set(required_list)
+        for required_name in required_list:
+            allowed |= _CATEGORY_MEMBERS.get(required_name, frozenset())
+        allowed = frozenset(allowed)
+        return lambda resource_name, context: resource_name in allowed
+
+    # Condição de Categoria (ex: "category": "Fruit" ou "target_category": "BasicCrop")
+    if condition_key in ("category", "target_category"):
+        allowed = set()
+        for category_name in _as_list(required_value):
+            if category_name in _CATEGORY_MEMBERS:
+                allowed.add(category_name)
+                allowed |= _CATEGORY_MEMBERS[category_name]
+            else:
+                log.warning(f"Categoria de bônus desconhecida encontrada: '{category_name}'. A condição será considerada como não atendida.")
+        allowed = frozenset(allowed)
+        return lambda resource_name, context: resource_name in allowed
+
+    # Condição de Minas Restantes (específico para mineração, ex: "minesLeft": 1)
+    if condition_key == "minesLeft":
+        return lambda resource_name, context: context.get("minesLeft") == required_value
+
+    # Condição de Tier da Cultura (ex: "crop_tier": "basic"). Culturas sem tier não a atendem.
+    if condition_key == "crop_tier":
+        required_tiers = frozenset(_as_list(required_value))
+        allowed = frozenset(name for name, tier in _CROP_TIER_BY_NAME.items() if tier in required_tiers)
+        return lambda resource_name, context: resource_name in allowed
+
+    # Condição de Construção (ex: "building": "Greenhouse")
+    if condition_key == "building":
+        return lambda resource_name, context: context.get("building") == required_value
+
+    # Condição de Local de Plantio (ex: "planting_spot": "Fruit Patch").
+    # O contexto pode ter 'building' ou 'planting_spot'.
+    if condition_key == "planting_spot":
+        return lambda resource_name, context: (context.get("building") or context.get("planting_spot")) == required_value
+
+    # Condição de Exclusão (ex: "exclude_target": ["Apple", "Banana"])
+    if condition_key == "exclude_target":
+        excluded = frozenset(_as_list(required_value))
+        return lambda resource_name, context: resource_name not in excluded
+
+    # A condição de 'faction' é validada em `get_active_player_boosts`, com o contexto
+    # global do jogador. Essa e outras chaves desconhecidas não restringem nada aqui.
+    return None
+
+
+class CompiledConditions:
+    """
+    Predicado pré-compilado para o dicionário `conditions` de um bônus.
+    Avaliar custa um teste por chave de condição, independentemente do tamanho das categorias.
+    """
+    __slots__ = ("checks",)
+
+    def __init__(self, frozen_conditions: tuple):
+        checks = (_compile_condition(key, value) for key, value in frozen_conditions)
+        self.checks = tuple(check for check in checks if check is not None)
+
+    def __call__(self, resource_name: str, node_context: dict = None) -> bool:
+        context = node_context or {}
+        for check in self.checks:
+            if not check(resource_name, context):
+                return False
+        return True
+
+
+_ALWAYS_MET = CompiledConditions(())
+
+
+@functools.lru_cache(maxsize=2048)
+def _compile_frozen_conditions(frozen_conditions: tuple) -> CompiledConditions:
+    return CompiledConditions(frozen_conditions)
+
+
+# Atalho por identidade para os dicionários de condições dos domínios, que vivem
+# durante todo o processo. Guarda o próprio dicionário para que o `id` não seja reutilizado.
+_COMPILED_BY_ID = {}
+
+
+def compile_conditions(conditions: dict) -> CompiledConditions:
+    """Devolve o predicado compilado (e memorizado) para um dicionário de condições."""
+    if not conditions:
+        return _ALWAYS_MET
+    cached = _COMPILED_BY_ID.get(id(conditions))
+    if cached is not None and cached[0] is conditions:
+        return cached[1]
+    compiled = _compile_frozen_conditions(_freeze(conditions))
+    if len(_COMPILED_BY_ID) < 4096:
+        _COMPILED_BY_ID[id(conditions)] = (conditions, compiled)
+    return compiled
+
+
+def _conditions_are_met(conditions: dict, resource_name: str, node_context: dict = None) -> bool:
     """
-    Varre todos os domínios de itens e cria um dicionário otimizado (catálogo)
-    contendo apenas os itens e seus bônus que são relevantes para um conjunto
-    específico de condições de recurso. Isso evita processar bônus desnecessários.
+    Verifica se todas as condições de um bônus são atendidas para um determinado
+    recurso e contexto de nó, através do predicado compilado em `compile_conditions`.
 
     Args:
-        resource_conditions (dict): Um dicionário de configuração que define
-                                    quais recursos e tipos de bônus procurar.
-                                    Exemplos de chaves:
-                                    - 'yield_resource_names': lista de nomes de recursos de rendimento.
-                                    - 'recovery_resource_names': lista de nomes de recursos de recuperação.
-                                    - 'skill_tree_name': nome da árvore de habilidades (ex: 'Fruit Patch').
-                                    - 'boost_category_names': lista de categorias de bônus (ex: 'Fruit').
+        conditions (dict): Um dicionário de condições a serem verificadas (ex: {"resource": "Wood", "faction": "Goblins"}).
+        resource_name (str): O nome do recurso atual sendo avaliado (ex: "Apple", "Stone").
+        node_context (dict, opcional): Um dicionário com informações adicionais sobre o nó
+                                       (ex: {"minesLeft": 1} para minerais).
 
     Returns:
-        dict: Um catálogo de bônus otimizado, onde as chaves são nomes de itens
-              e os valores são seus bônus relevantes e tipo de origem.
+        bool: True se todas as condições forem atendidas, False caso contrário.
     """
-    boost_catalogue = {}
-    log.info(f"Iniciando a catalogação de bônus para as condições: {resource_conditions}")
-    all_item_data = _get_all_item_data()
+    return compile_conditions(conditions)(resource_name, node_context)
 
-    # Extrai as condições de filtragem para uso mais fácil.
-    yield_names = resource_conditions.get('yield_resource_names', [])
-    recovery_names = resource_conditions.get('recovery_resource_names', [])
-    skill_tree = resource_conditions.get('skill_tree_name')
-    boost_categories = resource_conditions.get('boost_category_names', [])
-    boost_type_names = resource_conditions.get('boost_type_names', []) # NEW
+# ==============================================================================
+# BÔNUS IMUTÁVEIS
+# ==============================================================================
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError("Boost é imutável; use `overlay` para criar uma variante.")
 
-    for item_name, item_details in all_item_data.items():
+
+class Boost(dict):
+    """
+    Bônus imutável. Continua a ser um `dict` (serializável em JSON, legível nos templates
+    e em `{**boost}`), mas não pode ser alterado, e traz já calculados o valor em
+    `Decimal` e o predicado das condições.
+
+    Variantes (item de origem, valor com modificadores, acerto crítico, ...) são
+    criadas com `overlay`/`sourced`, que reaproveitam o valor e o predicado já
+    compilados e memorizam o resultado no próprio bônus. Como nada é alterado, os
+    bônus dos catálogos e as suas variantes são partilhados entre pedidos e árvores
+    sem cópias; `copy.copy` e `copy.deepcopy` devolvem o próprio objeto.
+    """
+    __slots__ = ("decimal_value", "predicate", "_variants")
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._compile(None)
+
+    def _compile(self, source) -> None:
+        """Calcula o valor e o predicado, reaproveitando os de `source` quando são os mesmos."""
+        value = dict.get(self, "value")
+        conditions = dict.get(self, "conditions")
+        if source is not None and dict.get(source, "value") is value:
+            decimal_value = source.decimal_value
+        elif value is None:
+            decimal_value = None
+        else:
+            try:
+                decimal_value = Decimal(str(value))
+            except ArithmeticError:
+                decimal_value = None
+        if source is not None and dict.get(source, "conditions") is conditions:
+            predicate = source.predicate
+        else:
+            predicate = compile_conditions(conditions)
+        _set_decimal_value(self, decimal_value)
+        _set_predicate(self, predicate)
+        _set_variants(self, None)
+
+    @classmethod
+    def merge(cls, first: dict, second: dict) -> "Boost":
+        """Novo bônus com as chaves de `first` e `second`, como `{**first, **second}`."""
+        boost = dict.__new__(cls)
+        dict.update(boost, first)
+        dict.update(boost, second)
+        if isinstance(second, Boost):
+            boost._compile(second)
+        elif isinstance(first, Boost):
+            boost._compile(first)
+        else:
+            boost._compile(None)
+        return boost
+
+    def _variant(self, key: tuple, build) -> "Boost":
+        variants = self._variants
+        if variants is None:
+            variants = {}
+            _set_variants(self, variants)
+        variant = variants.get(key)
+        if variant is None:
+            variant = variants[key] = build()
+        return variant
+
+    def overlay(self, **changes) -> "Boost":
+        """Variante deste bônus com `changes` sobrepostas (memorizada se os valores forem hashable)."""
+        # O tipo entra na chave para que `value=1` e `value=1.0` não partilhem a variante.
+        key = tuple((name, type(value), value) for name, value in changes.items())
+        try:
+            hash(key)
+        except TypeError:
+            return Boost.merge(self, changes)
+        return self._variant(key, lambda: Boost.merge(self, changes))
+
+    def sourced(self, source_item: str, source_type: str) -> "Boost":
+        """`{"source_item": ..., "source_type": ..., **self}`, memorizado."""
+        return self._variant(
+            ("@source", source_item, source_type),
+            lambda: Boost.merge({"source_item": source_item, "source_type": source_type}, self),
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __setattr__(self, name, value):
+        _immutable(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Boost, (dict(self),))
+
+
+_set_decimal_value = Boost.decimal_value.__set__
+_set_predicate = Boost.predicate.__set__
+_set_variants = Boost._variants.__set__
+
+
+def boost_value(boost: dict) -> Decimal:
+    """Valor de um bônus em `Decimal` (pré-calculado nos `Boost`)."""
+    if isinstance(boost, Boost) and boost.decimal_value is not None:
+        return boost.decimal_value
+    return Decimal(str(boost["value"]))
+
+
+def boost_applies(boost: dict, resource_name: str, node_context: dict = None) -> bool:
+    """Se as condições do bônus são atendidas (predicado pré-compilado nos `Boost`)."""
+    if isinstance(boost, Boost):
+        return boost.predicate(resource_name, node_context)
+    return _conditions_are_met(boost.get("conditions", {}), resource_name, node_context)
+
+
+def overlay_boost(boost: dict, **changes) -> dict:
+    """Variante de um bônus com `changes` sobrepostas, sem alterar o original."""
+    if isinstance(boost, Boost):
+        return boost.overlay(**changes)
+    return {**boost, **changes}
+
+# ==============================================================================
+# ÍNDICE INVERTIDO DE BÔNUS (CONSTRUÍDO UMA VEZ NA IMPORTAÇÃO)
+# ==============================================================================
+
+# Tipos de bônus que entram nos catálogos e o tipo padronizado correspondente
+# (None mantém o tipo original).
+_DIRECT_YIELD_TYPES = {"YIELD", "CROP_YIELD", "RESOURCE_YIELD", "CRITICAL_YIELD_BONUS"}
+_RECOVERY_TYPES = {"RECOVERY_TIME", "TREE_RECOVERY_TIME", "CROP_GROWTH_TIME", "GROWTH_TIME", "SUPER_TOTEM_TIME_BOOST"}
+_CATALOGUED_BOOST_TYPES = {
+    **{boost_type: "YIELD" for boost_type in _DIRECT_YIELD_TYPES},
+    **{boost_type: "RECOVERY_TIME" for boost_type in _RECOVERY_TYPES},
+    "BONUS_YIELD_CHANCE": None,
+    "CRITICAL_CHANCE": None,
+    "SALE_PRICE": "SALE_PRICE",
+    "OIL_COST": None,
+    "CROP_MACHINE_GROWTH_TIME": None,
+}
+
+
+def _build_catalogue_entry(item_name: str, boost_list: list) -> dict | None:
+    """
+    Filtra e padroniza os bônus de um item para os catálogos. Não depende das
+    condições pedidas, por isso é calculado uma única vez por item.
+    """
+    item_info = item_registry.ITEM_INFO[item_name]
+    relevant_boosts = []
+
+    for boost in boost_list:
+        boost_type = boost.get("type")
+        # Se o item é um modificador de AOE, seus bônus de YIELD são considerados
+        # locais para a AOE e não devem ser catalogados como globais.
+        if item_info.is_aoe_modifier and boost_type == "YIELD":
+            continue
+        if boost_type not in _CATALOGUED_BOOST_TYPES:
+            continue
+
+        # O `Boost` compila as condições e o valor já na construção do catálogo.
+        standardized_type = _CATALOGUED_BOOST_TYPES[boost_type]
+        if standardized_type:
+            relevant_boosts.append(Boost(boost, type=standardized_type))
+        else:
+            relevant_boosts.append(Boost(boost))
+
+    if not relevant_boosts:
+        return None
+
+    return {
+        "boosts": relevant_boosts,
+        "source_type": item_info.source_type,
+        "has_aoe": item_info.has_aoe # Indica se o item tem Área de Efeito (AOE)
+    }
+
+
+def _build_boost_index() -> dict:
+    """
+    Percorre todos os domínios uma única vez e devolve:
+    - 'entries': o item de catálogo (bônus padronizados) de cada item relevante;
+    - 'by_category', 'by_skill_tree', 'by_resource', 'by_boost_type': índices
+      invertidos de valor -> bitset dos itens (ver `item_registry.item_bits`);
+    - 'revamp_by_tree' e 'revamp_bits': habilidades do revamp por árvore e todas
+      elas (para o filtro de árvore).
+    Os IDs do registo base seguem a ordem dos domínios, por isso percorrer um
+    bitset (`item_registry.item_names`) mantém a ordem original.
+    """
+    index = {
+        "entries": {}, "revamp_by_tree": {}, "revamp_bits": 0,
+        "by_category": {}, "by_skill_tree": {}, "by_resource": {}, "by_boost_type": {},
+    }
+
+    def add(bucket: dict, key, item_bit: int) -> None:
+        bucket[key] = bucket.get(key, 0) | item_bit
+
+    for item_name, item_details in item_registry.ITEM_DATA.items():
         # Bônus podem estar em 'boosts' ou 'effects' dependendo do domínio.
-        boost_list = item_details.get("boosts") or item_details.get("effects")
+        boost_list = item_details.get("boosts") or item_details.get("effects") if item_details else None
 
         # Ignora itens sem detalhes, sem bônus ou desabilitados.
         if not item_details or not boost_list or not item_details.get("enabled", True):
             continue
 
-        # --- FILTRO DE ÁRVORE DE HABILIDADES ---
-        # Se um `skill_tree` foi especificado (ex: 'Trees' para o wood_service),
-        # garante que apenas habilidades dessa árvore (ou habilidades sem árvore definida, como 'Native')
-        # sejam consideradas. Isso evita que bônus de outras árvores (ex: 'Fruit Patch')
-        # que mencionam 'Wood' sejam incluídos indevidamente no catálogo de outro serviço.
-        if skill_tree and item_name in skills_domain.BUMPKIN_REVAMP_SKILLS and item_details.get("tree") and item_details.get("tree") != skill_tree:
+        entry = _build_catalogue_entry(item_name, boost_list)
+        if entry is None:
             continue
+        index["entries"][item_name] = entry
+        item_bit = 1 << item_registry.item_id(item_name)
 
-        # --- Lógica de Relevância do Item ---
-        # Um item é considerado relevante se corresponder a PELO MENOS UMA das lógicas de filtragem.
-        is_item_relevant = False
-
-        # Lógica 1: Checa se a categoria do item (boost_category) está nas categorias desejadas.
-        if boost_categories:
-            item_category = item_details.get("boost_category")
-            if item_category:
-                # Converte para lista para lidar com categorias únicas ou múltiplas.
-                item_category_list = item_category if isinstance(item_category, list) else [item_category]
-                # Verifica se alguma das categorias do item está na lista de categorias desejadas.
-                if any(cat in boost_categories for cat in item_category_list):
-                    is_item_relevant = True
-
-        # Lógica 2: Checa se a árvore de habilidades do item corresponde à `skill_tree` especificada.
-        # (Aplicável principalmente para habilidades do sistema de revamp).
-        if not is_item_relevant and skill_tree and item_details.get("tree") == skill_tree:
-            is_item_relevant = True
-
-        # Lógica 3: Checa se os recursos mencionados nas condições dos bônus do item
-        # são relevantes para os `yield_names` ou `recovery_names` especificados.
-        # Isso captura bônus que afetam recursos específicos, independentemente da categoria geral do item.
-        if not is_item_relevant:
-            for boost in boost_list:
-                conditions = boost.get("conditions", {})
-                # Tenta obter o nome do recurso/item/cultura da condição.
-                resource_name_or_list = conditions.get("resource") or conditions.get("item") or conditions.get("crop")
-                if resource_name_or_list:
-                    # Converte para lista para lidar com nomes únicos ou múltiplos.
-                    resource_names_to_check = resource_name_or_list if isinstance(resource_name_or_list, list) else [resource_name_or_list]
-                    # Verifica se algum dos recursos nas condições do bônus está nas listas de rendimento ou recuperação desejadas.
-                    if any(name in yield_names for name in resource_names_to_check) or any(name in recovery_names for name in resource_names_to_check):
-                        is_item_relevant = True
-                        break
+        tree = item_details.get("tree")
+        if tree:
+            add(index["by_skill_tree"], tree, item_bit)
+            if item_name in skills_domain.BUMPKIN_REVAMP_SKILLS:
+                add(index["revamp_by_tree"], tree, item_bit)
+                index["revamp_bits"] |= item_bit
 
-        # NEW LOGIC 4: Check if any boost type matches boost_type_names
-        if not is_item_relevant and boost_type_names:
-            for boost in boost_list:
-                if boost.get("type") in boost_type_names:
-                    is_item_relevant = True
-                    break
+        item_category = item_details.get("boost_category")
+        if item_category:
+            for category in _as_list(item_category):
+                add(index["by_category"], category, item_bit)
 
-        # Se o item não for relevante para nenhuma das lógicas de filtragem, pula para o próximo.
-        if not is_item_relevant:
-            continue
+        for boost in boost_list:
+            conditions = boost.get("conditions", {})
+            # Tenta obter o nome do recurso/item/cultura da condição.
+            resource_name_or_list = conditions.get("resource") or conditions.get("item") or conditions.get("crop")
+            if resource_name_or_list:
+                for resource_name in _as_list(resource_name_or_list):
+                    add(index["by_resource"], resource_name, item_bit)
+            add(index["by_boost_type"], boost.get("type"), item_bit)
 
-        # --- Se o item for relevante, processa os seus bônus --- 
-        # Filtra e padroniza os bônus relevantes para este serviço.
-        relevant_boosts = []
-        
-        # VERIFICAÇÃO ADICIONAL: Se o item é um modificador de AOE, seus bônus de YIELD
-        # são considerados locais para a AOE e não devem ser catalogados como globais.
-        is_aoe_modifier = False
-        if item_details.get("effects"):
-            if any(e.get("name") == "MODIFY_ITEM_AOE" for e in item_details.get("effects")):
-                is_aoe_modifier = True
+    return index
 
-        for boost in boost_list:
-            # Se for um modificador de AOE, pula a catalogação de seus bônus de YIELD.
-            if is_aoe_modifier and boost.get("type") == "YIELD":
-                continue
 
-            # Identifica os tipos de bônus que este serviço está interessado em analisar.
-            is_direct_yield = boost.get("type") in ["YIELD", "CROP_YIELD", "RESOURCE_YIELD", "CRITICAL_YIELD_BONUS"]
-            is_chance_or_other_yield = boost.get("type") in ["BONUS_YIELD_CHANCE", "CRITICAL_CHANCE"]
-            is_recovery = boost.get("type") in ["RECOVERY_TIME", "TREE_RECOVERY_TIME", "CROP_GROWTH_TIME", "GROWTH_TIME", "SUPER_TOTEM_TIME_BOOST"]
-            is_sale_price = boost.get("type") == "SALE_PRICE"
-
-            is_oil_cost = boost.get("type") == "OIL_COST"
-            is_crop_machine_time = boost.get("type") == "CROP_MACHINE_GROWTH_TIME"
-
-            if is_direct_yield or is_chance_or_other_yield or is_recovery or is_sale_price or is_oil_cost or is_crop_machine_time:
-                standardized_boost = boost.copy()
-                # Padroniza tipos de rendimento direto para 'YIELD' para simplificar o processamento posterior.
-                if is_direct_yield:
-                    standardized_boost['type'] = 'YIELD'
-                # Padroniza tipos de recuperação para 'RECOVERY_TIME'.
-                elif is_recovery:
-                    standardized_boost['type'] = 'RECOVERY_TIME'
-                # Padroniza tipos de preço de venda para 'SALE_PRICE'.
-                elif is_sale_price:
-                    standardized_boost['type'] = 'SALE_PRICE'
-                
-                relevant_boosts.append(standardized_boost)
-
-        # Se houver bônus relevantes após a filtragem, adiciona o item ao catálogo.
-        if relevant_boosts: 
-            # Determina o tipo de origem do item de forma mais específica para categorização.
-            if item_name in skills_domain.LEGACY_BADGES:
-                source_type = "skill_legacy"
-            elif item_name in skills_domain.BUMPKIN_REVAMP_SKILLS:
-                source_type = "skill"
-            elif item_name in wearables_domain.WEARABLES_ITEM_BUFFS:
-                source_type = "wearable"
-            elif item_details.get("type") == "Fertiliser": # Verifica se é um fertilizante
-                source_type = "fertiliser"
-            else: # Assume que é um coletável por padrão se não for encontrado em outros domínios
-                source_type = "collectible"
-
-            boost_catalogue[item_name] = {
-                "boosts": relevant_boosts,
-                "source_type": source_type,
-                "has_aoe": "aoe" in item_details # Indica se o item tem Área de Efeito (AOE)
-            }
+_BOOST_INDEX = _build_boost_index()
+
+
+def _bucket_union(bucket: dict, keys) -> int:
+    bits = 0
+    for key in keys:
+        bits |= bucket.get(key, 0)
+    return bits
+
+
+@functools.lru_cache(maxsize=256)
+def _filter_boosts_cached(frozen_conditions: tuple) -> dict:
+    resource_conditions = dict(frozen_conditions)
+    log.info(f"Iniciando a catalogação de bônus para as condições: {resource_conditions}")
+
+    # Extrai as condições de filtragem para uso mais fácil.
+    yield_names = resource_conditions.get('yield_resource_names') or ()
+    recovery_names = resource_conditions.get('recovery_resource_names') or ()
+    skill_tree = resource_conditions.get('skill_tree_name')
+    boost_categories = resource_conditions.get('boost_category_names') or ()
+    boost_type_names = resource_conditions.get('boost_type_names') or ()
+
+    # Um item é relevante se corresponder a PELO MENOS UMA das lógicas de filtragem:
+    # 1. categoria do item; 2. árvore de habilidades; 3. recurso citado nas condições
+    # dos bônus; 4. tipo de bônus.
+    candidates = _bucket_union(_BOOST_INDEX["by_category"], boost_categories)
+    if skill_tree:
+        candidates |= _BOOST_INDEX["by_skill_tree"].get(skill_tree, 0)
+    candidates |= _bucket_union(_BOOST_INDEX["by_resource"], yield_names)
+    candidates |= _bucket_union(_BOOST_INDEX["by_resource"], recovery_names)
+    candidates |= _bucket_union(_BOOST_INDEX["by_boost_type"], boost_type_names)
+
+    # --- FILTRO DE ÁRVORE DE HABILIDADES ---
+    # Habilidades do revamp de outra árvore (ex: 'Fruit Patch' que menciona 'Wood')
+    # não entram no catálogo de outro serviço.
+    if skill_tree:
+        other_trees = _BOOST_INDEX["revamp_bits"] & ~_BOOST_INDEX["revamp_by_tree"].get(skill_tree, 0)
+        candidates &= ~other_trees
+
+    entries = _BOOST_INDEX["entries"]
+    return {name: entries[name] for name in item_registry.item_names(candidates)}
+
+
+def filter_boosts_from_domains(resource_conditions: dict) -> dict:
+    """
+    Cria um dicionário otimizado (catálogo) contendo apenas os itens e seus bônus
+    que são relevantes para um conjunto específico de condições de recurso.
+
+    Em vez de varrer todos os domínios, une os conjuntos de itens do índice
+    invertido (`_BOOST_INDEX`) e memoriza o resultado por condições.
+    O catálogo devolvido é partilhado entre chamadas e não deve ser alterado.
+
+    Args:
+        resource_conditions (dict): Um dicionário de configuração que define
+                                    quais recursos e tipos de bônus procurar.
+                                    Exemplos de chaves:
+                                    - 'yield_resource_names': lista de nomes de recursos de rendimento.
+                                    - 'recovery_resource_names': lista de nomes de recursos de recuperação.
+                                    - 'skill_tree_name': nome da árvore de habilidades (ex: 'Fruit Patch').
+                                    - 'boost_category_names': lista de categorias de bônus (ex: 'Fruit').
+                                    - 'boost_type_names': lista de tipos de bônus (ex: 'OIL_COST').
 
-    return boost_catalogue
+    Returns:
+        dict: Um catálogo de bônus otimizado, onde as chaves são nomes de itens
+              e os valores são seus bônus relevantes e tipo de origem.
+    """
+    return _filter_boosts_cached(_freeze(resource_conditions))
 
-def _process_boost_modifiers(active_boosts: list, player_items: set, farm_data: dict) -> list:
+def _collect_potential_modifiers(player_item_bits: int) -> list:
+    """
+    Coleta os efeitos modificadores (ITEM_MODIFICATION, etc.) dos itens que o jogador
+    possui (`player_item_bits`, ver `item_registry.item_bits`).
+    """
+    potential_modifiers = []
+    for item_name in item_registry.item_names(player_item_bits & item_registry.MODIFIER_ITEM_BITS):
+        item_info = item_registry.ITEM_INFO[item_name]
+        for effect in item_info.modifier_effects:
+            potential_modifiers.append({
+                "modifier_source_item": item_name,
+                "modifier_source_type": item_info.modifier_source_type,
+                **effect
+            })
+    return potential_modifiers
+
+def _group_modifiers_by_target(potential_modifiers: list) -> dict:
+    """Agrupa os modificadores pelo item alvo ('target_item' ou o 'resource' das condições), pela ordem original."""
+    by_target = {}
+    for modifier in potential_modifiers:
+        target_name = modifier.get("target_item") or modifier.get("conditions", {}).get("resource")
+        if target_name and isinstance(target_name, str):
+            by_target.setdefault(target_name, []).append(modifier)
+    return by_target
+
+def _process_boost_modifiers(active_boosts: list, player_items: set, farm_data: dict, potential_modifiers: list = None) -> list:
     """
     Processa os bônus do tipo ITEM_MODIFICATION e COLLECTIBLE_EFFECT_MULTIPLIER.
     Esta função itera através de todos os modificadores potenciais que o jogador possui
@@ -271,39 +597,23 @@ def _process_boost_modifiers(active_boosts: list, player_items: set, farm_data:
         active_boosts (list): A lista de bônus que já estão ativos para o jogador.
         player_items (set): Um conjunto com os nomes de todos os itens que o jogador possui.
         farm_data (dict): Os dados completos da fazenda, para validação de contexto (ex: estação).
+        potential_modifiers (list, opcional): Modificadores já coletados (ver `PlayerBoostProfile`).
+                                              Se omitido, são coletados a partir de `player_items`.
 
     Returns:
-        list: A lista de bônus, com os modificadores aplicados.
+        list: Uma nova lista de bônus, com os modificadores aplicados. Os bônus
+              recebidos não são alterados.
     """
-    all_item_data = _get_all_item_data()
-    potential_modifiers = []
     current_season = farm_data.get("season", {}).get("season")
 
     # 1. Coleta todos os efeitos modificadores dos itens que o jogador possui.
-    for item_name in player_items:
-        item_data = all_item_data.get(item_name)
-        if not item_data:
-            continue
-        
-        possible_effects = item_data.get("effects", []) + item_data.get("boosts", [])
-        for effect in possible_effects:
-            effect_type = effect.get("type")
-            if effect_type in ["ITEM_MODIFICATION", "COLLECTIBLE_EFFECT_MULTIPLIER"]:
-                source_type = "collectible"
-                if item_name in skills_domain.BUMPKIN_REVAMP_SKILLS:
-                    source_type = "skill"
-                elif item_name in wearables_domain.WEARABLES_ITEM_BUFFS:
-                    source_type = "wearable"
-                
-                potential_modifiers.append({
-                    "modifier_source_item": item_name,
-                    "modifier_source_type": source_type,
-                    **effect
-                })
+    if potential_modifiers is None:
+        potential_modifiers = _collect_potential_modifiers(item_registry.item_bits(player_items))
 
     if not potential_modifiers:
         return active_boosts
 
+    modifiers_by_target = _group_modifiers_by_target(potential_modifiers)
     final_boosts = list(active_boosts)
 
     # 2. Itera sobre os bônus ativos e aplica os modificadores relevantes.
@@ -312,17 +622,12 @@ def _process_boost_modifiers(active_boosts: list, player_items: set, farm_data:
         if not target_item_name:
             continue
 
-        cumulative_value = Decimal(str(target_boost.get("value", 0)))
-
-        for modifier in potential_modifiers:
-            modifier_target_name = modifier.get("target_item")
-            if not modifier_target_name:
-                modifier_target_name = modifier.get("conditions", {}).get("resource")
-
-            # Pula se o modificador não for para o item alvo
-            if target_item_name != modifier_target_name:
-                continue
+        original_value = target_boost.get("value", 0)
+        cumulative_value = Decimal(str(original_value))
+        applied_modifiers = []
 
+        # Apenas os modificadores cujo alvo é este item.
+        for modifier in modifiers_by_target.get(target_item_name, ()):
             # VERIFICA AS CONDIÇÕES DO PRÓPRIO MODIFICADOR (EX: ESTAÇÃO)
             mod_conditions = modifier.get("conditions", {})
             required_season = mod_conditions.get("season")
@@ -345,26 +650,64 @@ def _process_boost_modifiers(active_boosts: list, player_items: set, farm_data:
                 cumulative_value = (Decimal('1') + cumulative_value) * (Decimal('1') + mod_value) - Decimal('1')
             
             # Adiciona os detalhes do modificador para a interface do usuário (UI).
-            if "modifiers" not in final_boosts[i]:
-                final_boosts[i]["modifiers"] = []
-            
             display_value = f"x{mod_value}" if mod_operation == "multiply" else f"+{mod_value}"
-            final_boosts[i]["modifiers"].append({
+            applied_modifiers.append({
                 "source_item": modifier["modifier_source_item"],
                 "value": display_value,
                 "operation": "special",
                 "source_type": modifier["modifier_source_type"]
             })
         
-        # Atualiza o valor do bônus uma vez no final com o valor acumulado
-        final_boosts[i]["value"] = float(cumulative_value)
+        # O valor final é sempre um float. Os bônus não são alterados: quando o valor
+        # ou os modificadores mudam, a lista recebe uma variante (ver `overlay_boost`).
+        final_value = float(cumulative_value)
+        if applied_modifiers:
+            final_boosts[i] = overlay_boost(
+                target_boost,
+                value=final_value,
+                modifiers=[*target_boost.get("modifiers", ()), *applied_modifiers],
+            )
+        elif type(original_value) is not float or "value" not in target_boost:
+            final_boosts[i] = overlay_boost(target_boost, value=final_value)
 
     return final_boosts
 
 def get_active_player_boosts(player_items: set, boost_catalogue: dict, non_cumulative_groups: dict = None, farm_data: dict = None, external_boosts: list = None) -> list:
     """
     Pega um conjunto de itens que o jogador possui e os cruza com um catálogo de bônus
-    para retornar uma lista de todos os bônus ativos. Esta função lida com:
+    para retornar uma lista de todos os bônus ativos.
+
+    Dentro de um pedido, prefira `PlayerBoostProfile.get_active_boosts`, que reaproveita
+    os itens, os Buds e os modificadores entre serviços.
+
+    Args:
+        player_items (set): Um conjunto com os nomes de todos os itens que o jogador possui.
+        boost_catalogue (dict): O catálogo de bônus pré-filtrado e padronizado.
+        non_cumulative_groups (dict, opcional): Grupos de itens onde apenas o primeiro aplica o bônus.
+        farm_data (dict, opcional): Os dados completos da fazenda.
+        external_boosts (list, opcional): Bônus externos (ex: eventos de calendário).
+
+    Returns:
+        list: Uma lista de dicionários com os bônus ativos, já com os modificadores aplicados.
+    """
+    farm_data = farm_data or {}
+    active_boosts = _collect_active_boosts(
+        player_items, boost_catalogue, non_cumulative_groups, farm_data,
+        bud_service.analyze_bud_buffs(farm_data)
+    )
+
+    # Adiciona bônus externos (ex: eventos de calendário) à lista antes de processar os modificadores.
+    if external_boosts:
+        active_boosts.extend(external_boosts)
+
+    # ETAPA FINAL: Processa todos os modificadores sobre a lista de bônus ativos.
+    # Isso garante que bônus que alteram outros bônus sejam aplicados por último.
+    return _process_boost_modifiers(active_boosts, player_items, farm_data)
+
+def _collect_active_boosts(player_items: set, boost_catalogue: dict, non_cumulative_groups: dict, farm_data: dict, bud_analysis_result: dict, player_item_bits: int = None) -> list:
+    """
+    Cruza os itens do jogador com um catálogo de bônus, antes de aplicar bônus
+    externos e modificadores. Esta função lida com:
     - Bônus hierárquicos (onde apenas o melhor de um grupo se aplica).
     - Bônus cumulativos (onde todos os bônus se somam).
     - Aplicação de modificadores de bônus.
@@ -376,25 +719,27 @@ def get_active_player_boosts(player_items: set, boost_catalogue: dict, non_cumul
         non_cumulative_groups (dict, opcional): Dicionário de grupos de itens onde apenas
                                                 o item de maior prioridade (primeiro na lista)
                                                 aplica seu bônus. Ex: {"beavers": ["Foreman Beaver", ...]}.
-        farm_data (dict, opcional): Os dados completos da fazenda, necessários para
-                                    verificações de estado (ex: tempo de ativação, temporada, facção).
+        farm_data (dict): Os dados completos da fazenda, necessários para
+                          verificações de estado (ex: tempo de ativação, temporada, facção).
+        bud_analysis_result (dict): O resultado de `bud_service.analyze_bud_buffs`.
+        player_item_bits (int, opcional): `player_items` como bitset (ver `item_registry.item_bits`).
 
     Returns:
         list: Uma lista de dicionários, onde cada dicionário representa um bônus ativo
               com seus detalhes (tipo, operação, valor, item de origem, etc.).
     """
     active_boosts = []
-    farm_data = farm_data or {}
     non_cumulative_groups = non_cumulative_groups or {}
-    all_item_data = _get_all_item_data()
 
     # Extrai o contexto de temporada e facção uma única vez para otimização.
     current_season = farm_data.get("season", {}).get("season")
     player_faction = farm_data.get("faction", {}).get("name")
     
-    items_in_any_group = set()
+    if player_item_bits is None:
+        player_item_bits = item_registry.item_bits(player_items)
+    items_in_any_group = 0
     for group_items in non_cumulative_groups.values():
-        items_in_any_group.update(group_items)
+        items_in_any_group |= item_registry.item_bits(group_items)
 
     # 1. Processa os grupos hierárquicos (não cumulativos).
     for group_name, ordered_items in non_cumulative_groups.items():
@@ -440,68 +785,60 @@ def get_active_player_boosts(player_items: set, boost_catalogue: dict, non_cumul
                     if is_critical_item and boost.get("type") == "YIELD":
                         continue
                         
-                    active_boosts.append({"source_item": item_name, "source_type": source_type, **boost})
+                    active_boosts.append(boost.sourced(item_name, source_type))
                 break
 
-    # 2. Processa todos os outros bônus que não são hierárquicos (cumulativos).
-    for item_name in player_items:
-        if item_name in boost_catalogue and item_name not in items_in_any_group:
-            original_item_details = all_item_data.get(item_name, {})
-            original_effects = original_item_details.get("effects", [])
-            
-            is_modifier_only = False
-            if original_effects:
-                is_modifier_only = all(
-                    b.get("type") in ["MODIFY_ITEM_AOE", "ITEM_MODIFICATION", "COLLECTIBLE_EFFECT_MULTIPLIER"]
-                    for b in original_effects
-                )
-            
-            if is_modifier_only:
-                continue
-
-            source_type = boost_catalogue[item_name].get("source_type")
-            if boost_catalogue[item_name].get("has_aoe") or source_type == "fertiliser":
-                continue
+    # 2. Processa todos os outros bônus que não são hierárquicos (cumulativos):
+    # itens do jogador que estão no catálogo, fora dos grupos e que não apenas modificam outros bônus.
+    cumulative_items = (
+        player_item_bits
+        & item_registry.mapping_bits(boost_catalogue)
+        & ~items_in_any_group
+        & ~item_registry.MODIFIER_ONLY_ITEM_BITS
+    )
+    for item_name in item_registry.item_names(cumulative_items):
+        source_type = boost_catalogue[item_name].get("source_type")
+        if boost_catalogue[item_name].get("has_aoe") or source_type == "fertiliser":
+            continue
 
-            item_boosts = boost_catalogue[item_name]["boosts"]
-            is_critical_item = any(b.get("type") == "CRITICAL_CHANCE" for b in item_boosts)
+        item_boosts = boost_catalogue[item_name]["boosts"]
+        is_critical_item = any(b.get("type") == "CRITICAL_CHANCE" for b in item_boosts)
 
-            for boost in item_boosts:
-                conditions = boost.get("conditions", {})
+        for boost in item_boosts:
+            conditions = boost.get("conditions", {})
 
-                # VALIDAÇÃO DE CONTEXTO (TEMPORADA/FACÇÃO)
-                required_season = conditions.get("season")
-                if required_season and current_season and required_season.lower() != current_season.lower():
-                    continue
+            # VALIDAÇÃO DE CONTEXTO (TEMPORADA/FACÇÃO)
+            required_season = conditions.get("season")
+            if required_season and current_season and required_season.lower() != current_season.lower():
+                continue
 
-                required_faction = conditions.get("faction")
-                if required_faction and player_faction and required_faction.lower() != player_faction.lower():
-                    continue
+            required_faction = conditions.get("faction")
+            if required_faction and player_faction and required_faction.lower() != player_faction.lower():
+                continue
 
-                # Validação de bônus temporais.
-                duration_days = conditions.get("duration_days")
-                duration_hours = conditions.get("duration_hours")
-                if duration_days or duration_hours:
-                    all_placed_items = {**farm_data.get("collectibles", {}), **farm_data.get("home", {}).get("collectibles", {})}
-                    placements = all_placed_items.get(item_name, [])
-                    if placements:
-                        activation_ts = placements[0].get("createdAt", 0)
-                        now_ts = int(time.time() * 1000)
-                        duration_ms = (duration_days or 0) * 24 * 60 * 60 * 1000 + (duration_hours or 0) * 60 * 60 * 1000
-                        if now_ts > (activation_ts + duration_ms):
-                            continue
-                    else:
+            # Validação de bônus temporais.
+            duration_days = conditions.get("duration_days")
+            duration_hours = conditions.get("duration_hours")
+            if duration_days or duration_hours:
+                all_placed_items = {**farm_data.get("collectibles", {}), **farm_data.get("home", {}).get("collectibles", {})}
+                placements = all_placed_items.get(item_name, [])
+                if placements:
+                    activation_ts = placements[0].get("createdAt", 0)
+                    now_ts = int(time.time() * 1000)
+                    duration_ms = (duration_days or 0) * 24 * 60 * 60 * 1000 + (duration_hours or 0) * 60 * 60 * 1000
+                    if now_ts > (activation_ts + duration_ms):
                         continue
-                
-                if is_critical_item and boost.get("type") == "YIELD":
+                else:
                     continue
-                    
-                active_boosts.append({"source_item": item_name, "source_type": source_type, **boost})
+            
+            if is_critical_item and boost.get("type") == "YIELD":
+                continue
+                
+            active_boosts.append(boost.sourced(item_name, source_type))
 
     # 3. Processa e adiciona os bônus de Buds, se forem relevantes para o catálogo.
     # Esta verificação garante que apenas os bônus de Bud cujo TIPO (ex: YIELD, GROWTH_TIME)
     # e CATEGORIA (ex: Crop, Fruit) são relevantes para o serviço atual sejam considerados.
-    bud_analysis_result = bud_service.analyze_bud_buffs(farm_data)
     if bud_analysis_result and bud_analysis_result["internal"]["active_buffs"]:
         winning_bud_buffs = bud_analysis_result["internal"]["active_buffs"]
         winning_bud_info = bud_analysis_result["internal"]["winning_bud_info"]
@@ -557,24 +894,113 @@ def get_active_player_boosts(player_items: set, boost_catalogue: dict, non_cumul
                 if source_bud:
                     source_item_name = f"Bud #{source_bud['bud_id']} ({source_bud['type']}, {source_bud['aura']})"
 
-                active_boosts.append({
+                active_boosts.append(Boost({
                     "source_item": source_item_name,
                     "source_type": "bud",
                     "type": bud_boost_type,
                     "operation": original_details.get("operation"),
                     "value": Decimal(str(buff_value_float)),
                     "conditions": original_details.get("conditions", {})
-                })
+                }))
 
-    # 4. Adiciona bônus externos (ex: eventos de calendário) à lista antes de processar os modificadores.
-    if external_boosts:
-        active_boosts.extend(external_boosts)
+    return active_boosts
 
-    # 5. ETAPA FINAL: Processa todos os modificadores sobre a lista de bônus ativos.
-    # Isso garante que bônus que alteram outros bônus sejam aplicados por último.
-    final_processed_boosts = _process_boost_modifiers(active_boosts, player_items, farm_data)
+# ==============================================================================
+# PERFIL DE BÔNUS DO JOGADOR (POR PEDIDO)
+# ==============================================================================
+
+class PlayerBoostProfile:
+    """
+    Perfil de bônus do jogador, construído uma vez por pedido a partir dos dados
+    da fazenda e partilhado por todos os serviços de análise (`analyze_*`).
+
+    Os itens do jogador, a análise dos Buds e os modificadores são calculados na
+    primeira utilização e reaproveitados. Os bônus ativos são materializados por
+    catálogo (isto é, por domínio de recurso) também só quando pedidos.
 
-    return final_processed_boosts
+    Os dados da fazenda não devem ser alterados enquanto o perfil estiver em uso.
+    """
+
+    def __init__(self, farm_data: dict):
+        self.farm_data = farm_data or {}
+        self._active_boosts = {}
+        self._domain_boosts = {}
+
+    @functools.cached_property
+    def player_items(self) -> set:
+        """Itens que o jogador possui (ver `_get_player_items`). Só de leitura."""
+        return _get_player_items(self.farm_data)
+
+    @functools.cached_property
+    def player_item_bits(self) -> int:
+        """`player_items` como bitset de IDs (ver `item_registry.item_bits`)."""
+        return item_registry.item_bits(self.player_items)
+
+    @functools.cached_property
+    def player_items_without_farm_hands(self) -> set:
+        """`player_items` sem os vestíveis dos Farm Hands (usado pelos minerais). Só de leitura."""
+        return _get_player_items(self.farm_data, include_farm_hands=False)
+
+    def owned_items(self, table, include_farm_hands: bool = True) -> list:
+        """
+        Itens do jogador que são chaves de `table` (um catálogo ou registo partilhado),
+        pela ordem dos IDs do registo de itens.
+        """
+        if include_farm_hands:
+            player_item_bits = self.player_item_bits
+        else:
+            player_item_bits = item_registry.item_bits(self.player_items_without_farm_hands)
+        return item_registry.item_names(player_item_bits & item_registry.mapping_bits(table))
+
+    @functools.cached_property
+    def player_skills(self) -> set:
+        """Habilidades aprendidas pelo Bumpkin principal. Só de leitura."""
+        return set(self.farm_data.get("bumpkin", {}).get("skills", {}).keys())
+
+    @functools.cached_property
+    def bud_analysis(self) -> dict | None:
+        """Resultado de `bud_service.analyze_bud_buffs` para esta fazenda."""
+        return bud_service.analyze_bud_buffs(self.farm_data)
+
+    @functools.cached_property
+    def potential_modifiers(self) -> list:
+        """Efeitos modificadores dos itens do jogador (ver `_process_boost_modifiers`)."""
+        return _collect_potential_modifiers(self.player_item_bits)
+
+    def apply_modifiers(self, boosts: list) -> list:
+        """Aplica os modificadores do jogador a uma lista de bônus (devolve uma lista nova)."""
+        return _process_boost_modifiers(boosts, self.player_items, self.farm_data, self.potential_modifiers)
+
+    def get_active_boosts(self, boost_catalogue: dict, non_cumulative_groups: dict = None, external_boosts: list = None) -> list:
+        """
+        Equivalente a `get_active_player_boosts` para este jogador.
+
+        O resultado (já com os modificadores) é calculado uma vez por catálogo, grupos
+        não cumulativos e bônus externos. Cada chamada devolve uma lista nova; os bônus
+        são `Boost` imutáveis, partilhados entre chamadas (variantes com `overlay_boost`).
+        Os bônus externos também não devem ser alterados depois de passados aqui.
+        """
+        external_boosts = tuple(external_boosts or ())
+        key = (id(boost_catalogue), _freeze(non_cumulative_groups or {}), tuple(map(id, external_boosts)))
+        cached = self._active_boosts.get(key)
+        if cached is None or cached[0] is not boost_catalogue:
+            base_boosts = _collect_active_boosts(
+                self.player_items, boost_catalogue, non_cumulative_groups, self.farm_data, self.bud_analysis,
+                self.player_item_bits,
+            )
+            base_boosts.extend(external_boosts)
+            # Guarda o próprio catálogo e os bônus externos para que os `id` da chave não sejam reutilizados.
+            cached = self._active_boosts[key] = (boost_catalogue, external_boosts, self.apply_modifiers(base_boosts))
+        return list(cached[2])
+
+    def get_domain_boosts(self, domain: str, build) -> list:
+        """
+        Bônus de um domínio que usa o seu próprio coletor (ex: madeira), calculados
+        uma vez com `build(profile)`. Devolve uma lista nova; os bônus são só de leitura.
+        """
+        if domain not in self._domain_boosts:
+            self._domain_boosts[domain] = build(self)
+        return list(self._domain_boosts[domain])
 
 def get_aoe_boosts_for_resource(resource_position: dict, placed_items: dict, player_skills: set, farm_data: dict = None) -> list:
     """
@@ -600,8 +1026,8 @@ def get_aoe_boosts_for_resource(resource_position: dict, placed_items: dict, pla
 
     rx, ry = resource_position['x'], resource_position['y']
 
-    # Unifica todos os itens que podem ter AOE para consulta (atualmente apenas coletáveis).
-    all_aoe_items = {**collectibles_domain.COLLECTIBLES_ITEM_BUFFS}
+    # Itens que podem ter AOE (atualmente apenas coletáveis). Apenas leitura, sem cópia.
+    all_aoe_items = collectibles_domain.COLLECTIBLES_ITEM_BUFFS
 
     for item_name, placements in placed_items.items():
         item_details = all_aoe_items.get(item_name)
@@ -684,128 +1110,6 @@ def get_aoe_boosts_for_resource(resource_position: dict, placed_items: dict, pla
 
     return active_aoe_boosts
 
-def get_crop_tier(crop_name: str) -> str | None:
-    """
-    Retorna o tier ('basic', 'medium', 'advanced') de uma cultura específica.
-    Consulta as listas de tiers pré-calculadas no domínio de culturas (`crops_domain`).
-
-    Args:
-        crop_name (str): O nome da cultura.
-
-    Returns:
-        str | None: O tier da cultura (ex: 'basic', 'medium', 'advanced') ou None se não encontrado.
-    """
-    if crop_name in crops_domain.CROP_TIERS["basic"]:
-        return "basic"
-    if crop_name in crops_domain.CROP_TIERS["medium"]:
-        return "medium"
-    if crop_name in crops_domain.CROP_TIERS["advanced"]:
-        return "advanced"
-    return None
-
-def _conditions_are_met(conditions: dict, resource_name: str, node_context: dict = None) -> bool:
-    """
-    Função auxiliar para verificar se todas as condições de um bônus são atendidas
-    para um determinado recurso e contexto de nó. Esta função é crucial para
-    determinar se um bônus específico deve ser aplicado.
-
-    Args:
-        conditions (dict): Um dicionário de condições a serem verificadas (ex: {"resource": "Wood", "faction": "Goblins"}).
-        resource_name (str): O nome do recurso atual sendo avaliado (ex: "Apple", "Stone").
-        node_context (dict, opcional): Um dicionário com informações adicionais sobre o nó
-                                       (ex: {"minesLeft": 1} para minerais).
-
-    Returns:
-        bool: True se todas as condições forem atendidas, False caso contrário.
-    """
-    context = node_context or {}
-
-    for condition_key, required_value in conditions.items():
-        # Condição de Recurso/Item/Cultura (ex: "resource": "Wood" ou "resource": ["Crop", "Fruit"])
-        if condition_key in ["resource", "item", "crop"]:
-            # Garante que `required_value` seja sempre uma lista para iteração consistente.
-            required_list = required_value if isinstance(required_value, list) else [required_value]
-            
-            # Lógica para verificar se o recurso atual pertence a alguma das categorias
-            # especificadas na condição (ex: se "Lemon" é uma "Fruit").
-            is_met_by_category = False
-            for req_val in required_list:
-                if req_val in RESOURCE_CATEGORIES: # Verifica se o valor requerido é uma categoria conhecida
-                    if resource_name in RESOURCE_CATEGORIES[req_val]: # Verifica se o recurso pertence a essa categoria
-                        is_met_by_category = True
-                        break
-            
-            # Se a condição foi atendida por uma categoria, continua para a próxima chave de condição.
-            if is_met_by_category:
-                continue
-            
-            # Lógica original: Se não foi atendida por categoria, verifica se o nome do recurso
-            # está diretamente na lista de valores requeridos (ex: "Wood" em ["Wood", "Stone"]).
-            if resource_name not in required_list:
-                return False # Condição não atendida.
-        
-        # Condição de Categoria (ex: "category": "Fruit" ou "target_category": "BasicCrop")
-        elif condition_key in ["category", "target_category"]:
-            required_list = required_value if isinstance(required_value, list) else [required_value]
-            
-            is_met = False
-            for category_name in required_list:
-                if category_name in RESOURCE_CATEGORIES:
-                    if resource_name == category_name or resource_name in RESOURCE_CATEGORIES[category_name]:
-                        is_met = True
-                        break
-                else:
-                    log.warning(f"Categoria de bônus desconhecida encontrada: '{category_name}'. A condição será considerada como não atendida.")
-            
-            if not is_met:
-                return False
-
-        # Condição de Minas Restantes (específico para mineração, ex: "minesLeft": 1)
-        elif condition_key == "minesLeft":
-            current_value = context.get("minesLeft")
-            if current_value != required_value:
-                return False
-        
-        # Condição de Tier da Cultura (ex: "crop_tier": "basic")
-        elif condition_key == "crop_tier":
-            current_tier = get_crop_tier(resource_name)
-            if not current_tier:
-                return False # A cultura não tem um tier definido ou não existe, então a condição não é atendida.
-            
-            # Garante que `required_value` seja uma lista para iteração consistente.
-            required_list = required_value if isinstance(required_value, list) else [required_value]
-            if current_tier not in required_list:
-                return False # O tier da cultura não corresponde ao requerido.
-
-        # Condição de Construção (ex: "building": "Greenhouse")
-        elif condition_key == "building":
-            current_building = context.get("building")
-            if current_building != required_value:
-                return False
-        
-        # Condição de Local de Plantio (ex: "planting_spot": "Fruit Patch")
-        elif condition_key == "planting_spot":
-            # Verifica o contexto para saber onde o recurso está plantado.
-            # O contexto pode ter 'building' ou 'planting_spot'.
-            current_spot = context.get("building") or context.get("planting_spot")
-            if current_spot != required_value:
-                return False
-
-        # Condição de Exclusão (ex: "exclude_target": ["Apple", "Banana"])
-        # Se o `resource_name` estiver na lista de exclusão, a condição NÃO é atendida.
-        elif condition_key == "exclude_target":
-            excluded_list = required_value if isinstance(required_value, list) else [required_value]
-            if resource_name in excluded_list:
-                return False
-        
-        # A condição de 'faction' é validada em `get_active_player_boosts`.
-        # Ignorar a chave 'faction' aqui é intencional, pois ela já foi verificada
-        # com o contexto global do jogador (farm_data).
-        elif condition_key == "faction":
-            pass
-
-    return True # Todas as condições foram atendidas.
-
 def extract_and_process_temporal_boosts(active_boosts: list, farm_data: dict) -> tuple:
     """
     Separa os bônus temporais dos bônus normais e anexa seus timestamps de ativação.
@@ -828,8 +1132,7 @@ def extract_and_process_temporal_boosts(active_boosts: list, farm_data: dict) ->
     temporal_item_names = set()
 
     # Unifica todos os itens colocados na fazenda (principal e casa) para verificar timestamps.
-    all_placed_items = farm_data.get("collectibles", {})
-    all_placed_items.update(farm_data.get("home", {}).get("collectibles", {}))
+    all_placed_items = {**farm_data.get("collectibles", {}), **farm_data.get("home", {}).get("collectibles", {})}
 
     for boost in active_boosts:
         # Verifica se o bônus é marcado como temporal.
@@ -870,11 +1173,10 @@ def calculate_final_recovery_time(base_time: float, active_boosts: list, resourc
     applied_buffs_details = []
 
     for boost in active_boosts:
-        conditions = boost.get("conditions", {})
         # Verifica se o bônus se aplica ao recurso e é um tipo de bônus de tempo de recuperação.
-        if _conditions_are_met(conditions, resource_name, node_context) and boost.get("type") in ["RECOVERY_TIME", "GROWTH_TIME", "SUPER_TOTEM_TIME_BOOST"]:
+        if boost_applies(boost, resource_name, node_context) and boost.get("type") in ["RECOVERY_TIME", "GROWTH_TIME", "SUPER_TOTEM_TIME_BOOST"]:
                 operation = boost["operation"]
-                value = Decimal(str(boost["value"]))
+                value = boost_value(boost)
 
                 # Aplica a operação do bônus (multiplicação percentual ou direta).
                 if operation == "percentage":
@@ -915,22 +1217,21 @@ def calculate_final_yield(base_yield: float, active_boosts: list, resource_name:
     chance_bonuses = []
 
     for boost in active_boosts:
-        conditions = boost.get("conditions", {})
         # Verifica se o bônus se aplica ao recurso atual.
-        if _conditions_are_met(conditions, resource_name, node_context):
+        if boost_applies(boost, resource_name, node_context):
             boost_type = boost.get("type")
             # Processa bônus de rendimento direto (YIELD).
             if boost_type == "YIELD":
                 operation = boost["operation"]
-                value = Decimal(str(boost["value"]))
+                value = boost_value(boost)
 
                 # Aplica a operação do bônus (aditivo, subtrativo, percentual, multiplicativo).
-                boost_to_apply = boost.copy()
+                boost_to_apply = boost
                 if operation == "add":
                     additive_bonus += value
                 elif operation == "subtract":
                     additive_bonus -= value
-                    boost_to_apply['value'] = -float(value) # Store as negative for UI
+                    boost_to_apply = overlay_boost(boost, value=-float(value)) # Store as negative for UI
                 elif operation == "percentage":
                     multiplicative_factor *= (Decimal('1') + value)
                 elif operation == "multiply":
@@ -82,14 +82,18 @@ def _format_buffs(buff_list):
         })
     return formatted
 
-def analyze_resources_summary(farm_data: dict) -> dict:
+def analyze_resources_summary(farm_data: dict, profile: ras.PlayerBoostProfile = None) -> dict:
     """
     Cria um sumário de análise para recursos básicos (Wood, Stone, etc.),
     calculando o rendimento mínimo e médio, custo e tempo de ciclo com base
     nos bônus do jogador.
+
+    Args:
+        farm_data (dict): O estado completo da fazenda do jogador.
+        profile (PlayerBoostProfile, opcional): Perfil de bônus partilhado do pedido.
     """
     categorized_summary = {}
-    player_items = ras._get_player_items(farm_data)
+    profile = profile or ras.PlayerBoostProfile(farm_data)
 
     # Análise de Recursos
     for resource_name, resource_info in resources_domain.RESOURCES_DATA.items():
@@ -116,7 +120,7 @@ def analyze_resources_summary(farm_data: dict) -> dict:
             'boost_category_names': resource_info.get("boost_categories", [])
         }
         boost_catalogue = ras.filter_boosts_from_domains(resource_conditions)
-        active_boosts = ras.get_active_player_boosts(player_items, boost_catalogue, farm_data=farm_data)
+        active_boosts = profile.get_active_boosts(boost_catalogue)
 
         min_yield_calc = ras.calculate_final_yield(float(base_yield), active_boosts, resource_name)
         min_yield = Decimal(str(min_yield_calc['final_deterministic']))
@@ -133,15 +137,14 @@ def analyze_resources_summary(farm_data: dict) -> dict:
                     elif boost.get("type") == "CRITICAL_CHANCE":
                         crit_chance_boosts.append({"source_item": "Native", "operation": "add", **boost})
 
-        for item_name in player_items:
-            if item_name in boost_catalogue:
-                item_boosts = boost_catalogue[item_name].get("boosts", [])
-                for boost in item_boosts:
-                    if "type" in boost and "operation" in boost:
-                        if boost.get("type") == "YIELD":
-                            all_potential_yield_boosts.append({"source_item": item_name, **boost})
-                        elif boost.get("type") == "CRITICAL_CHANCE":
-                            crit_chance_boosts.append({"source_item": item_name, **boost})
+        for item_name in profile.owned_items(boost_catalogue):
+            item_boosts = boost_catalogue[item_name].get("boosts", [])
+            for boost in item_boosts:
+                if "type" in boost and "operation" in boost:
+                    if boost.get("type") == "YIELD":
+                        all_potential_yield_boosts.append({"source_item": item_name, **boost})
+                    elif boost.get("type") == "CRITICAL_CHANCE":
+                        crit_chance_boosts.append({"source_item": item_name, **boost})
 
         max_yield_calc = ras.calculate_final_yield(float(base_yield), all_potential_yield_boosts, resource_name)
         max_yield = Decimal(str(max_yield_calc['final_deterministic']))
@@ -202,7 +205,7 @@ def analyze_resources_summary(farm_data: dict) -> dict:
             'boost_category_names': ["Crop"]
         }
         boost_catalogue = ras.filter_boosts_from_domains(resource_conditions)
-        active_boosts = ras.get_active_player_boosts(player_items, boost_catalogue, farm_data=farm_data)
+        active_boosts = profile.get_active_boosts(boost_catalogue)
 
         min_yield_calc = ras.calculate_final_yield(float(base_yield), active_boosts, crop_name)
         min_yield = Decimal(str(min_yield_calc['final_deterministic']))
@@ -254,7 +257,7 @@ def analyze_resources_summary(farm_data: dict) -> dict:
             'boost_category_names': ["Fruit"]
         }
         boost_catalogue = ras.filter_boosts_from_domains(resource_conditions)
-        active_boosts = ras.get_active_player_boosts(player_items, boost_catalogue, farm_data=farm_data)
+        active_boosts = profile.get_active_boosts(boost_catalogue)
 
         min_yield_calc = ras.calculate_final_yield(float(base_yield), active_boosts, fruit_name)
         min_yield = Decimal(str(min_yield_calc['final_deterministic']))
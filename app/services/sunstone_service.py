@@ -35,10 +35,6 @@ RESOURCE_NODE_MAP = {
 # FUNÇÃO DE AGREGAÇÃO DE BÔNUS (LÓGICA CENTRAL)
 # ==============================================================================
 
-def _get_player_items(farm_data: dict) -> set:
-    # Esta função é genérica e pode permanecer, mas seus resultados não serão usados para buffs de Sunstone.
-    return set() # Retorna vazio para indicar que não há itens relevantes para buffs de Sunstone
-
 def _get_sunstone_buffs(farm_data: dict) -> list:
     """
     Coleta e filtra todos os bônus relevantes para a mineração de Sunstone
@@ -48,13 +48,14 @@ def _get_digging_history_stats(bumpkin_data: dict) -> dict:
         'most_dug_item': most_dug_item
     }
 
-def analyze_desert_digging_data(main_farm_data: dict, seasonal_artefact: str) -> dict:
+def analyze_desert_digging_data(main_farm_data: dict, seasonal_artefact: str, profile: resource_analysis_service.PlayerBoostProfile = None) -> dict:
     """
     Analisa todos os dados de escavação de tesouros da Ilha do Deserto.
 
     Args:
         main_farm_data: O dicionário principal de dados da fazenda vindo da API.
         seasonal_artefact: O nome do artefato sazonal atual, vindo do estado global.
+        profile: Perfil de bônus partilhado do pedido (opcional).
 
     Returns:
          Um dicionário contendo o espelho do grid, estatísticas e padrões.
@@ -125,8 +126,8 @@ def analyze_desert_digging_data(main_farm_data: dict, seasonal_artefact: str) ->
                 'image': analysis.get_item_image_path(item_name)
             }
 
-    # Obter itens do jogador para análise de buffs
-    player_items = resource_analysis_service._get_player_items(main_farm_data)
+    # Perfil de bônus do jogador para análise de buffs
+    profile = profile or resource_analysis_service.PlayerBoostProfile(main_farm_data)
 
     # Processa os valores de SFL e Moedas para itens encontrados e ferramentas usadas
     processed_items_found = []
@@ -137,11 +138,7 @@ def analyze_desert_digging_data(main_farm_data: dict, seasonal_artefact: str) ->
     sale_price_boost_catalogue = resource_analysis_service.filter_boosts_from_domains(
         {"boost_category_names": ["Treasure"]}
     )
-    active_sale_price_boosts = resource_analysis_service.get_active_player_boosts(
-        player_items,
-        sale_price_boost_catalogue,
-        farm_data=main_farm_data
-    )
+    active_sale_price_boosts = profile.get_active_boosts(sale_price_boost_catalogue)
     log.debug(f"Active Sale Price Boosts: {active_sale_price_boosts}")
 
     for item_name, count in sorted(items_found_counts.items()):
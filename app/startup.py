@@ -0,0 +1,201 @@
+# app/startup.py
+"""
+Arranque e memória dos workers.
+
+- `flask --app run build-domain-snapshot` grava o snapshot compilado dos módulos de
+  app/domain (ver app/domain/snapshot.py). Deve ser corrido no deploy, depois de
+  qualquer alteração aos dados de domínio.
+- `flask --app run check-importtime` mede as importações de um arranque a frio com
+  `python -X importtime` (num processo novo, várias vezes, ficando com a melhor
+  medição) e termina com código 1 se o total passar de `IMPORT_TIME_BUDGET_MS`.
+- Com o perfil de produção (gunicorn.conf.py), a aplicação é carregada no processo
+  principal do gunicorn: `preload` constrói aí todas as tabelas de domínio e
+  `freeze_for_fork` tira-as do alcance do GC antes do fork, para que as páginas de
+  memória continuem partilhadas (copy-on-write) entre os workers.
+  `memory_report` (/internal/memory) mostra a memória própria e partilhada de cada worker.
+"""
+import gc
+import importlib
+import logging
+import os
+import pkgutil
+import re
+import subprocess
+import sys
+import time
+
+import click
+
+import config
+
+from . import domain
+from .domain import snapshot
+
+log = logging.getLogger(__name__)
+
+# Definida pelo gunicorn.conf.py no processo principal e herdada pelos workers.
+MASTER_PID_ENV = "GUNICORN_MASTER_PID"
+
+# Código corrido em cada medição: o mesmo que um worker faz ao arrancar.
+_COLD_START_CODE = "from app import create_app; create_app()"
+
+# 'import time:       215 |       3046 |   app.domain.skills'
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def _project_root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_importtime() -> dict:
+    """
+    Corre um arranque a frio num processo novo e devolve
+    {"total_ms": float, "self_ms": {módulo: float}, "cumulative_ms": {módulo: float}}.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _COLD_START_CODE],
+        cwd=_project_root(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise click.ClickException(f"O arranque a frio falhou:\n{result.stderr[-2000:]}")
+
+    self_ms, cumulative_ms = {}, {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        self_ms[module] = int(self_us) / 1000
+        cumulative_ms[module] = int(cumulative_us) / 1000
+        # Só as importações de primeiro nível somam para o total (as outras já estão no cumulativo delas).
+        if len(indent) == 1:
+            total_us += int(cumulative_us)
+    return {"total_ms": total_us / 1000, "self_ms": self_ms, "cumulative_ms": cumulative_ms}
+
+
+def preload() -> None:
+    """
+    Importa todos os módulos de domínio e constrói as tabelas que de outra forma só
+    seriam criadas no primeiro pedido de cada worker.
+    """
+    from . import dashboard_cache
+    from .domain import buds
+
+    start_time = time.perf_counter()
+    for info in pkgutil.iter_modules(domain.__path__):
+        importlib.import_module(f"{domain.__name__}.{info.name}")
+    len(buds.BUDS_DATA)  # Lê buds.bin
+    dashboard_cache.get_domain_version()
+    log.info(f"Tabelas de domínio pré-carregadas em {(time.perf_counter() - start_time) * 1000:.1f} ms.")
+
+
+def freeze_for_fork() -> None:
+    """
+    Recolhe o lixo do arranque e move todos os objetos vivos para a geração permanente
+    do GC. As coleções nos workers deixam de os percorrer (e de escrever nos seus
+    cabeçalhos), pelo que as páginas herdadas do processo principal não são copiadas.
+    """
+    gc.collect()
+    gc.freeze()
+    log.info(f"{gc.get_freeze_count()} objetos congelados antes do fork (pid {os.getpid()}).")
+
+
+# Campos de /proc/<pid>/smaps_rollup (em kB).
+_SMAPS_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def process_memory(pid: int):
+    """
+    Memória do processo em kB: `unique_kb` (páginas só deste processo), `shared_kb`
+    (páginas partilhadas com outros processos, ex: herdadas do fork), `rss_kb` e `pss_kb`.
+    Devolve None se o sistema não expuser /proc/<pid>/smaps_rollup (Linux >= 4.14).
+    """
+    values = dict.fromkeys(_SMAPS_FIELDS, 0)
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+            for line in f:
+                field, _, rest = line.partition(":")
+                if field in values:
+                    values[field] = int(rest.split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return {
+        "pid": pid,
+        "rss_kb": values["Rss"],
+        "pss_kb": values["Pss"],
+        "unique_kb": values["Private_Clean"] + values["Private_Dirty"],
+        "shared_kb": values["Shared_Clean"] + values["Shared_Dirty"],
+    }
+
+
+def _child_pids(pid: int) -> list:
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", encoding="ascii") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return sorted(children)
+
+
+def memory_report() -> dict:
+    """
+    Memória do processo principal do gunicorn e de cada worker. Fora do gunicorn
+    (ex: `flask run`), só o processo atual é reportado.
+    """
+    master_pid = os.getenv(MASTER_PID_ENV)
+    if master_pid is not None:
+        master = process_memory(int(master_pid))
+        workers = [process_memory(pid) for pid in _child_pids(int(master_pid))]
+    else:
+        master = None
+        workers = [process_memory(os.getpid())]
+    workers = [worker for worker in workers if worker is not None]
+    return {
+        "worker_pid": os.getpid(),
+        "gc_frozen_objects": gc.get_freeze_count(),
+        "master": master,
+        "workers": workers,
+        "total_unique_kb": sum(worker["unique_kb"] for worker in workers),
+        "total_pss_kb": sum(worker["pss_kb"] for worker in workers) + (master["pss_kb"] if master else 0),
+    }
+
+
+def init_app(app) -> None:
+    """Regista os comandos `build-domain-snapshot` e `check-importtime`."""
+
+    @app.cli.command("build-domain-snapshot")
+    def build_domain_snapshot_command():
+        """Grava o snapshot compilado dos módulos de app/domain."""
+        start_time = time.perf_counter()
+        modules = snapshot.build()
+        size_kb = os.path.getsize(snapshot.SNAPSHOT_FILE) / 1024
+        click.echo(
+            f"Snapshot de domínio gravado em {snapshot.SNAPSHOT_FILE} ({size_kb:.0f} KB, {len(modules)} módulos) "
+            f"em {time.perf_counter() - start_time:.2f}s."
+        )
+
+    @app.cli.command("check-importtime")
+    @click.option("--runs", default=3, show_default=True, help="Número de arranques medidos (conta o melhor).")
+    @click.option("--budget", type=float, default=None, help="Orçamento em ms (por omissão IMPORT_TIME_BUDGET_MS).")
+    @click.option("--top", default=15, show_default=True, help="Módulos mais lentos a listar.")
+    def check_importtime_command(runs, budget, top):
+        """Mede o tempo de importação de um arranque a frio e falha se passar do orçamento."""
+        budget = config.IMPORT_TIME_BUDGET_MS if budget is None else budget
+        # O melhor de várias medições descarta o ruído da máquina (cache de disco, outros processos).
+        best = min((measure_importtime() for _ in range(max(runs, 1))), key=lambda m: m["total_ms"])
+
+        click.echo(f"Módulos mais lentos (tempo próprio), de {len(best['self_ms'])} importados:")
+        slowest = sorted(best["self_ms"].items(), key=lambda item: item[1], reverse=True)[:top]
+        for module, self_ms in slowest:
+            click.echo(f"  {self_ms:8.1f} ms  {module}")
+        for module in ("app", "app.domain"):
+            if module in best["cumulative_ms"]:
+                click.echo(f"Cumulativo de '{module}': {best['cumulative_ms'][module]:.1f} ms")
+        click.echo(f"Importações no arranque: {best['total_ms']:.1f} ms (orçamento {budget:.0f} ms).")
+
+        if best["total_ms"] > budget:
+            click.echo("Orçamento de arranque ultrapassado.", err=True)
+            sys.exit(1)
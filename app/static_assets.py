@@ -0,0 +1,220 @@
+# app/static_assets.py
+"""
+Ficheiros estáticos com impressão digital (hash do conteúdo) e pré-compressão.
+
+- `flask build-static` (depois do `npm run build`) calcula o hash de cada ficheiro
+  em app/static, grava o manifesto (`STATIC_MANIFEST_FILE`) e cria as variantes
+  `.gz` (e `.br`, se o pacote `brotli` estiver instalado) dos ficheiros de texto.
+- Com o manifesto presente, `url_for('static', ...)` gera URLs como
+  `css/style.<hash>.css`. Esses URLs nunca mudam de conteúdo e são
+  servidos com `Cache-Control: immutable` por um ano; a variante comprimida é
+  escolhida pelo `Accept-Encoding`.
+- Sem manifesto (ex: em desenvolvimento), os URLs ficam como estavam e os ficheiros
+  continuam a ser revalidados a cada pedido (`SEND_FILE_MAX_AGE_DEFAULT = 0`).
+
+Um nome com hash que já não corresponda ao conteúdo (página antiga em cache, novo
+deploy) continua a ser servido a partir do ficheiro atual, mas sem cache longo.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import re
+import time
+
+import click
+from flask import abort, current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+import config
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende do ambiente
+    brotli = None
+
+log = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Extensões que compensa comprimir (as imagens já vêm comprimidas).
+_COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.map', '.svg', '.json', '.txt', '.html')
+# Variantes por ordem de preferência: (codificação, extensão do ficheiro).
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# Uma variante só é gravada se ficar abaixo desta fração do tamanho original.
+_MIN_COMPRESSION_RATIO = 0.9
+
+# 'css/style.0123456789abcdef.css' -> ('css/style', '0123456789abcdef', '.css')
+_FINGERPRINT_RE = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{16})(?P<ext>\.[^./]+)$")
+
+_manifest = {}  # Caminho original -> {"hash": str, "encodings": [str]}
+
+
+def file_hash(path: str) -> str:
+    """Hash curto do conteúdo de um ficheiro (também usado pelo manifesto dos personagens animados)."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+def fingerprinted_name(filename: str, content_hash: str) -> str:
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{content_hash}{ext}"
+
+
+def _manifest_path(static_folder: str) -> str:
+    return os.path.join(static_folder, config.STATIC_MANIFEST_FILE)
+
+
+def _is_build_output(name: str) -> bool:
+    return name == config.STATIC_MANIFEST_FILE or name.endswith((".gz", ".br")) or name.startswith(".")
+
+
+def _write_compressed(path: str, data: bytes) -> list:
+    """Grava as variantes comprimidas de `path` e devolve as codificações gravadas."""
+    encodings = []
+    compressors = {"gzip": lambda raw: gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors["br"] = lambda raw: brotli.compress(raw, quality=11)
+    for encoding, suffix in _ENCODINGS:
+        variant_path = path + suffix
+        compressor = compressors.get(encoding)
+        compressed = compressor(data) if compressor is not None else None
+        if compressed is not None and len(compressed) < len(data) * _MIN_COMPRESSION_RATIO:
+            with open(variant_path, "wb") as f:
+                f.write(compressed)
+            encodings.append(encoding)
+        elif os.path.exists(variant_path):
+            # Variante de um build anterior que já não se aplica.
+            os.remove(variant_path)
+    return encodings
+
+
+def build(static_folder: str) -> dict:
+    """Calcula o hash de todos os ficheiros estáticos, cria as variantes comprimidas e grava o manifesto."""
+    files = {}
+    for root, dirs, names in os.walk(static_folder):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(names):
+            if _is_build_output(name):
+                continue
+            path = os.path.join(root, name)
+            relative_path = os.path.relpath(path, static_folder).replace("\\", "/")
+            with open(path, "rb") as f:
+                data = f.read()
+            entry = {"hash": hashlib.blake2b(data, digest_size=8).hexdigest(), "encodings": []}
+            if name.lower().endswith(_COMPRESSIBLE_EXTENSIONS):
+                entry["encodings"] = _write_compressed(path, data)
+            files[relative_path] = entry
+
+    manifest = {"version": MANIFEST_VERSION, "files": files}
+    path = _manifest_path(static_folder)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+    return manifest
+
+
+def load_manifest(static_folder: str) -> dict:
+    """Carrega o manifesto gerado por `flask build-static` ({} se não existir)."""
+    global _manifest
+    path = _manifest_path(static_folder)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        log.info("Manifesto de ficheiros estáticos não encontrado; os URLs não terão impressão digital.")
+        _manifest = {}
+        return _manifest
+    except (OSError, ValueError) as e:
+        log.warning(f"Manifesto de ficheiros estáticos inválido ({path}): {e}")
+        _manifest = {}
+        return _manifest
+
+    if data.get("version") != MANIFEST_VERSION:
+        log.warning(f"Versão do manifesto de ficheiros estáticos não suportada: {data.get('version')}.")
+        _manifest = {}
+    else:
+        _manifest = data.get("files", {})
+        log.info(f"Manifesto de ficheiros estáticos carregado com {len(_manifest)} ficheiros.")
+    return _manifest
+
+
+def _add_fingerprint(endpoint, values) -> None:
+    # Aplica-se a todas as chamadas `url_for('static', filename=...)` dos templates.
+    if endpoint != "static" or not _manifest:
+        return
+    filename = values.get("filename")
+    entry = _manifest.get(filename)
+    if entry is not None:
+        values["filename"] = fingerprinted_name(filename, entry["hash"])
+
+
+def _resolve(filename: str):
+    """(caminho original, hash pedido) de um nome com ou sem impressão digital."""
+    match = _FINGERPRINT_RE.match(filename)
+    if match is not None:
+        original = match["stem"] + match["ext"]
+        if original in _manifest or not os.path.isfile(safe_join(current_app.static_folder, filename) or ""):
+            return original, match["hash"]
+    # Sem impressão digital no nome: aceita também a versão em `?v=` (ex: animations.ts).
+    return filename, request.args.get("v")
+
+
+def _preferred_encoding(entry) -> tuple:
+    if not entry or not entry["encodings"]:
+        return None, None
+    for encoding, suffix in _ENCODINGS:
+        if encoding in entry["encodings"] and request.accept_encodings[encoding] > 0:
+            return encoding, suffix
+    return None, None
+
+
+def send_static_asset(filename: str):
+    """Substitui a view `static` do Flask (ver `init_app`)."""
+    static_folder = current_app.static_folder
+    original, requested_hash = _resolve(filename)
+    if safe_join(static_folder, original) is None or _is_build_output(os.path.basename(original)):
+        abort(404)
+
+    entry = _manifest.get(original)
+    is_current = entry is not None and requested_hash == entry["hash"]
+    max_age = config.STATIC_IMMUTABLE_MAX_AGE if is_current else None
+
+    encoding, suffix = _preferred_encoding(entry)
+    if encoding is not None:
+        mimetype = mimetypes.guess_type(original)[0] or "application/octet-stream"
+        response = send_from_directory(static_folder, original + suffix, mimetype=mimetype, max_age=max_age)
+        response.headers["Content-Encoding"] = encoding
+    else:
+        response = send_from_directory(static_folder, original, max_age=max_age)
+
+    if entry is not None and entry["encodings"]:
+        response.vary.add("Accept-Encoding")
+    if is_current:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    return response
+
+
+def init_app(app) -> None:
+    """Carrega o manifesto, ativa os URLs com impressão digital e regista `flask build-static`."""
+    if config.STATIC_FINGERPRINTING_ENABLED:
+        load_manifest(app.static_folder)
+        app.url_defaults(_add_fingerprint)
+        app.view_functions["static"] = send_static_asset
+
+    @app.cli.command("build-static")
+    def build_static_command():
+        """Gera o manifesto e as variantes comprimidas dos ficheiros estáticos."""
+        start_time = time.perf_counter()
+        manifest = build(app.static_folder)
+        compressed = sum(1 for entry in manifest["files"].values() if entry["encodings"])
+        click.echo(
+            f"{len(manifest['files'])} ficheiros no manifesto, {compressed} com variantes comprimidas "
+            f"em {time.perf_counter() - start_time:.2f}s."
+        )
+        if brotli is None:
+            click.echo("Pacote 'brotli' não instalado: apenas variantes gzip foram geradas.")
@@ -1,10 +1,15 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import config
 
 import requests
+from flask import g, has_app_context
 from requests.exceptions import JSONDecodeError
 
-from .cache import cache
+from . import http_client
+from .cache import cache, single_flight, stale_while_revalidate
 
 log = logging.getLogger(__name__)
 
@@ -13,6 +18,43 @@ SFL_WORLD_API_URL = "https://sfl.world/api/v1.1/"
 SFL_PRICE_URL = "https://sfl.world/api/v1/prices"
 EXCHANGE_API_URL = "https://sfl.world/api/v1.1/exchange"
 
+# Chaves de cache das funções abaixo, partilhadas com a camada de single-flight.
+PRICES_CACHE_KEY = "prices"
+EXCHANGE_CACHE_KEY = "exchange"
+
+def _farm_data_cache_key(farm_id):
+    return f"farm_data_{farm_id}"
+
+def _is_successful_fetch(result) -> bool:
+    """Um resultado (data, error) só substitui o valor em cache se não houver erro."""
+    data, error = result
+    return error is None and data is not None
+
+# Pool partilhado para as chamadas à sfl.world feitas em paralelo com a API principal,
+# que corre na própria thread do pedido. Cada carregamento em curso ocupa uma thread.
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=config.SFL_FETCH_MAX_WORKERS, thread_name_prefix="sfl-fetch")
+
+# ---> FUNÇÕES AUXILIARES DE TEMPORIZAÇÃO ---
+def _timed_call(func, *args):
+    """
+    Executa `func(*args)` e devolve uma tupla (resultado, duração_em_segundos).
+    Exceções são propagadas normalmente para quem chamou.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def _record_timing(source: str, elapsed: float):
+    """
+    Regista a duração de uma chamada a uma API de origem no log e, se houver
+    um contexto de aplicação ativo, em `g.upstream_timings` para a requisição atual.
+    """
+    log.info(f"Tempo de resposta de '{source}': {elapsed * 1000:.1f} ms")
+    if has_app_context():
+        if "upstream_timings" not in g:
+            g.upstream_timings = {}
+        g.upstream_timings[source] = elapsed
+
 # ---> FUNÇÃO AUXILIAR DADOS LAND ---
 @cache.cached(make_cache_key=lambda farm_id, endpoint: f"sfl_world_{farm_id}_{endpoint}")
 def get_sfl_world_data(farm_id: int, endpoint: str):
@@ -24,7 +66,7 @@ def get_sfl_world_data(farm_id: int, endpoint: str):
         full_api_url = f"{SFL_WORLD_API_URL}{endpoint}/{farm_id}"
         log.info(f"Buscando dados na API sfl.world: {full_api_url}")
         
-        response = requests.get(full_api_url, timeout=10)
+        response = http_client.get(full_api_url, source="get_sfl_world_data", timeout=10)
         response.raise_for_status()
         
         try:
@@ -47,14 +89,14 @@ def get_sfl_world_data(farm_id: int, endpoint: str):
         return {}, f"Não foi possível buscar os dados de '{endpoint}' em sfl.world."
 
 # ---> FUNÇÃO AUXILIAR PREÇOS ---
-@cache.cached(key_prefix='prices')
+@stale_while_revalidate(PRICES_CACHE_KEY, fresh_for=300, max_stale=config.PRICES_MAX_STALENESS, is_valid=_is_successful_fetch)
 def get_prices_data():
     """
     Busca os preços de todos os itens da API sfl.world.
     """
     try:
         log.info(f"Buscando dados de preços na API: {SFL_PRICE_URL}")
-        response = requests.get(SFL_PRICE_URL, timeout=10)
+        response = http_client.get(SFL_PRICE_URL, source="get_prices_data", timeout=10)
         response.raise_for_status()
         try:
             data = response.json()
@@ -71,14 +113,14 @@ def get_prices_data():
 # ---> FIM FUNÇÃO AUXILIAR PREÇOS ---
 
 # ---> FUNÇÃO AUXILIAR COTAÇÕES ---
-@cache.memoize(timeout=900) # Cache de 15 minutos, igual ao do serviço original
+@stale_while_revalidate(EXCHANGE_CACHE_KEY, fresh_for=900, max_stale=config.EXCHANGE_MAX_STALENESS, is_valid=_is_successful_fetch) # 15 minutos, igual ao do serviço original
 def get_exchange_data():
     """
     Busca os dados de cotação da API sfl.world.
     """
     try:
         log.info(f"Buscando dados de cotação na API: {EXCHANGE_API_URL}")
-        response = requests.get(EXCHANGE_API_URL, timeout=10)
+        response = http_client.get(EXCHANGE_API_URL, source="get_exchange_data", timeout=10)
         response.raise_for_status()
         data = response.json()
         return data, None
@@ -94,8 +136,31 @@ def get_exchange_data():
 # ---> FIM FUNÇÃO AUXILIAR COTAÇÕES ---
 
 
+# ---> FUNÇÃO AUXILIAR DADOS PRINCIPAIS ---
+def _fetch_main_farm_data(farm_id: int):
+    """
+    Busca os dados da fazenda na API principal (api.sunflower-land.com).
+    Não captura exceções: erros HTTP são tratados por `get_farm_data`.
+
+    Retorna:
+        dict | None: O conteúdo da chave 'farm' da resposta.
+    """
+    sfl_api_url = f"{SFL_API_BASE_URL}{farm_id}"
+    log.info(f"Buscando dados principais: {sfl_api_url}")
+
+    headers = {}
+    if config.SFL_API_KEY:
+        headers['x-api-key'] = config.SFL_API_KEY
+
+    response = http_client.get(sfl_api_url, source="get_farm_data", headers=headers, timeout=10)
+    response.raise_for_status()
+    return response.json().get('farm')
+# ---> FIM FUNÇÃO AUXILIAR DADOS PRINCIPAIS ---
+
+
 # ---> FUNÇÃO PRINCIPAL  ---
-@cache.cached(make_cache_key=lambda farm_id: f"farm_data_{farm_id}")
+@cache.cached(make_cache_key=_farm_data_cache_key)
+@single_flight(_farm_data_cache_key)
 def get_farm_data(farm_id: int):
     """
     Busca os dados das duas APIs e os retorna como dicionários separados.
@@ -113,25 +178,32 @@ def get_farm_data(farm_id: int):
     secondary_data = None
     
     try:
-        # Etapa 1: Buscar dados da API principal (nossa 'farm_data_main')
-        # Esta fonte é a mais completa e contém as 'milestones'.
-        sfl_api_url = f"{SFL_API_BASE_URL}{farm_id}"
-        log.info(f"Buscando dados principais: {sfl_api_url}")
-        
-        headers = {}
-        if config.SFL_API_KEY:
-            headers['x-api-key'] = config.SFL_API_KEY
-        
-        response = requests.get(sfl_api_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        main_data = response.json().get('farm')
-
-        if not main_data:
-            return None, None, "Não foi possível obter os dados da fazenda da API principal."
-
-        # Etapa 2: Buscar dados da API secundária (nossa 'farm_data_slave')
-        # Esta fonte contém 'level', 'experience' e dados de expansão detalhados.
-        secondary_data, world_api_error = get_sfl_world_data(farm_id, 'land')
+        if config.SFL_CONCURRENT_FETCH:
+            # Modo simultâneo: as duas APIs são consultadas ao mesmo tempo, de modo que
+            # a latência total passa a ser a da mais lenta, e não a soma das duas.
+            # Só a sfl.world vai para o pool; a API principal corre nesta thread.
+            secondary_future = _FETCH_EXECUTOR.submit(_timed_call, get_sfl_world_data, farm_id, 'land')
+
+            main_data, main_elapsed = _timed_call(_fetch_main_farm_data, farm_id)
+            _record_timing("sunflower_land", main_elapsed)
+            if not main_data:
+                return None, None, "Não foi possível obter os dados da fazenda da API principal."
+
+            (secondary_data, world_api_error), secondary_elapsed = secondary_future.result()
+            _record_timing("sfl_world_land", secondary_elapsed)
+        else:
+            # Etapa 1: Buscar dados da API principal (nossa 'farm_data_main')
+            # Esta fonte é a mais completa e contém as 'milestones'.
+            main_data, main_elapsed = _timed_call(_fetch_main_farm_data, farm_id)
+            _record_timing("sunflower_land", main_elapsed)
+
+            if not main_data:
+                return None, None, "Não foi possível obter os dados da fazenda da API principal."
+
+            # Etapa 2: Buscar dados da API secundária (nossa 'farm_data_slave')
+            # Esta fonte contém 'level', 'experience' e dados de expansão detalhados.
+            (secondary_data, world_api_error), secondary_elapsed = _timed_call(get_sfl_world_data, farm_id, 'land')
+            _record_timing("sfl_world_land", secondary_elapsed)
 
         if world_api_error:
             log.warning("A API secundária (sfl.world) falhou para a fazenda %s: %s.", farm_id, world_api_error)
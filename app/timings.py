@@ -0,0 +1,188 @@
+# app/timings.py
+"""
+Medição leve do tempo de cada etapa de um pedido (passos de análise, chamadas às
+APIs de origem, consultas ao cache e renderização).
+
+- Cada pedido tem o seu `RequestTimings` em `flask.g`, criado em `before_request`.
+- As medições são enviadas no cabeçalho `Server-Timing` (visível nas ferramentas
+  de desenvolvimento do navegador) e os pedidos medidos ficam num buffer circular
+  por worker, de onde `/internal/timings` calcula os percentis p50/p95/p99.
+- Para cada etapa guarda-se o tempo real (wall) e o tempo de CPU da thread que a
+  executou; uma etapa com muito wall e pouco CPU está à espera de I/O ou do GIL.
+
+Os passos do painel correm noutras threads (ver dashboard_pipeline), onde `flask.g`
+não é o do pedido: aí o `RequestTimings` é obtido com `current()` na thread do
+pedido e passado explicitamente.
+
+Nas respostas em streaming (ver `finish_on_close`) os cabeçalhos saem antes de os
+passos correrem: não há `Server-Timing` e o pedido só entra no buffer circular (e
+em `/internal/timings`) quando a resposta termina de ser enviada.
+"""
+import logging
+import math
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from flask import g, has_app_context, request
+
+import config
+
+log = logging.getLogger(__name__)
+
+# Um nome de métrica do Server-Timing tem de ser um "token" HTTP.
+_INVALID_TOKEN_CHARS = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+_recent_renders = deque(maxlen=config.TIMINGS_RING_SIZE)
+_recent_lock = threading.Lock()
+
+
+class RequestTimings:
+    """Medições de um pedido: nome da etapa -> (wall, cpu) em segundos."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        # Verdadeiro nas respostas em streaming (ver `finish_on_close`).
+        self.deferred = False
+        self._start = time.perf_counter()
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, wall: float, cpu: float | None = None) -> None:
+        # Uma etapa repetida no mesmo pedido acumula (ex: várias consultas ao cache).
+        with self._lock:
+            previous_wall, previous_cpu = self._entries.get(name, (0.0, None))
+            if cpu is not None and previous_cpu is not None:
+                cpu += previous_cpu
+            self._entries[name] = (previous_wall + wall, cpu if cpu is not None else previous_cpu)
+
+    @contextmanager
+    def measure(self, name: str):
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start_wall, time.thread_time() - start_cpu)
+
+    def entries(self) -> dict:
+        with self._lock:
+            return dict(self._entries)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def server_timing_header(self, total: float) -> str:
+        parts = []
+        for name, (wall, cpu) in self.entries().items():
+            part = f"{_INVALID_TOKEN_CHARS.sub('_', name)};dur={wall * 1000:.1f}"
+            if cpu is not None:
+                part += f';desc="cpu {cpu * 1000:.1f}ms"'
+            parts.append(part)
+        parts.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(parts)
+
+
+def current() -> RequestTimings | None:
+    """O `RequestTimings` do pedido atual, ou None fora de um pedido (ou com as medições desativadas)."""
+    if not has_app_context():
+        return None
+    return g.get("request_timings")
+
+
+@contextmanager
+def measure(name: str):
+    """Mede o bloco e regista-o no pedido atual (não faz nada fora de um pedido)."""
+    recorder = current()
+    if recorder is None:
+        yield
+        return
+    with recorder.measure(name):
+        yield
+
+
+def finish_on_close(response) -> None:
+    """
+    Adia o registo do pedido atual para quando `response` (em streaming) terminar
+    de ser enviada, sem cabeçalho `Server-Timing`. As threads que medem etapas do
+    pedido devem receber o `RequestTimings` de `current()`.
+    """
+    recorder = current()
+    if recorder is None:
+        return
+    recorder.deferred = True
+    endpoint, path = request.endpoint, request.path
+    response.call_on_close(lambda: _record_render(endpoint, path, recorder, recorder.elapsed()))
+
+
+def _record_render(endpoint: str, path: str, recorder: RequestTimings, total: float) -> None:
+    entries = recorder.entries()
+    if not entries:
+        # Só os pedidos instrumentados (ex: o painel) são reportados.
+        return
+    with _recent_lock:
+        _recent_renders.append({
+            "endpoint": endpoint,
+            "path": path,
+            "started_at": recorder.started_at,
+            "total": total,
+            "timings": entries,
+        })
+
+
+def recent_renders() -> list:
+    with _recent_lock:
+        return list(_recent_renders)
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    # Método "nearest-rank": o valor na posição ceil(fraction * n).
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def summarize(renders: list) -> dict:
+    """Percentis (em milissegundos) do tempo real e de CPU de cada etapa dos pedidos dados."""
+    samples = {}
+    for render in renders:
+        for name, (wall, cpu) in render["timings"].items():
+            samples.setdefault(name, ([], []))
+            samples[name][0].append(wall)
+            if cpu is not None:
+                samples[name][1].append(cpu)
+        samples.setdefault("total", ([], []))[0].append(render["total"])
+
+    summary = {}
+    for name, (walls, cpus) in samples.items():
+        stats = {"count": len(walls)}
+        for label, values in (("wall_ms", walls), ("cpu_ms", cpus)):
+            if not values:
+                continue
+            values = sorted(values)
+            stats[label] = {
+                f"p{int(q * 100)}": round(_percentile(values, q) * 1000, 2)
+                for q in (0.5, 0.95, 0.99)
+            }
+        summary[name] = stats
+    return summary
+
+
+def init_app(app) -> None:
+    """Regista os hooks que criam as medições de cada pedido e emitem o `Server-Timing`."""
+    if not config.TIMINGS_ENABLED:
+        return
+
+    @app.before_request
+    def _start_request_timings():
+        g.request_timings = RequestTimings()
+
+    @app.after_request
+    def _finish_request_timings(response):
+        recorder = g.pop("request_timings", None)
+        if recorder is None or recorder.deferred or not recorder.entries():
+            return response
+
+        total = recorder.elapsed()
+        response.headers["Server-Timing"] = recorder.server_timing_header(total)
+        _record_render(request.endpoint, request.path, recorder, total)
+        return response
@@ -7,6 +7,82 @@ load_dotenv()
 APP_VERSION = "0.1.0"
 FORCE_EVENT = "sunshower" # Nome do evento. Deixe como None para desativar.
 
+# Busca a API principal e a sfl.world em simultâneo no carregamento de uma fazenda.
+# Defina SFL_CONCURRENT_FETCH=false no .env para voltar ao modo sequencial.
+SFL_CONCURRENT_FETCH = os.getenv("SFL_CONCURRENT_FETCH", "true").lower() != "false"
+SFL_FETCH_MAX_WORKERS = int(os.getenv("SFL_FETCH_MAX_WORKERS", "8"))  # Buscas simultâneas à sfl.world por worker
+
+# Pool de ligações HTTP partilhado por worker para as APIs de origem (ver app/http_client.py).
+SFL_HTTP_POOL_CONNECTIONS = int(os.getenv("SFL_HTTP_POOL_CONNECTIONS", "4"))  # Hosts distintos mantidos em cache
+SFL_HTTP_POOL_SIZE = int(os.getenv("SFL_HTTP_POOL_SIZE", "10"))  # Ligações keep-alive por host
+SFL_HTTP_MAX_RETRIES = int(os.getenv("SFL_HTTP_MAX_RETRIES", "2"))
+SFL_HTTP_BACKOFF_FACTOR = float(os.getenv("SFL_HTTP_BACKOFF_FACTOR", "0.5"))
+
+# Limite (bytes) do nível de cache em memória de cada worker, à frente do cache em disco.
+CACHE_MEMORY_MAX_BYTES = int(os.getenv("CACHE_MEMORY_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Locks de ficheiro do single-flight entre workers (ver app/cache.py): um conjunto fixo de
+# SINGLE_FLIGHT_LOCK_FILES ficheiros em SINGLE_FLIGHT_LOCK_DIR, partilhado pelos workers.
+SINGLE_FLIGHT_LOCK_DIR = os.getenv("SINGLE_FLIGHT_LOCK_DIR", "cache_locks")
+SINGLE_FLIGHT_LOCK_FILES = int(os.getenv("SINGLE_FLIGHT_LOCK_FILES", "64"))
+
+# Cache das análises do painel. O intervalo (segundos) limita a idade de valores
+# que dependem da hora atual, como contagens decrescentes já formatadas.
+ANALYSIS_CACHE_ENABLED = os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() != "false"
+ANALYSIS_CACHE_BUCKET_SECONDS = int(os.getenv("ANALYSIS_CACHE_BUCKET_SECONDS", "60"))
+
+# Execução paralela dos passos de análise do painel (ver app/dashboard_pipeline.py).
+# Com DASHBOARD_MAX_WORKERS=1 os passos correm em sequência, sem pool de threads.
+DASHBOARD_MAX_WORKERS = int(os.getenv("DASHBOARD_MAX_WORKERS", "4"))
+DASHBOARD_STEP_TIMEOUT = float(os.getenv("DASHBOARD_STEP_TIMEOUT", "10"))  # Segundos por passo
+
+# Com DASHBOARD_LAZY_PANELS=true, /farm/<id> devolve logo a estrutura da página e cada
+# painel é carregado pelo navegador a partir de /farm/<id>/panel/<nome>.
+DASHBOARD_LAZY_PANELS = os.getenv("DASHBOARD_LAZY_PANELS", "false").lower() == "true"
+# Com DASHBOARD_STREAMING=true, /farm/<id> é enviado por partes: o cabeçalho primeiro e
+# cada painel assim que as suas análises terminam (ignorado se DASHBOARD_LAZY_PANELS=true).
+DASHBOARD_STREAMING = os.getenv("DASHBOARD_STREAMING", "false").lower() == "true"
+
+# Medição do tempo de cada etapa do painel: cabeçalho Server-Timing e /internal/timings (ver app/timings.py).
+TIMINGS_ENABLED = os.getenv("TIMINGS_ENABLED", "true").lower() != "false"
+TIMINGS_RING_SIZE = int(os.getenv("TIMINGS_RING_SIZE", "200"))  # Pedidos recentes guardados por worker
+# Se definido, os endpoints /internal/* e /metrics exigem este valor no cabeçalho X-Internal-Token;
+# sem ele, só respondem a pedidos diretos de 127.0.0.1/::1.
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+# Métricas no formato do Prometheus em /metrics (ver app/metrics.py). Cada worker grava
+# os seus valores em METRICS_DIR, que deve ser partilhado pelos workers (o gunicorn limpa-o ao arrancar).
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() != "false"
+METRICS_DIR = os.getenv("METRICS_DIR", "metrics_dir")
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+
+# Manifesto dos personagens animados (ver app/services/animation_service.py). Em desenvolvimento,
+# ANIMATION_MANIFEST_WATCH=true refaz o manifesto quando as pastas de imagens mudam.
+ANIMATION_MANIFEST_WATCH = os.getenv("ANIMATION_MANIFEST_WATCH", "false").lower() == "true"
+ANIMATION_MANIFEST_CHECK_SECONDS = float(os.getenv("ANIMATION_MANIFEST_CHECK_SECONDS", "2"))
+
+# Ficheiros estáticos com impressão digital (ver app/static_assets.py). O manifesto é gerado
+# por `flask --app run build-static`; sem ele, os URLs e o cache dos ficheiros não mudam.
+STATIC_FINGERPRINTING_ENABLED = os.getenv("STATIC_FINGERPRINTING_ENABLED", "true").lower() != "false"
+STATIC_MANIFEST_FILE = os.getenv("STATIC_MANIFEST_FILE", "asset-manifest.json")
+STATIC_IMMUTABLE_MAX_AGE = int(os.getenv("STATIC_IMMUTABLE_MAX_AGE", str(365 * 24 * 3600)))
+
+# Snapshot compilado dos módulos de app/domain (ver app/domain/snapshot.py), gerado com
+# `flask --app run build-domain-snapshot`. Se faltar ou estiver desatualizado, os módulos são importados do código.
+DOMAIN_SNAPSHOT_ENABLED = os.getenv("DOMAIN_SNAPSHOT_ENABLED", "true").lower() != "false"
+# Orçamento (ms) do arranque a frio medido por `flask --app run check-importtime`.
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1000"))
+
+# Perfil de produção do gunicorn (gunicorn.conf.py). Com GUNICORN_PRELOAD=true a aplicação e as
+# tabelas de domínio são carregadas uma vez no processo principal e partilhadas pelos workers;
+# GUNICORN_GC_FREEZE=true congela esses objetos no GC antes do fork (ver app/startup.py).
+GUNICORN_PRELOAD = os.getenv("GUNICORN_PRELOAD", "true").lower() != "false"
+GUNICORN_GC_FREEZE = os.getenv("GUNICORN_GC_FREEZE", "true").lower() != "false"
+
+# Idade máxima (segundos) dos preços e cotações servidos enquanto são atualizados em segundo plano.
+PRICES_MAX_STALENESS = int(os.getenv("PRICES_MAX_STALENESS", "3600"))
+EXCHANGE_MAX_STALENESS = int(os.getenv("EXCHANGE_MAX_STALENESS", "3600"))
+
 # Carrega a chave da API do Sunflower Land a partir de uma variável de ambiente.
 SFL_API_KEY = os.getenv("SFL_API_KEY")
 
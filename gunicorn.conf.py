@@ -0,0 +1,55 @@
+# gunicorn.conf.py
+# Perfil de produção: `gunicorn` (sem argumentos) na raiz do projeto lê este ficheiro.
+# O número de workers vem de WEB_CONCURRENCY e o endereço de PORT/GUNICORN_CMD_ARGS,
+# como habitual no gunicorn.
+#
+# Com GUNICORN_PRELOAD=true, `run:app` é importado no processo principal: os módulos de
+# domínio, o estado do jogo e os manifestos são construídos uma única vez e herdados
+# pelos workers no fork. Para que essas páginas continuem partilhadas, o GC fica
+# desligado no processo principal (evita buracos nas páginas), os objetos vivos são
+# congelados antes do fork (as coleções dos workers não lhes tocam) e o GC volta a
+# ser ligado em cada worker. Ver app/startup.py e /internal/memory.
+import gc
+import os
+
+# Só os valores: o gunicorn trata os nomes deste ficheiro como definições (e `config` é uma delas).
+from config import GUNICORN_GC_FREEZE, GUNICORN_PRELOAD
+
+wsgi_app = "run:app"
+preload_app = GUNICORN_PRELOAD
+
+if preload_app and GUNICORN_GC_FREEZE:
+    gc.disable()
+
+
+def on_starting(server):
+    # Os contadores do Prometheus recomeçam com o serviço: apaga os ficheiros de métricas
+    # dos workers da execução anterior (ver app/metrics.py).
+    from app import metrics
+
+    metrics.clear_dir()
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    from app import startup
+
+    os.environ[startup.MASTER_PID_ENV] = str(os.getpid())
+    startup.preload()
+    if GUNICORN_GC_FREEZE:
+        startup.freeze_for_fork()
+    memory = startup.process_memory(os.getpid())
+    if memory is not None:
+        server.log.info(f"Processo principal pronto: RSS {memory['rss_kb'] / 1024:.1f} MB.")
+
+
+def pre_fork(server, worker):
+    if preload_app and GUNICORN_GC_FREEZE:
+        # Objetos criados pelo processo principal desde o último fork (ex: ao repor um worker).
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    if preload_app and GUNICORN_GC_FREEZE:
+        gc.enable()
@@ -1,6 +1,7 @@
 interface AnimatedCharacter {
     type: string;
     name: string;
+    hash?: string;
 }
 
 let idleTimer: number;
@@ -12,7 +13,9 @@ let lastMousePosition = { x: 0, y: 0 };
  */
 async function fetchAnimatedCharacters(): Promise<AnimatedCharacter[]> {
     try {
-        const response = await fetch('/api/animated-characters');
+        // O URL com a versão do manifesto pode ficar em cache no navegador.
+        const url = document.body.dataset.animatedCharactersUrl || '/api/animated-characters';
+        const response = await fetch(url);
         if (!response.ok) {
             console.error('Falha ao buscar personagens animados:', response.statusText);
             return [];
@@ -43,7 +46,8 @@ function spawnRandomCharacter(container: Element, characters: AnimatedCharacter[
     const walker = document.createElement('div');
     const characterImage = document.createElement('img');
 
-    const imageUrl = `/static/images/${randomCharacter.type}/${randomCharacter.name}`;
+    const version = randomCharacter.hash ? `?v=${randomCharacter.hash}` : '';
+    const imageUrl = `/static/images/${randomCharacter.type}/${randomCharacter.name}${version}`;
     
     characterImage.src = imageUrl;
     characterImage.alt = `Animated character: ${randomCharacter.name.split('.')[0]}`;
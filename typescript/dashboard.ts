@@ -442,6 +442,36 @@ function setupAllProgressBars() {
     });
 }
 
+/**
+ * Carrega os painéis que a página trouxe apenas como marcadores (`.lazy-panel`,
+ * com DASHBOARD_LAZY_PANELS ativo). Todos os pedidos partem ao mesmo tempo e cada
+ * painel é inserido assim que chega; a promessa só termina quando todos chegaram,
+ * para que as inicializações seguintes encontrem os elementos dos painéis. No fim
+ * dispara `dashboardPanelsLoaded` para os outros scripts (ex: summary_card).
+ */
+async function loadLazyPanels(): Promise<void> {
+    const placeholders = Array.from(document.querySelectorAll<HTMLElement>('.lazy-panel[data-panel-url]'));
+
+    await Promise.all(placeholders.map(async (placeholder) => {
+        const url = placeholder.dataset.panelUrl;
+        if (!url) return;
+        try {
+            const response = await fetch(url);
+            const html = await response.text();
+
+            // Ao contrário de innerHTML, createContextualFragment executa os scripts do painel.
+            placeholder.replaceWith(document.createRange().createContextualFragment(html));
+        } catch (error) {
+            console.error(`Erro ao carregar o painel ${url}:`, error);
+            placeholder.innerHTML = '<div class="alert alert-danger m-3" role="alert">Não foi possível carregar este painel.</div>';
+        }
+    }));
+
+    if (placeholders.length > 0) {
+        document.dispatchEvent(new CustomEvent('dashboardPanelsLoaded'));
+    }
+}
+
 /**
  * Ponto de entrada principal do script.
  * Executa quando todo o conteúdo HTML da página foi carregado.
@@ -451,6 +481,9 @@ document.addEventListener('DOMContentLoaded', async () => {
     // A inicialização da moeda agora é assíncrona e tratada separadamente.
     initializeCurrencyFeatures();
 
+    // Painéis carregados em separado: as inicializações abaixo dependem dos seus elementos.
+    await loadLazyPanels();
+
     setupGoalForm();
     setupMilestoneInteraction();
     setupExpansionCountdown();
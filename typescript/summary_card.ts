@@ -82,7 +82,7 @@ let sflPrices: SflPrices = {};
 let islandType: string = 'basic';
 let isVip: boolean = false;
 
-document.addEventListener('DOMContentLoaded', () => {
+function initSummaryCard() {
     // Carrega os preços do data-attribute do body.
     const pricesData = document.body.dataset.sflPrices;
     if (pricesData) {
@@ -108,6 +108,15 @@ document.addEventListener('DOMContentLoaded', () => {
 
     setupSummaryCardFilterLogic();
     setupSummaryCardInteractivity();
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    // Com painéis carregados em separado, espera que o dashboard.js os insira.
+    if (document.querySelector('.lazy-panel')) {
+        document.addEventListener('dashboardPanelsLoaded', initSummaryCard, { once: true });
+    } else {
+        initSummaryCard();
+    }
 });
 
 /**